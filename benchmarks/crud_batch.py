@@ -0,0 +1,149 @@
+"""
+Batch CRUD operations against the same work done row by row.
+
+Each operation handles the same APOD rows with single-row calls and with one batch call:
+inserting them (get_or_create against bulk_upsert), reading them by date (get against get_many)
+and saving their file_ids (update_where against bulk_update). The database is in-memory SQLite,
+so the numbers show the per-statement overhead without network round trips.
+
+Usage:
+    python -m benchmarks.crud_batch --rows 1000 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any, cast
+
+from tortoise import Tortoise
+
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.read_models import ApodRecord
+from database.postgres.core.tortoise_config import TORTOISE_ORM
+from utils.enums.read_model import ReadModel
+
+apod_crud = ApodCrud()
+
+
+def get_rows(start_date: date, rows: int) -> list[dict[str, Any]]:
+    """
+    Build APOD rows with consecutive dates.
+
+    Args:
+        start_date (date): Date of the first row.
+        rows (int): Number of rows.
+
+    Returns:
+        list[dict[str, Any]]: Field values of the rows.
+    """
+    return [
+        {
+            "date": start_date + timedelta(days=day),
+            "title": f"Title {day}",
+            "explanation": "Explanation " * 50,
+            "url": f"https://apod.nasa.gov/apod/image/{day}.jpg",
+            "media_type": "image",
+        }
+        for day in range(rows)
+    ]
+
+
+async def measure(operation: Callable[[], Awaitable[Any]]) -> float:
+    """
+    Time one run of the operation.
+
+    Args:
+        operation (Callable[[], Awaitable[Any]]): Operation to run.
+
+    Returns:
+        float: Seconds spent.
+    """
+    started = time.perf_counter()
+    await operation()
+    return time.perf_counter() - started
+
+
+async def run(rows: list[dict[str, Any]], batch_size: int, batched: bool) -> dict[str, float]:
+    """
+    Insert, read and update the rows either row by row or in batches.
+
+    Args:
+        rows (list[dict[str, Any]]): Field values of the rows to insert.
+        batch_size (int): Maximum number of rows per batch statement.
+        batched (bool): Use the batch methods instead of single-row calls.
+
+    Returns:
+        dict[str, float]: Seconds spent on each operation.
+    """
+    dates = [row["date"] for row in rows]
+    records: list[ApodRecord] = []
+
+    async def upsert() -> None:
+        if batched:
+            await apod_crud.bulk_upsert(rows, ["date"], ["title", "explanation"], batch_size=batch_size)
+            return
+
+        for row in rows:
+            await apod_crud.get_or_create(read_model=ReadModel.RECORD, **row)
+
+    async def read() -> None:
+        if batched:
+            records.extend(
+                cast(
+                    list[ApodRecord],
+                    await apod_crud.get_many(date=dates, read_model=ReadModel.RECORD, batch_size=batch_size),
+                )
+            )
+            return
+
+        for apod_date in dates:
+            records.append(cast(ApodRecord, await apod_crud.get(date=apod_date, read_model=ReadModel.RECORD)))
+
+    async def update() -> None:
+        if batched:
+            await apod_crud.bulk_update(
+                [{"id": record.id, "file_id": f"file {record.id}"} for record in records],
+                ["file_id"],
+                batch_size=batch_size,
+            )
+            return
+
+        for record in records:
+            await apod_crud.update_where(filters={"id": record.id}, file_id=f"file {record.id}")
+
+    return {"upsert": await measure(upsert), "read": await measure(read), "update": await measure(update)}
+
+
+async def main(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark in both modes and print the results.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    config: dict[str, Any] = {**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+
+    try:
+        single = await run(get_rows(date(1995, 6, 16), args.rows), args.batch_size, batched=False)
+        batch = await run(get_rows(date(2005, 6, 16), args.rows), args.batch_size, batched=True)
+
+        print(f"{'operation':<12}{'rows':>8}{'single s':>12}{'batch s':>12}{'speedup':>10}")
+
+        for operation, single_time in single.items():
+            batch_time = batch[operation]
+            print(
+                f"{operation:<12}{args.rows:>8}{single_time:>12.3f}{batch_time:>12.3f}{single_time / batch_time:>10.1f}"
+            )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
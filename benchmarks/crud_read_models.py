@@ -0,0 +1,135 @@
+"""
+Cost of reading an APOD row through BaseCrud in each read model.
+
+Every call looks up an APOD by date, like the APOD window does on each update,
+and returns it as a pydantic schema, a slotted dataclass record or a plain dict.
+The conversion of an already fetched row is timed separately, since on in-memory SQLite
+the query itself takes most of a full call.
+
+Usage:
+    python -m benchmarks.crud_read_models --rows 1000 --calls 2000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from tortoise import Tortoise
+
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.tortoise_config import TORTOISE_ORM
+from database.postgres.models.apod import ApodModel
+from utils.enums.read_model import ReadModel
+
+
+async def fill(rows: int) -> list[date]:
+    """
+    Insert APOD rows with consecutive dates.
+
+    Args:
+        rows (int): Number of rows.
+
+    Returns:
+        list[date]: Dates of the inserted rows.
+    """
+    dates = [date(2000, 1, 1) + timedelta(days=day) for day in range(rows)]
+    await ApodCrud().bulk_create(
+        [
+            {
+                "date": apod_date,
+                "title": f"Title {apod_date}",
+                "title_ru": f"Заголовок {apod_date}",
+                "explanation": "Explanation " * 50,
+                "explanation_ru": "Пояснение " * 50,
+                "url": f"https://apod.nasa.gov/apod/image/{apod_date:%y%m%d}.jpg",
+                "media_type": "image",
+            }
+            for apod_date in dates
+        ]
+    )
+
+    return dates
+
+
+async def run_get(dates: list[date], calls: int, read_model: ReadModel) -> float:
+    """
+    Read APODs by date in the given read model.
+
+    Args:
+        dates (list[date]): Dates to look up in turn.
+        calls (int): Number of lookups.
+        read_model (ReadModel): Shape of the results.
+
+    Returns:
+        float: Microseconds per call.
+    """
+    apod_crud = ApodCrud()
+    started = time.perf_counter()
+
+    for call in range(calls):
+        apod: Any = await apod_crud.get(date=dates[call % len(dates)], read_model=read_model)
+        assert apod is not None
+
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+async def run_convert(calls: int, read_model: ReadModel) -> float:
+    """
+    Convert an already fetched APOD to the given read model.
+
+    Args:
+        calls (int): Number of conversions.
+        read_model (ReadModel): Shape of the results.
+
+    Returns:
+        float: Microseconds per conversion.
+    """
+    apod_crud = ApodCrud()
+    apod = await ApodModel.first()
+    assert apod is not None
+    started = time.perf_counter()
+
+    for _ in range(calls):
+        await apod_crud._to_read_model(apod, read_model)
+
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+async def main(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark for every read model and print the results.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    config: dict[str, Any] = {**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+
+    try:
+        dates = await fill(args.rows)
+        await run_get(dates, min(args.calls, 100), ReadModel.SCHEMA)
+        results = {
+            read_model: (await run_get(dates, args.calls, read_model), await run_convert(args.calls, read_model))
+            for read_model in ReadModel
+        }
+        get_baseline, convert_baseline = results[ReadModel.SCHEMA]
+
+        print(f"{'read model':<12}{'get us':>10}{'speedup':>10}{'convert us':>12}{'speedup':>10}")
+
+        for read_model, (get_time, convert_time) in results.items():
+            print(
+                f"{read_model:<12}{get_time:>10.1f}{get_baseline / get_time:>10.2f}"
+                f"{convert_time:>12.1f}{convert_baseline / convert_time:>10.2f}"
+            )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
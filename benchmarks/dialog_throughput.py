@@ -0,0 +1,178 @@
+"""
+Throughput of APOD caption rendering with updates handled serially and in parallel.
+
+Every update gets its dialog manager from CustomDialogManager, waits for its window data
+and sends a captioned APOD photo through the message manager, like the APOD window does.
+Telegram is replaced by a session answering after a fixed latency, the database by in-memory SQLite.
+Captions formatted in a locale other than the language of their update are counted as errors.
+
+Usage:
+    python -m benchmarks.dialog_throughput --updates 500 --latency 0.05 --getter-latency 0.01
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from datetime import date, datetime
+from typing import Any, cast
+
+from aiogram import Bot, Router
+from aiogram.client.session.base import BaseSession
+from aiogram.enums import ContentType
+from aiogram.methods import SendPhoto, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import Chat, Message, PhotoSize
+from aiogram_dialog.api.entities import ChatEvent, MediaAttachment, NewMessage
+from aiogram_dialog.api.protocols import DialogRegistryProtocol
+from aiogram_dialog.context.media_storage import MediaIdStorage
+from babel.dates import format_date
+from tortoise import Tortoise
+
+from config import app_settings
+from database.postgres.core.tortoise_config import TORTOISE_ORM
+from utils.custom_dialog_manager import CustomDialogManager
+from utils.custom_message_manager import CustomMessageManager
+
+LANGUAGES = ("en", "ru")
+APOD_DATE = date(2025, 5, 5)
+
+
+class LatencySession(BaseSession):
+    """
+    Bot session answering every request after a fixed delay and recording sent captions.
+    """
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+        self.captions: dict[int, str | None] = {}
+
+    async def close(self) -> None:
+        pass
+
+    async def make_request(
+        self, bot: Bot, method: TelegramMethod[TelegramType], timeout: int | None = None
+    ) -> TelegramType:
+        assert isinstance(method, SendPhoto)
+        await asyncio.sleep(self.latency)
+
+        chat_id = cast(int, method.chat_id)
+        self.captions[chat_id] = method.caption
+
+        return cast(
+            TelegramType,
+            Message(
+                message_id=1,
+                date=datetime.now(),
+                chat=Chat(id=chat_id, type="private"),
+                photo=[PhotoSize(file_id=f"file-{chat_id}", file_unique_id=str(chat_id), width=1, height=1)],
+            ),
+        )
+
+    async def stream_content(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True,
+    ) -> AsyncGenerator[bytes, None]:
+        yield b""
+
+
+async def handle_update(
+    factory: CustomDialogManager, bot: Bot, chat_id: int, language_code: str, getter_latency: float
+) -> None:
+    """
+    Render a captioned APOD photo for a single update.
+
+    Args:
+        factory (CustomDialogManager): Dialog manager factory shared by all updates.
+        bot (Bot): Bot with the latency session.
+        chat_id (int): Chat of the update.
+        language_code (str): Language of the update's user.
+        getter_latency (float): Time spent loading the window data in seconds.
+    """
+    manager = factory(
+        cast(ChatEvent, None),
+        {"language_code": language_code},
+        cast(DialogRegistryProtocol, None),
+        Router(),
+    )
+    await asyncio.sleep(getter_latency)
+    await manager.message_manager.send_media(  # type: ignore[attr-defined]
+        bot,
+        NewMessage(
+            chat=Chat(id=chat_id, type="private"),
+            text=APOD_DATE.strftime("%Y-%m-%d"),
+            media=MediaAttachment(ContentType.PHOTO, url="https://apod.nasa.gov/fake.jpg"),
+        ),
+    )
+
+
+async def run(updates: int, latency: float, getter_latency: float, parallel: bool) -> tuple[float, int]:
+    """
+    Handle the updates and measure the elapsed time.
+
+    Args:
+        updates (int): Number of updates.
+        latency (float): Telegram response delay in seconds.
+        getter_latency (float): Time spent loading the window data in seconds.
+        parallel (bool): Whether updates are handled concurrently.
+
+    Returns:
+        tuple[float, int]: Elapsed seconds and number of captions formatted in a wrong locale.
+    """
+    session = LatencySession(latency)
+    bot = Bot(app_settings.token, session=session)
+    factory = CustomDialogManager(CustomMessageManager(), MediaIdStorage())  # type: ignore[no-untyped-call]
+    jobs = [(chat_id, LANGUAGES[chat_id % len(LANGUAGES)]) for chat_id in range(1, updates + 1)]
+
+    started = time.perf_counter()
+
+    if parallel:
+        await asyncio.gather(
+            *(handle_update(factory, bot, chat_id, language_code, getter_latency) for chat_id, language_code in jobs)
+        )
+    else:
+        for chat_id, language_code in jobs:
+            await handle_update(factory, bot, chat_id, language_code, getter_latency)
+
+    elapsed = time.perf_counter() - started
+    errors = sum(
+        session.captions[chat_id] != format_date(APOD_DATE, format="long", locale=language_code)
+        for chat_id, language_code in jobs
+    )
+
+    return elapsed, errors
+
+
+async def main(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark in both modes and print the results.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    config: dict[str, Any] = {**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+
+    try:
+        print(f"{'mode':<10}{'updates':>10}{'seconds':>10}{'updates/s':>12}{'wrong locale':>14}")
+
+        for parallel in (False, True):
+            elapsed, errors = await run(args.updates, args.latency, args.getter_latency, parallel)
+            mode = "parallel" if parallel else "serial"
+            print(f"{mode:<10}{args.updates:>10}{elapsed:>10.2f}{args.updates / elapsed:>12.1f}{errors:>14}")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="Telegram response delay in seconds")
+    parser.add_argument("--getter-latency", type=float, default=0.01, help="Window data loading time in seconds")
+    asyncio.run(main(parser.parse_args()))
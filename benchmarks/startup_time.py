@@ -0,0 +1,143 @@
+"""
+Import and database initialization time of the bot on startup.
+
+Every run starts a fresh interpreter, imports main and initializes the database like on_startup does:
+either generating the schema as older versions did, or only checking the applied migration.
+The database is an already migrated SQLite file, which has no network round trips,
+so the gap between the modes is smaller than on Postgres.
+
+Usage:
+    python -m benchmarks.startup_time --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from tortoise import Tortoise
+
+MODES = ("generate", "check")
+
+
+def get_config(database: Path) -> dict[str, Any]:
+    """
+    Build the Tortoise config of the bot with the database replaced by a SQLite file.
+
+    Args:
+        database (Path): Path of the SQLite file.
+
+    Returns:
+        dict[str, Any]: Tortoise config.
+    """
+    from database.postgres.core.tortoise_config import TORTOISE_ORM
+
+    return {**TORTOISE_ORM, "connections": {"default": f"sqlite://{database}"}}
+
+
+async def prepare(database: Path) -> None:
+    """
+    Create the schema and record the latest migration as applied.
+
+    Args:
+        database (Path): Path of the SQLite file.
+    """
+    from aerich.models import Aerich
+
+    from database.postgres.core.schema_version import MIGRATIONS_APP, get_latest_migration
+
+    await Tortoise.init(config=get_config(database))
+    await Tortoise.generate_schemas()
+    await Aerich.create(version=get_latest_migration(), app=MIGRATIONS_APP, content={})
+    await Tortoise.close_connections()
+
+
+async def start(database: Path, mode: str) -> dict[str, float]:
+    """
+    Import the bot and initialize the database, as a child process.
+
+    Args:
+        database (Path): Path of the SQLite file.
+        mode (str): "generate" to generate the schema, "check" to check the applied migration.
+
+    Returns:
+        dict[str, float]: Seconds spent on the import and on the initialization.
+    """
+    started = time.perf_counter()
+    import main  # noqa: F401
+
+    imported = time.perf_counter()
+
+    from database.postgres.core.schema_version import check_schema_version
+
+    await Tortoise.init(config=get_config(database))
+
+    if mode == "generate":
+        await Tortoise.generate_schemas()
+    else:
+        await check_schema_version()
+
+    initialized = time.perf_counter()
+    await Tortoise.close_connections()
+
+    return {"import": imported - started, "init": initialized - imported}
+
+
+def run(database: Path, mode: str) -> dict[str, float]:
+    """
+    Measure one startup in a fresh interpreter.
+
+    Args:
+        database (Path): Path of the SQLite file.
+        mode (str): Initialization mode.
+
+    Returns:
+        dict[str, float]: Seconds spent on the import and on the initialization.
+    """
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_time", "--child", mode, "--database", str(database)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    result: dict[str, float] = json.loads(output.strip().splitlines()[-1])
+    return result
+
+
+def main(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark in both modes and print median timings.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    if args.child:
+        print(json.dumps(asyncio.run(start(args.database, args.child))))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory, "bot.sqlite3")
+        asyncio.run(prepare(database))
+
+        print(f"{'mode':<10}{'import ms':>12}{'init ms':>12}{'total ms':>12}")
+
+        for mode in MODES:
+            results = [run(database, mode) for _ in range(args.runs)]
+            imported = statistics.median(result["import"] for result in results) * 1000
+            initialized = statistics.median(result["init"] for result in results) * 1000
+            print(f"{mode:<10}{imported:>12.1f}{initialized:>12.1f}{imported + initialized:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=MODES, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, default=None, help=argparse.SUPPRESS)
+    main(parser.parse_args())
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+from datetime import date
+from pathlib import Path
+
+from aerich import Command
+from tortoise import Tortoise
+
+from config.api_settings import APOD_FIRST_DATE
+from config.log_config import logger
+from database.postgres.core import init_db
+from database.postgres.core.schema_version import MIGRATIONS_APP, MIGRATIONS_LOCATION
+from database.postgres.core.tortoise_config import TORTOISE_ORM
+from dialogs.apod.service.apod_archive_ingestor import ApodArchiveIngestor
+from dialogs.apod.service.explanation_pages import explanation_pages
+from utils.http_client import SessionRegistry
+
+
+async def ingest(args: argparse.Namespace) -> None:
+    """
+    Fill the APOD table from the NASA archive.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    await init_db()
+
+    try:
+        ingestor = ApodArchiveIngestor(
+            chunk_days=args.chunk_days,
+            request_delay=args.request_delay,
+            checkpoint_path=args.checkpoint,
+        )
+        inserted = await ingestor.run(start_date=args.start_date, end_date=args.end_date)
+        logger.warning(f"APOD archive ingestion finished: {inserted} new entries")
+    finally:
+        await SessionRegistry.close()
+        await Tortoise.close_connections()
+
+
+async def migrate(_args: argparse.Namespace) -> None:
+    """
+    Apply aerich migrations that are not applied to the database yet.
+
+    Args:
+        _args (argparse.Namespace): Parsed command line arguments (unused).
+    """
+    async with Command(tortoise_config=TORTOISE_ORM, app=MIGRATIONS_APP, location=str(MIGRATIONS_LOCATION)) as command:
+        migrated = await command.upgrade(run_in_transaction=True)
+
+    if migrated:
+        logger.warning(f"Applied migrations: {', '.join(migrated)}")
+    else:
+        logger.warning("Database schema is up to date")
+
+
+async def explanation_pages_command(args: argparse.Namespace) -> None:
+    """
+    Rewrite the static WebApp explanation pages of every stored APOD.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    await init_db()
+
+    try:
+        written = await explanation_pages.rebuild(batch_size=args.batch_size)
+        logger.warning(f"Explanation pages rebuilt for {written} APOD entries")
+    finally:
+        await Tortoise.close_connections()
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser with all maintenance commands.
+
+    Returns:
+        argparse.ArgumentParser: Configured parser.
+    """
+    parser = argparse.ArgumentParser(description="NASA bot maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Fill the APOD table from the NASA archive")
+    ingest_parser.add_argument("--start-date", type=date.fromisoformat, default=APOD_FIRST_DATE)
+    ingest_parser.add_argument("--end-date", type=date.fromisoformat, default=None)
+    ingest_parser.add_argument("--chunk-days", type=int, default=30)
+    ingest_parser.add_argument("--request-delay", type=float, default=1.0, help="Seconds between NASA API requests")
+    ingest_parser.add_argument("--checkpoint", type=Path, default=None, help="Path of the resume checkpoint file")
+    ingest_parser.set_defaults(handler=ingest)
+
+    migrate_parser = commands.add_parser("migrate", help="Apply pending database migrations")
+    migrate_parser.set_defaults(handler=migrate)
+
+    pages_parser = commands.add_parser("explanation-pages", help="Rebuild static WebApp explanation pages")
+    pages_parser.add_argument("--batch-size", type=int, default=None, help="APOD entries loaded at once")
+    pages_parser.set_defaults(handler=explanation_pages_command)
+
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = get_parser().parse_args()
+    asyncio.run(arguments.handler(arguments))
@@ -1,8 +1,14 @@
 from dataclasses import dataclass
+from datetime import date
 from typing import Any
+from zoneinfo import ZoneInfo
 
 from yarl import URL
 
+# Date of the first APOD and the timezone NASA publishes new pictures in
+APOD_FIRST_DATE = date(1995, 6, 16)
+APOD_TIMEZONE = ZoneInfo("America/New_York")
+
 
 @dataclass
 class APISettings:
@@ -7,6 +7,7 @@ from yarl import URL
 
 from config.api_settings import APISettings
 from config.database_settings import DatabaseSettings
+from config.http_client_settings import HttpClientSettings
 from config.logs_settings import LogsSettings
 
 SOURCE_PATH = Path(__file__).parent.parent
@@ -28,24 +29,71 @@ class AppSettings:
         resources_path (str): Path to static resources.
         temp_resources_path (str): Path to temporary resources.
         suppress_download_logs (bool): Suppress downloader logs if True.
+        video_download_workers (int): Number of videos downloaded and converted concurrently.
+        video_download_timeout (float): Seconds to wait for a single video download.
+        video_size_budget (int): Size in bytes that transcoded videos aim to fit into.
+        video_cache_path (str): Path to the cache of downloaded videos, relative to the resources.
+        video_cache_max_bytes (int): Size of the video cache above which the least recently used videos are evicted.
         web_app_url (str): Public URL of the deployed WebApp.
         enable_translation (bool): Whether translation features are enabled.
+        enable_distributed_locks (bool): Whether cross-process Redis locks are used.
+        translation_cache_size (int): Number of translations kept in the in-process cache.
+        random_uploaded_ratio (float): Share of random pictures picked among dates with already uploaded media.
+        random_min_coverage (float): Share of the archive the stored dates must cover before random pictures are
+            picked among them instead of requested from NASA.
+        enable_prefetch (bool): Whether the daily APOD is prefetched in the background.
+        prefetch_poll_interval (float): Seconds between checks for a new APOD while it is not published yet.
+        storage_chat_id (int | None): Chat where prefetched media is uploaded to obtain its file_id.
+        user_activity_flush_interval (float): Seconds between writes of buffered user activity to the database.
+        enable_progressive_rendering (bool): Whether APOD captions are shown before their video is downloaded.
+        media_failure_ttl (float): Seconds before media that failed to download is tried again for the first time.
+        media_failure_max_ttl (float): Longest wait in seconds between tries of media that keeps failing.
+        explanation_cache_size (int): Number of WebApp explanation responses kept in the in-process cache.
+        explanation_max_age (int): Seconds browsers and CDNs may cache a complete WebApp explanation.
+        enable_explanation_pages (bool): Whether WebApp explanations are also written and served as static files.
+        explanation_pages_path (str): Path to the static WebApp explanations, relative to the resources.
+        search_page_size (int): Number of APODs shown per page of search results.
+        monitoring_token (str | None): Bearer token of the monitoring endpoints, which are disabled if it is not set.
 
         logs (LogsSettings): Logging configuration.
         db (DatabaseSettings): Database connection settings.
         api (APISettings): External API configuration.
+        http (HttpClientSettings): Shared HTTP client session settings.
     """
 
     token: str
     resources_path: str
     temp_resources_path: str
     suppress_download_logs: bool
+    video_download_workers: int
+    video_download_timeout: float
+    video_size_budget: int
+    video_cache_path: str
+    video_cache_max_bytes: int
     web_app_url: str
     enable_translation: bool
+    enable_distributed_locks: bool
+    translation_cache_size: int
+    random_uploaded_ratio: float
+    random_min_coverage: float
+    enable_prefetch: bool
+    prefetch_poll_interval: float
+    storage_chat_id: int | None
+    user_activity_flush_interval: float
+    enable_progressive_rendering: bool
+    media_failure_ttl: float
+    media_failure_max_ttl: float
+    explanation_cache_size: int
+    explanation_max_age: int
+    enable_explanation_pages: bool
+    explanation_pages_path: str
+    search_page_size: int
+    monitoring_token: str | None
 
     logs: LogsSettings
     db: DatabaseSettings
     api: APISettings
+    http: HttpClientSettings
 
     def __post_init__(self) -> None:
         if not self.token:
@@ -89,6 +137,24 @@ class AppSettings:
 
         return Path(self.resources_path, self.temp_resources_path)
 
+    def get_full_video_cache_path(self) -> Path:
+        """
+        Get the full path to the video cache directory.
+
+        Returns:
+            Path: Combined path of resources and video cache folder.
+        """
+        return Path(self.resources_path, self.video_cache_path)
+
+    def get_full_explanation_pages_path(self) -> Path:
+        """
+        Get the full path to the static WebApp explanations directory.
+
+        Returns:
+            Path: Combined path of resources and explanations folder.
+        """
+        return Path(self.resources_path, self.explanation_pages_path)
+
 
 def load_settings() -> AppSettings:
     """
@@ -98,14 +164,38 @@ def load_settings() -> AppSettings:
         AppSettings: Configured application settings.
     """
     webhook_port: str = os.getenv("WEBHOOK_PORT") or "8000"
+    storage_chat_id: str | None = os.getenv("STORAGE_CHAT_ID")
+    command_timeout: str | None = os.getenv("POSTGRES_COMMAND_TIMEOUT", "30")
 
     return AppSettings(
         token=os.getenv("TOKEN", ""),
         resources_path=os.getenv("RESOURCES_PATH", ""),
         temp_resources_path=os.getenv("TEMP_RESOURCES_PATH", ""),
         suppress_download_logs=bool(os.getenv("SUPPRESS_DOWNLOAD_LOGS")),
+        video_download_workers=int(os.getenv("VIDEO_DOWNLOAD_WORKERS", 2)),
+        video_download_timeout=float(os.getenv("VIDEO_DOWNLOAD_TIMEOUT", 300)),
+        video_size_budget=int(os.getenv("VIDEO_SIZE_BUDGET", 45 * 1024**2)),
+        video_cache_path=os.getenv("VIDEO_CACHE_PATH", "video_cache"),
+        video_cache_max_bytes=int(os.getenv("VIDEO_CACHE_MAX_BYTES", 2 * 1024**3)),
         web_app_url=os.getenv("WEB_APP_URL", ""),
         enable_translation=bool(os.getenv("ENABLE_TRANSLATION")),
+        enable_distributed_locks=bool(os.getenv("ENABLE_DISTRIBUTED_LOCKS")),
+        translation_cache_size=int(os.getenv("TRANSLATION_CACHE_SIZE", 1024)),
+        random_uploaded_ratio=float(os.getenv("RANDOM_UPLOADED_RATIO", 0.9)),
+        random_min_coverage=float(os.getenv("RANDOM_MIN_COVERAGE", 0.9)),
+        enable_prefetch=bool(os.getenv("ENABLE_PREFETCH")),
+        prefetch_poll_interval=float(os.getenv("PREFETCH_POLL_INTERVAL", 300)),
+        storage_chat_id=int(storage_chat_id) if storage_chat_id else None,
+        user_activity_flush_interval=float(os.getenv("USER_ACTIVITY_FLUSH_INTERVAL", 10)),
+        enable_progressive_rendering=bool(os.getenv("ENABLE_PROGRESSIVE_RENDERING")),
+        media_failure_ttl=float(os.getenv("MEDIA_FAILURE_TTL", 3600)),
+        media_failure_max_ttl=float(os.getenv("MEDIA_FAILURE_MAX_TTL", 7 * 24 * 3600)),
+        explanation_cache_size=int(os.getenv("EXPLANATION_CACHE_SIZE", 1024)),
+        explanation_max_age=int(os.getenv("EXPLANATION_MAX_AGE", 30 * 24 * 3600)),
+        enable_explanation_pages=bool(os.getenv("ENABLE_EXPLANATION_PAGES")),
+        explanation_pages_path=os.getenv("EXPLANATION_PAGES_PATH", "explanations"),
+        search_page_size=int(os.getenv("SEARCH_PAGE_SIZE", 10)),
+        monitoring_token=os.getenv("MONITORING_TOKEN") or None,
         logs=LogsSettings(
             level=os.getenv("LEVEL", "INFO"),
             dir_name=os.getenv("DIR_NAME", "logs"),
@@ -124,6 +214,15 @@ def load_settings() -> AppSettings:
             postgres_user=os.getenv("POSTGRES_USER", "postgres"),
             postgres_password=os.getenv("POSTGRES_PASSWORD", "<PASSWORD>"),
             postgres_db_name=os.getenv("POSTGRES_DB_NAME", "postgres"),
+            postgres_read_host=os.getenv("POSTGRES_READ_HOST") or None,
+            postgres_pool_min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", 2)),
+            postgres_pool_max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", 10)),
+            postgres_max_inactive_connection_lifetime=float(
+                os.getenv("POSTGRES_MAX_INACTIVE_CONNECTION_LIFETIME", 300)
+            ),
+            postgres_statement_cache_size=int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", 100)),
+            postgres_command_timeout=float(command_timeout) if command_timeout else None,
+            postgres_batch_size=int(os.getenv("POSTGRES_BATCH_SIZE", 500)),
         ),
         api=APISettings(
             nasa_api_base_url=URL(os.getenv("NASA_API_BASE_URL", "")),
@@ -138,6 +237,13 @@ def load_settings() -> AppSettings:
             webhook_path=os.getenv("WEBHOOK_PATH"),
             webhook_key=os.getenv("WEBHOOK_KEY"),
         ),
+        http=HttpClientSettings(
+            connections_limit=int(os.getenv("HTTP_CONNECTIONS_LIMIT", 100)),
+            connections_limit_per_host=int(os.getenv("HTTP_CONNECTIONS_LIMIT_PER_HOST", 10)),
+            keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", 60)),
+            dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", 300)),
+            request_timeout=float(os.getenv("HTTP_REQUEST_TIMEOUT", 60)),
+        ),
     )
 
 
@@ -16,6 +16,14 @@ class DatabaseSettings:
         postgres_user (str): Postgres username.
         postgres_password (str): Postgres password.
         postgres_db_name (str): Name of the Postgres database.
+        postgres_read_host (str | None): Host name of a Postgres read replica; reads go to the primary if None.
+        postgres_pool_min_size (int): Connections opened in each Postgres pool on creation.
+        postgres_pool_max_size (int): Maximum number of connections in each Postgres pool.
+        postgres_max_inactive_connection_lifetime (float): Seconds an idle pooled connection is kept open.
+        postgres_statement_cache_size (int): Prepared statements cached per connection; 0 behind PgBouncer
+            in transaction mode.
+        postgres_command_timeout (float | None): Default timeout of a query in seconds; no timeout if None.
+        postgres_batch_size (int): Maximum number of rows written or looked up by one statement of a batch operation.
     """
 
     redis_host: str
@@ -27,3 +35,10 @@ class DatabaseSettings:
     postgres_user: str
     postgres_password: str
     postgres_db_name: str
+    postgres_read_host: str | None = None
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int = 10
+    postgres_max_inactive_connection_lifetime: float = 300
+    postgres_statement_cache_size: int = 100
+    postgres_command_timeout: float | None = 30
+    postgres_batch_size: int = 500
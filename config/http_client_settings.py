@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class HttpClientSettings:
+    """
+    Connection pool settings for the shared aiohttp client session.
+
+    Attributes:
+        connections_limit (int): Total number of simultaneous connections.
+        connections_limit_per_host (int): Number of simultaneous connections to a single host.
+        keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+        dns_cache_ttl (int): Seconds resolved host names are cached.
+        request_timeout (float): Total timeout of a single request in seconds.
+    """
+
+    connections_limit: int
+    connections_limit_per_host: int
+    keepalive_timeout: float
+    dns_cache_ttl: int
+    request_timeout: float
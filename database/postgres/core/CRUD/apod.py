@@ -1,10 +1,21 @@
+from datetime import date
 from typing import Any
 
-from tortoise.contrib.pydantic import PydanticModel
+from tortoise import connections
+from tortoise.expressions import Q
 
 from database.postgres.core.CRUD.base_crud import BaseCrud
+from database.postgres.core.read_models import ApodRecord, ApodSearchHit, ReadResult
+from database.postgres.core.tortoise_config import DEFAULT_CONNECTION
 from database.postgres.models.apod import ApodModel
 from utils.enums.model_schemas import ModelSchemas
+from utils.enums.read_model import ReadModel
+
+# Generated tsvector column, text search configuration and title expression per language
+SEARCH_VECTORS = {
+    "en": ("search_en", "english", '"title"'),
+    "ru": ("search_ru", "russian", 'coalesce("title_ru", "title")'),
+}
 
 
 class ApodCrud(BaseCrud):
@@ -20,15 +31,152 @@ class ApodCrud(BaseCrud):
     def _schema(self) -> ModelSchemas:
         return ModelSchemas.APODSchema
 
-    async def get_or_create(self, **kwargs: Any) -> PydanticModel | None:
+    @property
+    def _record(self) -> type[ApodRecord]:
+        return ApodRecord
+
+    async def get_or_create(self, *, read_model: ReadModel = ReadModel.SCHEMA, **kwargs: Any) -> ReadResult | None:
         """
         Retrieve an existing APOD entry by date or create a new one.
+        An entry inserted concurrently by another process is returned instead of failing on the unique date.
 
         Args:
+            read_model (ReadModel): Shape of the result.
             **kwargs (Any): Must include 'date' and other fields required for creation.
 
         Returns:
-            PydanticModel | None: Serialized APOD model instance or None if creation failed.
+            ReadResult | None: APOD entry in the requested shape or None if serialization failed.
+        """
+        apod_date = kwargs.pop("date")
+        apod, _ = await ApodModel.get_or_create(defaults=kwargs, date=apod_date)
+        return await self._to_read_model(apod, read_model)
+
+    async def get_dates(self, start_date: date, end_date: date) -> set[date]:
+        """
+        Retrieve dates of stored APOD entries within the range.
+
+        Args:
+            start_date (date): First date of the range, inclusive.
+            end_date (date): Last date of the range, inclusive.
+
+        Returns:
+            set[date]: Dates that already have an APOD entry.
+        """
+        dates = await (
+            ApodModel.filter(date__range=(start_date, end_date))
+            .using_db(self._get_read_connection())
+            .values_list("date", flat=True)
+        )
+        return set(dates)  # type: ignore[arg-type]
+
+    async def get_date_index(self) -> list[tuple[date, str | None, int | None]]:
+        """
+        Retrieve dates of all stored APOD entries with their Telegram file_id and media retry time.
+
+        Returns:
+            list[tuple[date, str | None, int | None]]: APOD date, file_id (None if media was not uploaded)
+                and the Unix timestamp before which its media fetch is not retried (None if not postponed).
+        """
+        return await (
+            ApodModel.all().using_db(self._get_read_connection()).values_list("date", "file_id", "media_retry_at")  # type: ignore[return-value]
+        )
+
+    async def get_ids(self) -> list[int]:
+        """
+        Retrieve IDs of all stored APOD entries.
+
+        Returns:
+            list[int]: IDs in ascending order.
+        """
+        return await ApodModel.all().using_db(self._get_read_connection()).order_by("id").values_list("id", flat=True)  # type: ignore[return-value]
+
+    async def search(
+        self, query: str, language_code: str, *, after: tuple[float, int] | None = None, limit: int = 10
+    ) -> list[ApodSearchHit]:
+        """
+        Find APOD entries whose title or explanation match the query, most relevant first. Deleted entries are skipped.
+        On Postgres the query is parsed with websearch_to_tsquery and matched against the GIN-indexed
+        tsvector column of the language; other databases fall back to a substring match with zero rank.
+
+        Results are paginated by keyset: pass the (rank, id) of the last hit of a page to get the next one.
+
+        Args:
+            query (str): Search query in web search syntax ("saturn rings", "\"black hole\"", "moon -eclipse").
+            language_code (str): "ru" to search the Russian texts, any other value for the English ones.
+            after (tuple[float, int] | None): Rank and ID of the last hit of the previous page, None for the first page.
+            limit (int): Maximum number of hits.
+
+        Returns:
+            list[ApodSearchHit]: Matching entries ordered by rank and ID, descending.
+        """
+        query = query.strip()
+
+        if not query:
+            return []
+
+        language_code = "ru" if language_code == "ru" else "en"
+        connection = self._get_read_connection() or connections.get(DEFAULT_CONNECTION)
+
+        if connection.capabilities.dialect != "postgres":
+            return await self.__search_substring(query, language_code, after, limit)
+
+        column, config, title = SEARCH_VECTORS[language_code]
+        values: list[Any] = [query]
+        keyset = ""
+
+        if after:
+            keyset = f'AND (ts_rank("{column}", query), "id") < ($2::real, $3)'
+            values.extend(after)
+
+        rows = await connection.execute_query_dict(
+            f"""
+            SELECT "id", "date", {title} AS "title", ts_rank("{column}", query) AS "rank"
+            FROM "apod", websearch_to_tsquery('{config}', $1) AS query
+            WHERE "{column}" @@ query AND NOT "is_deleted" {keyset}
+            ORDER BY "rank" DESC, "id" DESC
+            LIMIT {int(limit)}
+            """,
+            values,
+        )
+        return [ApodSearchHit(**row) for row in rows]
+
+    async def __search_substring(
+        self, query: str, language_code: str, after: tuple[float, int] | None, limit: int
+    ) -> list[ApodSearchHit]:
+        """
+        Find APOD entries containing the query, for databases without full-text search.
+
+        Args:
+            query (str): Searched substring.
+            language_code (str): "ru" or "en".
+            after (tuple[float, int] | None): Rank and ID of the last hit of the previous page.
+            limit (int): Maximum number of hits.
+
+        Returns:
+            list[ApodSearchHit]: Matching entries with zero rank ordered by ID, descending.
         """
-        apod: ApodModel | None = await ApodModel.get_or_none(date=kwargs.get("date"))
-        return await self._get_model_schema(ModelSchemas.APODSchema, apod if apod else await ApodModel.create(**kwargs))
+        if language_code == "ru":
+            condition = Q(title_ru__icontains=query) | Q(explanation_ru__icontains=query)
+        else:
+            condition = Q(title__icontains=query) | Q(explanation__icontains=query)
+
+        queryset = ApodModel.filter(condition, is_deleted=False)
+
+        if after:
+            queryset = queryset.filter(id__lt=after[1])
+
+        rows = await (
+            queryset.using_db(self._get_read_connection())
+            .order_by("-id")
+            .limit(limit)
+            .values("id", "date", "title", "title_ru")
+        )
+        return [
+            ApodSearchHit(
+                id=row["id"],
+                date=row["date"],
+                title=(row["title_ru"] if language_code == "ru" else None) or row["title"],
+                rank=0.0,
+            )
+            for row in rows
+        ]
@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
+from dataclasses import fields
 from typing import Any
 
+from tortoise import BaseDBAsyncClient, connections
 from tortoise.contrib.pydantic import PydanticModel
 from tortoise.models import Model
 from tortoise.transactions import atomic
+from tortoise.utils import chunk
 
+from config import app_settings
+from database.postgres.core.read_models import ReadResult
+from database.postgres.core.tortoise_config import DEFAULT_CONNECTION, READ_CONNECTION
 from utils.enums.model_schemas import ModelSchemas
+from utils.enums.read_model import ReadModel
 
 
 class BaseCrud(ABC):
@@ -15,8 +23,17 @@ class BaseCrud(ABC):
     Subclasses must define:
         - _model: ORM model class.
         - _schema: Corresponding Pydantic schema (as a Schema enum).
+        - _record: Corresponding read-only dataclass.
+
+    Reading methods return the Pydantic schema by default. Callers that only read attributes
+    can pass `read_model=ReadModel.RECORD` or `ReadModel.DICT` to skip pydantic validation.
+    Read-only methods run outside of transactions on the read connection, if one is configured;
+    reads that must see a write just made, e.g. re-checks under a lock, pass `use_primary=True`.
+    Batch methods split their rows into statements of the configured batch size.
     """
 
+    __record_fields: dict[type[Any], tuple[str, ...]] = {}
+
     @property
     @abstractmethod
     def _model(self) -> type[Model]:
@@ -27,6 +44,41 @@ class BaseCrud(ABC):
     def _schema(self) -> ModelSchemas:
         pass
 
+    @property
+    @abstractmethod
+    def _record(self) -> type[Any]:
+        pass
+
+    def _get_record_fields(self) -> tuple[str, ...]:
+        """
+        Get the field names of the read-only dataclass, collected once per class.
+
+        Returns:
+            tuple[str, ...]: Names of the dataclass fields.
+        """
+        names = self.__record_fields.get(self._record)
+
+        if names is None:
+            names = self.__record_fields[self._record] = tuple(field.name for field in fields(self._record))
+
+        return names
+
+    @staticmethod
+    def _get_read_connection(use_primary: bool = False) -> BaseDBAsyncClient | None:
+        """
+        Get the connection for read-only queries.
+
+        Args:
+            use_primary (bool): Read from the primary, which never lags behind writes, even if a replica is set.
+
+        Returns:
+            BaseDBAsyncClient | None: Read replica connection, or None to use the model's default connection.
+        """
+        if use_primary or READ_CONNECTION not in connections.db_config:
+            return None
+
+        return connections.get(READ_CONNECTION)
+
     @staticmethod
     async def _get_model_schema(schema: ModelSchemas, db_model: Model) -> PydanticModel | None:
         """
@@ -44,78 +96,225 @@ class BaseCrud(ABC):
 
         return await schema.value.from_tortoise_orm(db_model)
 
-    @atomic()
-    async def get(self, **kwargs: Any) -> PydanticModel | None:
+    async def _to_read_model(self, db_model: Model, read_model: ReadModel) -> ReadResult | None:
+        """
+        Convert a Tortoise ORM model instance to the requested read model.
+
+        Args:
+            db_model (Model): ORM model instance.
+            read_model (ReadModel): Shape of the result.
+
+        Returns:
+            ReadResult | None: Converted model, or None if serialization failed.
+        """
+        if read_model == ReadModel.SCHEMA:
+            return await self._get_model_schema(self._schema, db_model)
+
+        row = {name: getattr(db_model, name) for name in self._get_record_fields()}
+
+        if read_model == ReadModel.DICT:
+            return row
+
+        return self._record(**row)
+
+    async def get(
+        self, *, read_model: ReadModel = ReadModel.SCHEMA, use_primary: bool = False, **kwargs: Any
+    ) -> ReadResult | None:
         """
         Retrieve a single model instance matching the given filters.
 
         Args:
+            read_model (ReadModel): Shape of the result.
+            use_primary (bool): Read from the primary instead of the read replica.
             **kwargs (Any): Filters to apply when querying the model.
 
         Returns:
-            PydanticModel | None: Serialized model or None if not found.
+            ReadResult | None: Model in the requested shape or None if not found.
         """
-        model: Model | None = await self._model.get_or_none(**kwargs)
+        connection = self._get_read_connection(use_primary)
+        model: Model | None = await self._model.filter(**kwargs).using_db(connection).get_or_none()
 
         if model:
-            return await self._get_model_schema(self._schema, model)
+            return await self._to_read_model(model, read_model)
 
         return None
 
-    @atomic()
-    async def get_or_create(self, **kwargs: Any) -> PydanticModel | None:
+    @atomic(DEFAULT_CONNECTION)
+    async def get_or_create(self, *, read_model: ReadModel = ReadModel.SCHEMA, **kwargs: Any) -> ReadResult | None:
         """
         Retrieve an existing model or create a new one if not found.
 
         Args:
+            read_model (ReadModel): Shape of the result.
             **kwargs (Any): Fields used for lookup and creation.
 
         Returns:
-            PydanticModel | None: Serialized model.
+            ReadResult | None: Model in the requested shape.
         """
-        return await self._get_model_schema(self._schema, (await self._model.get_or_create(**kwargs))[0])
+        return await self._to_read_model((await self._model.get_or_create(**kwargs))[0], read_model)
 
-    @atomic()
-    async def update(self, *, filters: dict[str, Any], **kwargs: Any) -> PydanticModel | bool:
+    @atomic(DEFAULT_CONNECTION)
+    async def update(
+        self, *, filters: dict[str, Any], read_model: ReadModel = ReadModel.SCHEMA, **kwargs: Any
+    ) -> ReadResult | bool:
         """
         Update an existing model instance with new values.
 
         Args:
             filters (dict[str, Any]): Fields to locate the model instance.
+            read_model (ReadModel): Shape of the result.
             **kwargs (Any): Fields and values to update.
 
         Returns:
-            PydanticModel | bool: Updated model if successful, False if not found or serialization failed.
+            ReadResult | bool: Updated model if successful, False if not found or serialization failed.
         """
         model: Model | None = await self._model.get_or_none(**filters)
 
         if not model:
             return False
 
-        for key, value in kwargs.items():
-            old_value = getattr(model, key, None)
+        changed_fields = [key for key, value in kwargs.items() if value != getattr(model, key, None)]
 
-            if value != old_value:
-                setattr(model, key, value)
+        for key in changed_fields:
+            setattr(model, key, kwargs[key])
 
-        await model.save()
+        if changed_fields:
+            await model.save(update_fields=changed_fields)
 
-        schema: PydanticModel | None = await self._get_model_schema(self._schema, model)
+        result: ReadResult | None = await self._to_read_model(model, read_model)
 
-        if schema is None:
+        if result is None:
             return False
 
-        return schema
+        return result
+
+    async def update_where(self, *, filters: dict[str, Any], **kwargs: Any) -> int:
+        """
+        Update all model instances matching the filters with a single UPDATE statement.
+        Unlike update, the rows are neither loaded nor returned, so filters like `field__not=value`
+        make the statement idempotent.
 
-    @atomic()
-    async def exists(self, **kwargs: Any) -> bool:
+        Args:
+            filters (dict[str, Any]): Filters selecting the rows to update.
+            **kwargs (Any): Fields and values to update.
+
+        Returns:
+            int: Number of updated rows.
+        """
+        return await self._model.filter(**filters).update(**kwargs)
+
+    async def exists(self, *, use_primary: bool = False, **kwargs: Any) -> bool:
         """
         Check if any model instance exists matching the given filters.
 
         Args:
+            use_primary (bool): Read from the primary instead of the read replica.
             **kwargs (Any): Filters to apply.
 
         Returns:
             bool: True if at least one match is found, else False.
         """
-        return await self._model.exists(**kwargs)
+        return await self._model.filter(**kwargs).using_db(self._get_read_connection(use_primary)).exists()
+
+    @atomic(DEFAULT_CONNECTION)
+    async def bulk_create(
+        self, rows: list[dict[str, Any]], batch_size: int | None = None, ignore_conflicts: bool = False
+    ) -> None:
+        """
+        Insert many model instances using multi-row INSERT statements.
+
+        Args:
+            rows (list[dict[str, Any]]): Field values of the instances to create.
+            batch_size (int | None): Maximum number of rows per INSERT statement; all rows at once if None.
+            ignore_conflicts (bool): Skip rows violating a unique constraint instead of failing.
+        """
+        await self._model.bulk_create(
+            [self._model(**row) for row in rows], batch_size=batch_size, ignore_conflicts=ignore_conflicts
+        )
+
+    @atomic(DEFAULT_CONNECTION)
+    async def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        conflict_fields: list[str],
+        update_fields: list[str],
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Create model instances that are not stored yet and update the stored ones with INSERT ... ON CONFLICT.
+
+        Args:
+            rows (list[dict[str, Any]]): Field values of the instances.
+            conflict_fields (list[str]): Unique fields identifying a stored instance.
+            update_fields (list[str]): Fields overwritten on stored instances.
+            batch_size (int | None): Maximum number of rows per statement; the configured batch size if None.
+        """
+        if not rows:
+            return
+
+        await self._model.bulk_create(
+            [self._model(**row) for row in rows],
+            batch_size=batch_size or app_settings.db.postgres_batch_size,
+            on_conflict=conflict_fields,
+            update_fields=update_fields,
+        )
+
+    async def get_many(
+        self,
+        *,
+        read_model: ReadModel = ReadModel.SCHEMA,
+        batch_size: int | None = None,
+        use_primary: bool = False,
+        **in_filters: Collection[Any],
+    ) -> list[ReadResult]:
+        """
+        Retrieve the model instances whose fields take any of the given values, with IN queries.
+        Values of the first filter are looked up in batches, the other filters apply to every batch.
+
+        Args:
+            read_model (ReadModel): Shape of the results.
+            batch_size (int | None): Maximum number of values per query; the configured batch size if None.
+            use_primary (bool): Read from the primary instead of the read replica.
+            **in_filters (Collection[Any]): Allowed values by field name.
+
+        Returns:
+            list[ReadResult]: Found instances in the requested shape.
+        """
+        if not in_filters:
+            return []
+
+        (field, values), *other_filters = in_filters.items()
+        filters = {f"{name}__in": list(allowed) for name, allowed in other_filters}
+        connection = self._get_read_connection(use_primary)
+        results: list[ReadResult] = []
+
+        for values_batch in chunk(list(values), batch_size or app_settings.db.postgres_batch_size):
+            models = await self._model.filter(**{f"{field}__in": list(values_batch)}, **filters).using_db(connection)
+
+            for model in models:
+                result = await self._to_read_model(model, read_model)
+
+                if result is not None:
+                    results.append(result)
+
+        return results
+
+    @atomic(DEFAULT_CONNECTION)
+    async def bulk_update(self, rows: list[dict[str, Any]], fields: list[str], batch_size: int | None = None) -> int:
+        """
+        Update stored model instances with UPDATE ... CASE statements, one per batch.
+
+        Args:
+            rows (list[dict[str, Any]]): Field values of the instances, each with its primary key.
+            fields (list[str]): Fields to update.
+            batch_size (int | None): Maximum number of rows per statement; the configured batch size if None.
+
+        Returns:
+            int: Number of updated rows.
+        """
+        if not rows:
+            return 0
+
+        return await self._model.bulk_update(
+            [self._model(**row) for row in rows], fields, batch_size=batch_size or app_settings.db.postgres_batch_size
+        )
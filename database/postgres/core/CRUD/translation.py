@@ -0,0 +1,62 @@
+from database.postgres.core.CRUD.base_crud import BaseCrud
+from database.postgres.core.read_models import TranslationRecord
+from database.postgres.models.translation import TranslationModel
+from utils.enums.model_schemas import ModelSchemas
+
+
+class TranslationCrud(BaseCrud):
+    """
+    CRUD operations for the Translation model.
+    """
+
+    @property
+    def _model(self) -> type[TranslationModel]:
+        return TranslationModel
+
+    @property
+    def _schema(self) -> ModelSchemas:
+        return ModelSchemas.TranslationSchema
+
+    @property
+    def _record(self) -> type[TranslationRecord]:
+        return TranslationRecord
+
+    async def get_texts(self, source_hashes: list[str], source_language: str, target_language: str) -> dict[str, str]:
+        """
+        Retrieve stored translations for the given source text hashes.
+
+        Args:
+            source_hashes (list[str]): Hashes of the source texts.
+            source_language (str): Language code of the source texts.
+            target_language (str): Language code of the translations.
+
+        Returns:
+            dict[str, str]: Translated texts keyed by source hash; hashes without translation are omitted.
+        """
+        rows = await TranslationModel.filter(
+            source_hash__in=source_hashes, source_language=source_language, target_language=target_language
+        ).values_list("source_hash", "text")
+
+        return dict(rows)  # type: ignore[arg-type]
+
+    async def save_texts(self, texts: dict[str, str], source_language: str, target_language: str) -> None:
+        """
+        Store translations, keeping already stored ones untouched.
+
+        Args:
+            texts (dict[str, str]): Translated texts keyed by source hash.
+            source_language (str): Language code of the source texts.
+            target_language (str): Language code of the translations.
+        """
+        await TranslationModel.bulk_create(
+            [
+                TranslationModel(
+                    source_hash=source_hash,
+                    source_language=source_language,
+                    target_language=target_language,
+                    text=text,
+                )
+                for source_hash, text in texts.items()
+            ],
+            ignore_conflicts=True,
+        )
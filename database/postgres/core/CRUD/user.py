@@ -1,8 +1,7 @@
 from typing import Any
 
-from tortoise.contrib.pydantic import PydanticModel
-
 from database.postgres.core.CRUD.base_crud import BaseCrud
+from database.postgres.core.read_models import UserRecord
 from database.postgres.models.user import UserModel
 from utils.enums.model_schemas import ModelSchemas
 
@@ -20,30 +19,20 @@ class UserCrud(BaseCrud):
     def _schema(self) -> ModelSchemas:
         return ModelSchemas.UserSchema
 
-    async def get_or_create(self, **kwargs: Any) -> PydanticModel | None:
+    @property
+    def _record(self) -> type[UserRecord]:
+        return UserRecord
+
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> None:
         """
-        Retrieve a user by telegram_id or create a new one.
-        If found, updates the user with new values except 'telegram_id' and 'last_activity_time'.
+        Create users that are not stored yet and update the stored ones with INSERT ... ON CONFLICT.
 
         Args:
-            **kwargs (Any): Fields for lookup and optional update or creation.
-
-        Returns:
-            PydanticModel | None: Serialized user instance.
+            rows (list[dict[str, Any]]): User field values, one row per telegram_id.
         """
-        user: UserModel | None = await UserModel.get_or_none(telegram_id=kwargs.get("telegram_id"))
-
-        if not user:
-            return await self._get_model_schema(ModelSchemas.UserSchema, await UserModel.create(**kwargs))
-
-        for key, value in kwargs.items():
-            if key == "telegram_id" or key == "last_activity_time":
-                continue
-
-            old_value = getattr(user, key, None)
-
-            if value != old_value:
-                setattr(user, key, value)
+        if not rows:
+            return
 
-        await user.save()
-        return await self._get_model_schema(ModelSchemas.UserSchema, user)
+        await self.bulk_upsert(
+            rows, conflict_fields=["telegram_id"], update_fields=[key for key in rows[0] if key != "telegram_id"]
+        )
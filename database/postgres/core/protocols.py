@@ -31,6 +31,9 @@ class ApodProtocol(BaseProtocol):
         hdurl (str): High-definition media URL.
         media_type (str): Type of media (e.g., "image", "video").
         file_id (str): Telegram file identifier.
+        media_error (str | None): Reason of the last failed media fetch.
+        media_failures (int): Number of media fetches failed in a row.
+        media_retry_at (int | None): Unix timestamp before which the media fetch is not retried.
     """
 
     title: str
@@ -42,3 +45,6 @@ class ApodProtocol(BaseProtocol):
     hdurl: str
     media_type: str
     file_id: str
+    media_error: str | None
+    media_failures: int
+    media_retry_at: int | None
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, TypeAlias
+
+from tortoise.contrib.pydantic import PydanticModel
+
+
+@dataclass(frozen=True, slots=True)
+class ApodRecord:
+    """
+    Read-only row of the APOD table, matching ApodProtocol without pydantic validation.
+
+    Attributes:
+        id (int): Unique identifier.
+        created_at (int): Unix timestamp of creation.
+        is_deleted (bool): Soft delete flag.
+        title (str): Original title.
+        title_ru (str | None): Translated title.
+        date (date): APOD date.
+        explanation (str): Original explanation text.
+        explanation_ru (str | None): Translated explanation text.
+        url (str): Media URL.
+        hdurl (str | None): High-definition media URL.
+        media_type (str): Type of media (e.g., "image", "video").
+        file_id (str | None): Telegram file identifier.
+        media_error (str | None): Reason of the last failed media fetch.
+        media_failures (int): Number of media fetches failed in a row.
+        media_retry_at (int | None): Unix timestamp before which the media fetch is not retried.
+    """
+
+    id: int
+    created_at: int
+    is_deleted: bool
+    title: str
+    title_ru: str | None
+    date: date
+    explanation: str
+    explanation_ru: str | None
+    url: str
+    hdurl: str | None
+    media_type: str
+    file_id: str | None
+    media_error: str | None
+    media_failures: int
+    media_retry_at: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class UserRecord:
+    """
+    Read-only row of the users table.
+
+    Attributes:
+        id (int): Unique identifier.
+        created_at (int): Unix timestamp of creation.
+        is_deleted (bool): Soft delete flag.
+        telegram_id (int): Unique Telegram user ID.
+        username (str | None): Telegram username.
+        first_name (str | None): User's first name.
+        last_name (str | None): User's last name.
+        language_code (str): Language code (e.g., "en", "ru").
+        last_activity_time (int): Unix timestamp of the user's last activity.
+    """
+
+    id: int
+    created_at: int
+    is_deleted: bool
+    telegram_id: int
+    username: str | None
+    first_name: str | None
+    last_name: str | None
+    language_code: str
+    last_activity_time: int
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationRecord:
+    """
+    Read-only row of the translations table.
+
+    Attributes:
+        id (int): Unique identifier.
+        created_at (int): Unix timestamp of creation.
+        is_deleted (bool): Soft delete flag.
+        source_hash (str): SHA-256 hex digest of the source text.
+        source_language (str): Language code of the source text.
+        target_language (str): Language code of the translation.
+        text (str): Translated text.
+    """
+
+    id: int
+    created_at: int
+    is_deleted: bool
+    source_hash: str
+    source_language: str
+    target_language: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class ApodSearchHit:
+    """
+    APOD entry matching a full-text search.
+
+    Attributes:
+        id (int): Unique identifier.
+        date (date): APOD date.
+        title (str): Title in the searched language.
+        rank (float): Relevance of the entry to the query, higher is better.
+    """
+
+    id: int
+    date: date
+    title: str
+    rank: float
+
+
+ReadResult: TypeAlias = PydanticModel | ApodRecord | UserRecord | TranslationRecord | dict[str, Any]
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from aerich.models import Aerich
+from tortoise.exceptions import OperationalError
+
+MIGRATIONS_LOCATION = Path(__file__).resolve().parents[1] / "migrations"
+MIGRATIONS_APP = "models"
+
+
+def get_latest_migration() -> str:
+    """
+    Find the newest aerich migration shipped with the bot.
+
+    Returns:
+        str: File name of the migration with the highest version number.
+
+    Raises:
+        RuntimeError: If no migrations are shipped, e.g. when the deploy left the migrations folder out.
+    """
+    migrations_path = MIGRATIONS_LOCATION / MIGRATIONS_APP
+    versions = [path.name for path in migrations_path.glob("*_*.py") if path.name[0].isdigit()]
+
+    if not versions:
+        raise RuntimeError(f"No migrations found in {migrations_path}, make sure they are shipped with the bot")
+
+    return max(versions, key=lambda name: int(name.split("_")[0]))
+
+
+async def check_schema_version() -> None:
+    """
+    Make sure the latest migration shipped with the bot is applied, with a single query instead
+    of generating the schema. A database migrated further by a newer release passes the check,
+    so instances of the previous release can still restart during a rolling deploy.
+
+    Raises:
+        RuntimeError: If no migrations are shipped or the latest one is not applied.
+    """
+    latest = get_latest_migration()
+
+    try:
+        is_applied = await Aerich.exists(app=MIGRATIONS_APP, version=latest)
+    except OperationalError:
+        is_applied = False
+
+    if not is_applied:
+        raise RuntimeError(f"Migration {latest} is not applied, run `python cli.py migrate` first")
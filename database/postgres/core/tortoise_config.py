@@ -1,19 +1,58 @@
+from typing import Any
+
 from config import app_settings
 
-TORTOISE_ORM = {
+DEFAULT_CONNECTION = "default"
+READ_CONNECTION = "read"
+
+
+def get_postgres_connection(host: str) -> dict[str, Any]:
+    """
+    Build the asyncpg connection config for the given host with the configured credentials and pool settings.
+
+    Args:
+        host (str): Postgres host name.
+
+    Returns:
+        dict[str, Any]: Tortoise connection config.
+    """
+    db = app_settings.db
+
+    return {
+        "engine": "database.postgres.core.pool",
+        "credentials": {
+            "host": host,
+            "port": db.postgres_port,
+            "user": db.postgres_user,
+            "password": db.postgres_password,
+            "database": db.postgres_db_name,
+            "minsize": db.postgres_pool_min_size,
+            "maxsize": db.postgres_pool_max_size,
+            "max_inactive_connection_lifetime": db.postgres_max_inactive_connection_lifetime,
+            "statement_cache_size": db.postgres_statement_cache_size,
+            "command_timeout": db.postgres_command_timeout,
+        },
+    }
+
+
+TORTOISE_ORM: dict[str, Any] = {
     "connections": {
-        "default": f"postgres://{app_settings.db.postgres_user}:{app_settings.db.postgres_password}"
-        f"@{app_settings.db.postgres_host}:{app_settings.db.postgres_port}"
-        f"/{app_settings.db.postgres_db_name}"
+        DEFAULT_CONNECTION: get_postgres_connection(app_settings.db.postgres_host),
+        **(
+            {READ_CONNECTION: get_postgres_connection(app_settings.db.postgres_read_host)}
+            if app_settings.db.postgres_read_host
+            else {}
+        ),
     },
     "apps": {
         "models": {
             "models": [
                 "database.postgres.models.apod",
                 "database.postgres.models.user",
+                "database.postgres.models.translation",
                 "aerich.models",
             ],
-            "default_connection": "default",
+            "default_connection": DEFAULT_CONNECTION,
         }
     },
 }
@@ -0,0 +1,54 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "apod" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "created_at" BIGINT NOT NULL,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "title" VARCHAR(100) NOT NULL,
+            "title_ru" VARCHAR(100),
+            "date" DATE NOT NULL,
+            "explanation" TEXT NOT NULL,
+            "explanation_ru" TEXT,
+            "url" VARCHAR(150) NOT NULL,
+            "hdurl" VARCHAR(150),
+            "media_type" VARCHAR(15) NOT NULL,
+            "file_id" VARCHAR(150)
+        );
+        COMMENT ON TABLE "apod" IS 'Tortoise ORM model for NASA''s Astronomy Picture of the Day (APOD).';
+        CREATE TABLE IF NOT EXISTS "users" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "created_at" BIGINT NOT NULL,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "telegram_id" INT NOT NULL,
+            "username" VARCHAR(100),
+            "first_name" VARCHAR(100),
+            "last_name" VARCHAR(100),
+            "language_code" VARCHAR(5) NOT NULL,
+            "last_activity_time" BIGINT NOT NULL
+        );
+        COMMENT ON TABLE "users" IS 'Tortoise ORM model representing a Telegram user.';
+        CREATE TABLE IF NOT EXISTS "translations" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "created_at" BIGINT NOT NULL,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "source_hash" VARCHAR(64) NOT NULL,
+            "source_language" VARCHAR(5) NOT NULL,
+            "target_language" VARCHAR(5) NOT NULL,
+            "text" TEXT NOT NULL,
+            CONSTRAINT "uid_translation_source__84523b" UNIQUE ("source_hash", "source_language", "target_language")
+        );
+        COMMENT ON TABLE "translations" IS 'Tortoise ORM model caching a translated text.';
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSONB NOT NULL
+        );"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
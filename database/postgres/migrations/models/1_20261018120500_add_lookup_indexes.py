@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DELETE FROM "apod" AS a USING "apod" AS b
+            WHERE a."date" = b."date"
+            AND ((a."file_id" IS NULL AND b."file_id" IS NOT NULL)
+                OR ((a."file_id" IS NULL) = (b."file_id" IS NULL) AND a."id" > b."id"));
+        DELETE FROM "users" AS a USING "users" AS b
+            WHERE a."telegram_id" = b."telegram_id"
+            AND (a."last_activity_time" < b."last_activity_time"
+                OR (a."last_activity_time" = b."last_activity_time" AND a."id" > b."id"));
+        CREATE INDEX IF NOT EXISTS "idx_apod_file_id_54a758" ON "apod" ("file_id");
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_apod_date_a4a661" ON "apod" ("date");
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_users_telegra_ab91e9" ON "users" ("telegram_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_users_telegra_ab91e9";
+        DROP INDEX IF EXISTS "uid_apod_date_a4a661";
+        DROP INDEX IF EXISTS "idx_apod_file_id_54a758";"""
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "apod" ADD COLUMN IF NOT EXISTS "media_error" VARCHAR(255);
+        ALTER TABLE "apod" ADD COLUMN IF NOT EXISTS "media_failures" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "apod" ADD COLUMN IF NOT EXISTS "media_retry_at" BIGINT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "apod" DROP COLUMN IF EXISTS "media_retry_at";
+        ALTER TABLE "apod" DROP COLUMN IF EXISTS "media_failures";
+        ALTER TABLE "apod" DROP COLUMN IF EXISTS "media_error";"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "apod" ADD COLUMN IF NOT EXISTS "search_en" TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce("title", '')), 'A')
+            || setweight(to_tsvector('english', coalesce("explanation", '')), 'B')
+        ) STORED;
+        ALTER TABLE "apod" ADD COLUMN IF NOT EXISTS "search_ru" TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('russian', coalesce("title_ru", '')), 'A')
+            || setweight(to_tsvector('russian', coalesce("explanation_ru", '')), 'B')
+        ) STORED;
+        CREATE INDEX IF NOT EXISTS "idx_apod_search_en" ON "apod" USING GIN ("search_en");
+        CREATE INDEX IF NOT EXISTS "idx_apod_search_ru" ON "apod" USING GIN ("search_ru");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_apod_search_ru";
+        DROP INDEX IF EXISTS "idx_apod_search_en";
+        ALTER TABLE "apod" DROP COLUMN IF EXISTS "search_ru";
+        ALTER TABLE "apod" DROP COLUMN IF EXISTS "search_en";"""
@@ -1,4 +1,4 @@
-from tortoise.fields import CharField, DateField, TextField
+from tortoise.fields import BigIntField, CharField, DateField, IntField, TextField
 
 from database.postgres.core.base_model import OrmBaseModel
 
@@ -10,13 +10,20 @@ class ApodModel(OrmBaseModel):
     Fields:
         title (str): Original APOD title.
         title_ru (str | None): Translated title.
-        date (date): Date of the APOD.
+        date (date): Date of the APOD, unique.
         explanation (str): Original APOD description.
         explanation_ru (str | None): Translated description.
         url (str): Media URL.
         hdurl (str | None): High-definition media URL.
         media_type (str): Type of media (e.g., "image", "video").
-        file_id (str | None): Telegram file identifier.
+        file_id (str | None): Telegram file identifier, indexed.
+        media_error (str | None): Reason of the last failed media fetch.
+        media_failures (int): Number of media fetches failed in a row.
+        media_retry_at (int | None): Unix timestamp before which the media fetch is not retried.
+
+    Full-text search columns, generated by Postgres and GIN-indexed, are not mapped so the ORM never writes them:
+        search_en (tsvector): English vector of the title (weight A) and explanation (weight B).
+        search_ru (tsvector): Russian vector of the translated title (weight A) and explanation (weight B).
 
     Meta:
         table (str): Name of the database table.
@@ -26,7 +33,7 @@ class ApodModel(OrmBaseModel):
     title = CharField(max_length=100, null=False)
     title_ru = CharField(max_length=100, null=True)
 
-    date = DateField(null=False)
+    date = DateField(null=False, unique=True)
 
     explanation = TextField(null=False)
     explanation_ru = TextField(null=True)
@@ -35,7 +42,11 @@ class ApodModel(OrmBaseModel):
     hdurl = CharField(max_length=150, null=True)
 
     media_type = CharField(max_length=15, null=False)
-    file_id = CharField(max_length=150, null=True)
+    file_id = CharField(max_length=150, null=True, db_index=True)
+
+    media_error = CharField(max_length=255, null=True)
+    media_failures = IntField(default=0)
+    media_retry_at = BigIntField(null=True)
 
     class Meta:
         table = "apod"
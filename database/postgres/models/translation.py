@@ -0,0 +1,31 @@
+from tortoise.fields import CharField, TextField
+
+from database.postgres.core.base_model import OrmBaseModel
+
+
+class TranslationModel(OrmBaseModel):
+    """
+    Tortoise ORM model caching a translated text.
+
+    Fields:
+        source_hash (str): SHA-256 hex digest of the source text.
+        source_language (str): Language code of the source text (e.g., "en").
+        target_language (str): Language code of the translation (e.g., "ru").
+        text (str): Translated text.
+
+    Meta:
+        table (str): Name of the database table.
+        ordering (list[str]): Default ordering by ID.
+        unique_together (tuple[str, ...]): One translation per source text and language pair.
+    """
+
+    source_hash = CharField(max_length=64, null=False)
+    source_language = CharField(max_length=5, null=False)
+    target_language = CharField(max_length=5, null=False)
+
+    text = TextField(null=False)
+
+    class Meta:
+        table = "translations"
+        ordering = ["id"]
+        unique_together = ("source_hash", "source_language", "target_language")
@@ -20,7 +20,7 @@ class UserModel(OrmBaseModel):
         ordering (list[str]): Default ordering by ID.
     """
 
-    telegram_id = IntField(null=False)
+    telegram_id = IntField(null=False, unique=True)
     username = CharField(max_length=100, null=True)
 
     first_name = CharField(max_length=100, null=True)
@@ -0,0 +1,72 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError
+
+from config import app_settings
+from config.log_config import logger
+from database.redis import redis
+
+
+async def _keep_alive(lock: Lock, interval: float) -> None:
+    """
+    Reset the lock TTL periodically, so work longer than the TTL keeps it.
+
+    Args:
+        lock (Lock): Acquired Redis lock.
+        interval (float): Seconds between renewals.
+    """
+    while True:
+        await asyncio.sleep(interval)
+
+        try:
+            await lock.reacquire()
+        except LockError:
+            logger.warning(f"Lock {lock.name!r} was lost before its work finished")
+            return
+
+
+@asynccontextmanager
+async def distributed_lock(name: str, timeout: float = 30, blocking_timeout: float = 120) -> AsyncIterator[None]:
+    """
+    Hold a Redis lock shared by all bot processes for the duration of the block.
+
+    The lock expires `timeout` seconds after its holder dies, but is renewed while the block runs,
+    so long work such as a video download does not let another process take it. A lock lost anyway
+    is only logged on release, since the work of the block has already been done.
+
+    Does nothing when distributed locks are disabled, so a single process runs without Redis round-trips.
+
+    Args:
+        name (str): Lock name, prefixed with the application namespace.
+        timeout (float): Seconds after which the lock expires unless it is renewed.
+        blocking_timeout (float): Seconds to wait for the lock before giving up.
+
+    Raises:
+        LockError: If the lock could not be acquired within the blocking timeout.
+    """
+    if not app_settings.enable_distributed_locks:
+        yield
+        return
+
+    lock = redis.lock(f"nasa-bot:lock:{name}", timeout=timeout, blocking_timeout=blocking_timeout)
+
+    if not await lock.acquire():
+        raise LockError(f"Unable to acquire lock {name!r} within {blocking_timeout} s")
+
+    keep_alive = asyncio.create_task(_keep_alive(lock, timeout / 3))
+
+    try:
+        yield
+    finally:
+        keep_alive.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await keep_alive
+
+        try:
+            await lock.release()
+        except LockError:
+            logger.warning(f"Lock {name!r} expired before it was released")
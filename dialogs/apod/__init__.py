@@ -1,4 +1,5 @@
 from .windows.apod_date_selection import apod_date_selection
 from .windows.apod_menu import apod_menu
+from .windows.apod_search import apod_search
 
-__all__ = ["apod_menu", "apod_date_selection"]
+__all__ = ["apod_menu", "apod_date_selection", "apod_search"]
@@ -1,3 +1,5 @@
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, cast
 
@@ -7,6 +9,7 @@ from aiogram.types import User
 from aiogram_dialog import DialogManager
 from aiogram_dialog.api.entities import MediaAttachment, MediaId
 from fluentogram import TranslatorRunner
+from redis.exceptions import LockError
 from yarl import URL
 from yt_dlp import DownloadError
 
@@ -14,11 +17,38 @@ from config import app_settings
 from config.log_config import log_return_value, logger
 from database.postgres.core.CRUD.apod import ApodCrud
 from database.postgres.core.protocols import ApodProtocol
+from database.redis.lock import distributed_lock
+from dialogs.apod.service.apod_date_index import apod_date_index
+from dialogs.apod.service.apod_media_jobs import apod_media_jobs
 from dialogs.apod.service.apod_other_media_resolver import ApodOtherMediaResolver
 from dialogs.apod.service.chat_action_sender import ChatActionSender
+from dialogs.apod.service.explanation_pages import explanation_pages
+from dialogs.apod.service.media_failures import media_failures
+from dialogs.apod.service.video_cache import video_cache
 from dialogs.apod.service.video_downloader import VideoDownloader
 from utils.enums.apod_content_type import ApodContentType
+from utils.enums.read_model import ReadModel
 from utils.http_client import HttpClient
+from utils.single_flight import SingleFlight
+from utils.stage_graph import Stage, StageGraph
+
+
+@dataclass(frozen=True, slots=True)
+class ApodRequest:
+    """
+    State of a single APOD render, passed through the provider pipeline instead of being kept on the provider.
+
+    Attributes:
+        apod_date (str | None): Requested date in the format "YYYY-MM-DD", or None for today's or a random APOD.
+        is_random (bool): Whether a random APOD is requested.
+        chat_action_sender (ChatActionSender | None): Sender of chat actions to the requesting user, if any.
+        with_media (bool): Whether the media is downloaded along with the APOD data.
+    """
+
+    apod_date: str | None
+    is_random: bool = False
+    chat_action_sender: ChatActionSender | None = None
+    with_media: bool = True
 
 
 class ApodProvider:
@@ -26,12 +56,34 @@ class ApodProvider:
     Fetches and prepares NASA APOD data for dialog rendering.
 
     Handles media download, translation, and caption formatting.
+    Concurrent cache misses for the same date are coalesced, so the NASA fetch, translation
+    and media download run only once per date. Failed media downloads are recorded in the negative cache,
+    so the date is answered at once until its retry time.
+    The provider is shared by all users: everything specific to a render is kept in an ApodRequest.
+    With progressive rendering, the caption is shown with a placeholder picture at once
+    and the video is attached by a background job when it is downloaded.
     """
 
     __apod_url_parts: tuple[str, str] = "planetary", "apod"
     __apod_crud: ApodCrud = ApodCrud()
     __other_media_resolver: ApodOtherMediaResolver = ApodOtherMediaResolver()
-    __chat_action_sender: ChatActionSender | None = None
+    __single_flight: SingleFlight[tuple[ApodProtocol, MediaAttachment | None]] = SingleFlight()
+
+    def __init__(self) -> None:
+        self.__load_stages = StageGraph(
+            Stage("apod_json", self.__fetch_apod_json, timeout=30),
+            Stage("translation", self.__translate, depends_on=("apod_json",), timeout=30),
+            Stage("media_source", self.__resolve_media_source, depends_on=("apod_json",), timeout=30),
+            Stage("chat_action", self.__send_chat_action, depends_on=("media_source",), timeout=10),
+            Stage("media", self.__download_media, depends_on=("apod_json", "media_source")),
+            Stage("apod", self.__store_apod, depends_on=("apod_json", "translation", "media_source"), timeout=10),
+        )
+        self.__caption_stages = StageGraph(
+            Stage("apod_json", self.__fetch_apod_json, timeout=30),
+            Stage("translation", self.__translate, depends_on=("apod_json",), timeout=30),
+            Stage("media_source", self.__resolve_media_source, depends_on=("apod_json",), timeout=30),
+            Stage("apod", self.__store_apod, depends_on=("apod_json", "translation", "media_source"), timeout=10),
+        )
 
     @log_return_value
     def __get_apod_url(self, apod_date: str | None, is_random: bool) -> URL:
@@ -54,83 +106,301 @@ class ApodProvider:
 
         return app_settings.api.build_nasa_url(*self.__apod_url_parts, **query_params)
 
-    async def __get_apod_media(self, media_type: str, media_url: str, apod_date: str) -> MediaAttachment:
+    async def __fetch_apod_json(self, request: ApodRequest) -> dict[str, Any]:
+        """
+        Stage: fetch APOD JSON from NASA.
+
+        Args:
+            request (ApodRequest): Render the APOD is loaded for.
+
+        Returns:
+            dict[str, Any]: Raw APOD data.
+        """
+        apod_json: dict[str, Any] = await HttpClient.get_json(
+            url=self.__get_apod_url(request.apod_date, request.is_random)
+        )
+
+        if isinstance(apod_json, list):
+            apod_json = apod_json[0]
+
+        return apod_json
+
+    @staticmethod
+    async def __translate(_request: ApodRequest, apod_json: dict[str, Any]) -> dict[str, str]:
+        """
+        Stage: translate APOD title and explanation if translation is enabled.
+
+        Args:
+            _request (ApodRequest): Render the APOD is loaded for (unused).
+            apod_json (dict[str, Any]): Raw APOD data.
+
+        Returns:
+            dict[str, str]: Translated fields, empty if translation is disabled.
+        """
+        if not app_settings.enable_translation:
+            return {}
+
+        translated_texts = (await HttpClient.translate(texts=[apod_json["title"], apod_json["explanation"]]))[
+            "translations"
+        ]
+
+        return {"title_ru": translated_texts[0]["text"], "explanation_ru": translated_texts[1]["text"]}
+
+    async def __resolve_media_source(self, _request: ApodRequest, apod_json: dict[str, Any]) -> tuple[str, str]:
         """
-        Download APOD media and wrap it as a MediaAttachment.
+        Stage: determine media type and URL, resolving "other" media from the APOD page.
 
         Args:
-            media_type (str): Type of media ("image", "video" or "other").
-            media_url (str): URL to the media resource.
-            apod_date (str): Date of the APOD (used for logging).
+            _request (ApodRequest): Render the APOD is loaded for (unused).
+            apod_json (dict[str, Any]): Raw APOD data.
 
         Returns:
-            MediaAttachment: Wrapped media.
+            tuple[str, str]: Media type and media URL.
         """
-        logger.info(f"APOD url at {apod_date}: {media_url}")
+        if apod_json["media_type"] == "other":
+            media = await self.__other_media_resolver(apod_json["date"])
 
-        if media_type == "other" and self.__other_media_resolver.src and self.__other_media_resolver.media_type:
-            media_url = str(app_settings.api.nasa_apod_base_url / self.__other_media_resolver.src)
-            media_type = self.__other_media_resolver.media_type
+            if media:
+                return media.media_type, media.url
 
-        if self.__chat_action_sender:
-            await self.__chat_action_sender.send_chat_action(cast(str, media_type))
+        return apod_json["media_type"], apod_json["url"]
+
+    @staticmethod
+    async def __send_chat_action(request: ApodRequest, media_source: tuple[str, str]) -> None:
+        """
+        Stage: show the user that media of the given type is being prepared.
+
+        Args:
+            request (ApodRequest): Render the APOD is loaded for.
+            media_source (tuple[str, str]): Media type and media URL.
+        """
+        if request.chat_action_sender:
+            await request.chat_action_sender.send_chat_action(media_source[0])
+
+    @staticmethod
+    async def __download_media(
+        _request: ApodRequest, apod_json: dict[str, Any], media_source: tuple[str, str]
+    ) -> tuple[MediaAttachment | None, str | None]:
+        """
+        Stage: download APOD media and wrap it as a MediaAttachment.
+        Bounded by the video download timeout, which makes the media unavailable instead of failing the render.
+
+        Args:
+            _request (ApodRequest): Render the APOD is loaded for (unused).
+            apod_json (dict[str, Any]): Raw APOD data.
+            media_source (tuple[str, str]): Media type and media URL.
+
+        Returns:
+            tuple[MediaAttachment | None, str | None]: Wrapped media and None,
+                or None and the reason if the video could not be downloaded.
+        """
+        media_type, media_url = media_source
+        logger.info(f"APOD url at {apod_json['date']}: {media_url}")
 
         if media_type == "image":
-            return MediaAttachment(ContentType.PHOTO, media_url)
+            return MediaAttachment(ContentType.PHOTO, media_url), None
 
         try:
-            VideoDownloader.download(media_url)
-        except DownloadError:
+            filename = await VideoDownloader.download(media_url)
+        except DownloadError as e:
             logger.warning(f"Failed to download media from {media_url}")
-            raise
+            return None, str(e)
 
-        return MediaAttachment(ContentType.VIDEO, path=VideoDownloader.filename, supports_streaming=True)
+        return MediaAttachment(ContentType.VIDEO, path=filename, supports_streaming=True), None
 
-    async def __prepare_payload(self, data: dict[str, Any]) -> dict[str, Any]:
+    async def __store_apod(
+        self,
+        _request: ApodRequest,
+        apod_json: dict[str, Any],
+        translation: dict[str, str],
+        media_source: tuple[str, str],
+    ) -> ApodProtocol:
         """
-        Clean and optionally translate APOD data fields.
+        Stage: store the prepared APOD, add it to the date index and write its static explanation pages if possible.
 
         Args:
-            data (dict[str, Any]): Raw JSON response from NASA API.
+            _request (ApodRequest): Render the APOD is loaded for (unused).
+            apod_json (dict[str, Any]): Raw APOD data.
+            translation (dict[str, str]): Translated fields.
+            media_source (tuple[str, str]): Media type and media URL.
 
         Returns:
-            dict[str, Any]: Cleaned and enriched APOD data.
+            ApodProtocol: Stored APOD entry.
         """
-        data.pop("copyright", None)
-        data.pop("service_version", None)
+        apod_data = {key: value for key, value in apod_json.items() if key not in ("copyright", "service_version")}
+        apod_data |= translation
+        apod_data["media_type"], apod_data["url"] = media_source
 
-        if app_settings.enable_translation:
-            translated_texts = (await HttpClient.translate(texts=[data["title"], data["explanation"]]))["translations"]
+        apod = cast(ApodProtocol, await self.__apod_crud.get_or_create(read_model=ReadModel.RECORD, **apod_data))
+        apod_date_index.add(apod.date, is_uploaded=bool(apod.file_id))
 
-            data["title_ru"] = translated_texts[0]["text"]
-            data["explanation_ru"] = translated_texts[1]["text"]
+        if app_settings.enable_explanation_pages:
+            # The pages only cache what the WebApp endpoint serves, so failing to write them must not fail the render
+            try:
+                await explanation_pages.write(apod)
+            except OSError:
+                logger.exception(f"Failed to write explanation pages of APOD {apod.date}")
+
+        return apod
+
+    @staticmethod
+    def __get_stored_media(apod: ApodProtocol) -> MediaAttachment | None:
+        """
+        Build a media attachment from the Telegram file_id stored for the APOD.
 
-            if data["media_type"] == "other":
-                await self.__other_media_resolver(data["date"])
+        Args:
+            apod (ApodProtocol): Stored APOD entry.
 
-                if self.__other_media_resolver.src and self.__other_media_resolver.media_type:
-                    data["url"] = str(URL(app_settings.api.nasa_apod_base_url / self.__other_media_resolver.src))
-                    data["media_type"] = self.__other_media_resolver.media_type
+        Returns:
+            MediaAttachment | None: Media referencing the uploaded file, or None if nothing was uploaded yet.
+        """
+        if not apod.file_id:
+            return None
 
-        return data
+        return MediaAttachment(ApodContentType.get_aiogram_type(apod.media_type), file_id=MediaId(file_id=apod.file_id))
 
-    async def __get_apod_data(self, apod_date: str | None, is_random: bool) -> dict[str, Any]:
+    async def __load_apod(self, request: ApodRequest) -> tuple[ApodProtocol, MediaAttachment | None]:
         """
-        Fetch APOD JSON data and prepare it for database insertion.
+        Fetch APOD from NASA, store it and download its media.
+
+        Translation, storing, the chat action and the media download run as a stage graph,
+        so the media download does not wait for translation and storing.
+        The chat action and the media download are skipped if the request is without media.
 
         Args:
-            apod_date (str | None): Specific date to fetch, or None.
-            is_random (bool): Whether to request a random APOD.
+            request (ApodRequest): Render the APOD is loaded for.
 
         Returns:
-            dict[str, Any]: Final prepared data with optional translation.
+            tuple[ApodProtocol, MediaAttachment | None]: Stored APOD and its media, or None if media is unavailable.
         """
-        apod_json: dict[str, Any] = await HttpClient.get_json(url=self.__get_apod_url(apod_date, is_random))
+        stages = self.__load_stages if request.with_media else self.__caption_stages
+        results = await stages.run(request)
+        media, error = results.get("media", (None, None))
 
-        if isinstance(apod_json, list):
-            apod_json = apod_json[0]
+        if error:
+            await media_failures.record(results["apod"].date, error)
+
+        return results["apod"], media
+
+    async def __load_apod_exclusively(self, request: ApodRequest) -> tuple[ApodProtocol, MediaAttachment | None]:
+        """
+        Load APOD for the requested date while holding a lock shared by all bot processes.
+
+        If the APOD is already stored, the stored entry is reused and only its media is resolved,
+        unless the media recently failed and its retry is postponed.
+        Waiters give up after the longest possible load and re-read the database; if the APOD is still
+        not stored, it is loaded without the lock.
+
+        Args:
+            request (ApodRequest): Render with a specific date to load.
+
+        Returns:
+            tuple[ApodProtocol, MediaAttachment | None]: Stored APOD and its media, or None if media is unavailable.
+        """
+        apod: ApodProtocol | None
+
+        try:
+            # The video download is the longest stage, NASA, translation and storing take well under a minute
+            async with distributed_lock(
+                f"apod:{request.apod_date}", blocking_timeout=app_settings.video_download_timeout + 60
+            ):
+                # The primary is read, since a replica may not have the APOD another process has just stored
+                apod = cast(
+                    ApodProtocol | None,
+                    await self.__apod_crud.get(date=request.apod_date, read_model=ReadModel.RECORD, use_primary=True),
+                )
+
+                if not apod:
+                    return await self.__load_apod(request)
+        except LockError:
+            logger.warning(f"APOD {request.apod_date} is loaded without the lock")
+            apod = cast(
+                ApodProtocol | None,
+                await self.__apod_crud.get(date=request.apod_date, read_model=ReadModel.RECORD, use_primary=True),
+            )
+
+            if not apod:
+                return await self.__load_apod(request)
+
+        media = self.__get_stored_media(apod)
 
-        return await self.__prepare_payload(apod_json)
+        if media or not request.with_media or media_failures.is_postponed(apod):
+            return apod, media
+
+        media_source = apod.media_type, apod.url
+        apod_json = {"date": apod.date.strftime("%Y-%m-%d")}
+        _, (media, error) = await asyncio.gather(
+            self.__send_chat_action(request, media_source), self.__download_media(request, apod_json, media_source)
+        )
+
+        if error:
+            await media_failures.record(apod.date, error)
+
+        return apod, media
+
+    async def __load_apod_once(self, request: ApodRequest) -> tuple[ApodProtocol, MediaAttachment | None]:
+        """
+        Load APOD for the requested date, sharing the work with concurrent loads of the same date.
+        A cached video shared with a load already in flight is pinned for this caller too, since every
+        render releases the video it sends.
+
+        Args:
+            request (ApodRequest): Render with a specific date to load.
+
+        Returns:
+            tuple[ApodProtocol, MediaAttachment | None]: Stored APOD and its media, or None if media is unavailable.
+        """
+        key = cast(str, request.apod_date) if request.with_media else f"{request.apod_date}:caption"
+        is_joining = self.__single_flight.in_flight(key)
+        apod, media = await self.__single_flight.do(key, lambda: self.__load_apod_exclusively(request))
+
+        if is_joining and media and media.path:
+            video_cache.hold(str(media.path))
+
+        return apod, media
+
+    async def prefetch(self, apod_date: str) -> tuple[ApodProtocol, MediaAttachment | None]:
+        """
+        Load APOD for the date ahead of user requests, sharing the work with concurrent renders of the same date.
+
+        Args:
+            apod_date (str): Date to load in the format "YYYY-MM-DD".
+
+        Returns:
+            tuple[ApodProtocol, MediaAttachment | None]: Stored APOD and its media, or None if media is unavailable.
+        """
+        return await self.__load_apod_once(ApodRequest(apod_date=apod_date))
+
+    @staticmethod
+    def __get_progressive_media(
+        apod: ApodProtocol, user_id: int, dialog_manager: DialogManager
+    ) -> MediaAttachment | None:
+        """
+        Get APOD media without waiting for a video download.
+
+        Images are sent by URL. For videos, the first render starts a background download and shows a placeholder;
+        the render triggered by the finished download shows the video.
+
+        Args:
+            apod (ApodProtocol): Stored APOD entry without uploaded media.
+            user_id (int): User the APOD is rendered for.
+            dialog_manager (DialogManager): Dialog manager used to re-render the window when the video is ready.
+
+        Returns:
+            MediaAttachment | None: Media or placeholder to show, or None if the video could not be downloaded.
+        """
+        if apod.media_type == "image":
+            return MediaAttachment(ContentType.PHOTO, apod.url)
+
+        apod_date = apod.date.strftime("%Y-%m-%d")
+
+        if apod_media_jobs.has_result(user_id, apod_date):
+            return apod_media_jobs.pop_result(user_id, apod_date)
+
+        if not apod_media_jobs.is_running(user_id, apod_date):
+            apod_media_jobs.start(user_id, apod_date, apod.url, dialog_manager.bg())
+
+        return apod_media_jobs.get_placeholder()
 
     async def __call__(
         self,
@@ -148,39 +418,50 @@ class ApodProvider:
             dialog_manager (DialogManager): Dialog state/context manager.
             i18n (TranslatorRunner): Translation runner.
             language_code (str): Current user language.
+            bot (Bot): Bot used to send chat actions.
+            event_from_user (User): User the APOD is rendered for.
             **_ (unused): Ignored extra arguments.
 
         Returns:
             dict[str, Any]: Dialog context data with localized UI strings and APOD media if available.
         """
-        self.__chat_action_sender = ChatActionSender(event_from_user.id, bot)
-
         apod_date = dialog_manager.dialog_data.pop("apod_date", None)
         is_random = dialog_manager.dialog_data.pop("is_random", False)
 
+        if not apod_date and is_random:
+            random_date = apod_date_index.random_date()
+
+            if random_date:
+                apod_date = random_date.strftime("%Y-%m-%d")
+
         if not apod_date and not is_random:
             apod_date = datetime.today().strftime("%Y-%m-%d")
 
-        apod: ApodProtocol | None = cast(ApodProtocol | None, await self.__apod_crud.get(date=apod_date))
-
-        if apod:
-            if not apod.file_id:
-                media: MediaAttachment | None = None
-            else:
-                media = MediaAttachment(
-                    ApodContentType.get_aiogram_type(apod.media_type), file_id=MediaId(file_id=apod.file_id)
-                )
+        progressive = app_settings.enable_progressive_rendering
+        request = ApodRequest(
+            apod_date, is_random, ChatActionSender(event_from_user.id, bot), with_media=not progressive
+        )
+        apod: ApodProtocol | None = cast(
+            ApodProtocol | None, await self.__apod_crud.get(date=apod_date, read_model=ReadModel.RECORD)
+        )
+        media: MediaAttachment | None
+
+        if apod and (apod.file_id or not request.with_media or media_failures.is_postponed(apod)):
+            media = self.__get_stored_media(apod)
+        elif apod_date:
+            apod, media = await self.__load_apod_once(request)
         else:
-            apod_data: dict[str, Any] = await self.__get_apod_data(apod_date=apod_date, is_random=is_random)
-            apod = cast(ApodProtocol, await self.__apod_crud.get_or_create(**apod_data))
+            apod, media = await self.__load_apod(request)
 
-            try:
-                media = await self.__get_apod_media(apod.media_type, apod.url, apod.date.strftime("%Y-%m-%d"))
-            except DownloadError:
-                media = None
+        if progressive and not media and not media_failures.is_postponed(apod):
+            media = self.__get_progressive_media(apod, event_from_user.id, dialog_manager)
+
+        # Windows opened from the menu return to the APOD shown here instead of today's one
+        dialog_manager.dialog_data["shown_apod_date"] = apod.date.strftime("%Y-%m-%d")
 
         result = {
             "select_date_button_text": i18n.get("select_date"),
+            "search_button_text": i18n.get("search"),
             "random_picture_button_text": i18n.get("random_picture"),
             "explanation_button_text": i18n.get("explanation"),
             "main_menu_button_text": i18n.get("main_menu"),
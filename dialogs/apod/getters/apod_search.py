@@ -0,0 +1,66 @@
+from typing import Any
+
+from aiogram_dialog import DialogManager
+from fluentogram import TranslatorRunner
+
+from config import app_settings
+from database.postgres.core.CRUD.apod import ApodCrud
+
+apod_crud = ApodCrud()
+
+
+async def getter(dialog_manager: DialogManager, i18n: TranslatorRunner, language_code: str, **_: Any) -> dict[str, Any]:
+    """
+    Search APODs by the query from dialog data and prepare a page of results.
+    One extra hit is fetched to know whether the next page exists; its keyset is kept in dialog data.
+
+    Args:
+        dialog_manager (DialogManager): Manages dialog state and context.
+        i18n (TranslatorRunner): Translator for localized text.
+        language_code (str): Current user language.
+        **_ (unused): Ignored additional arguments.
+
+    Returns:
+        dict[str, Any]: Dictionary with localized strings for the UI and search results as (date, text) pairs.
+    """
+    result: dict[str, Any] = {
+        "search_request": i18n.get("search_request"),
+        "next_page_button_text": i18n.get("next_page"),
+        "back_button_text": i18n.get("back"),
+        "incorrect_format_message": None,
+        "search_results": None,
+        "nothing_found_message": None,
+        "hits": [],
+        "has_next": False,
+    }
+
+    if dialog_manager.dialog_data.pop("incorrect_format", False):
+        result["incorrect_format_message"] = i18n.get("incorrect_format")
+
+    query: str | None = dialog_manager.dialog_data.get("search_query")
+
+    if not query:
+        return result
+
+    after = dialog_manager.dialog_data.get("search_after")
+    page_size = app_settings.search_page_size
+    hits = await apod_crud.search(
+        query, language_code, after=(after[0], after[1]) if after else None, limit=page_size + 1
+    )
+    page = hits[:page_size]
+
+    if not page:
+        result["nothing_found_message"] = i18n.get("nothing_found", query=query)
+        return result
+
+    date_format = app_settings.get_date_format(language_code)
+    result |= {
+        "search_results": i18n.get("search_results", query=query),
+        "hits": [(hit.date.strftime("%Y-%m-%d"), f"{hit.date.strftime(date_format)} {hit.title}") for hit in page],
+        "has_next": len(hits) > page_size,
+    }
+
+    if result["has_next"]:
+        dialog_manager.dialog_data.update(search_next=[page[-1].rank, page[-1].id])
+
+    return result
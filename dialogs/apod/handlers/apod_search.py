@@ -0,0 +1,78 @@
+from aiogram.types import CallbackQuery, Message
+from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Select
+
+from states.states import APODSG
+
+
+async def handle_search_query(message: Message, _widget: MessageInput, dialog_manager: DialogManager) -> None:
+    """
+    Store the user's search query and show the first page of its results.
+
+    Args:
+        message (Message): Incoming Telegram message with the query.
+        _widget (unused): Dialog widget reference.
+        dialog_manager (DialogManager): Dialog manager for state and context.
+
+    Raises:
+        ValueError: If the message has no text.
+    """
+    if not message.text:
+        raise ValueError("Message text is empty")
+
+    dialog_manager.dialog_data.pop("search_after", None)
+    dialog_manager.dialog_data.update(search_query=message.text.strip())
+
+
+async def handle_invalid_search_input(_message: Message, _widget: MessageInput, dialog_manager: DialogManager) -> None:
+    """
+    Fallback handler that marks the user input as having incorrect format.
+
+    Args:
+        _message (unused): Incoming Telegram message.
+        _widget (unused): Dialog widget reference.
+        dialog_manager (DialogManager): Dialog manager to update dialog state.
+    """
+    dialog_manager.dialog_data.update(incorrect_format=True)
+
+
+async def on_search_hit(
+    _call: CallbackQuery, _widget: Select[str], dialog_manager: DialogManager, item_id: str
+) -> None:
+    """
+    Open the APOD of the selected search result.
+
+    Args:
+        _call (unused): Callback query from the button press.
+        _widget (unused): Select widget instance.
+        dialog_manager (DialogManager): Dialog manager for state and context.
+        item_id (str): Date of the selected APOD in the format "YYYY-MM-DD".
+    """
+    dialog_manager.dialog_data.update(apod_date=item_id)
+    await dialog_manager.switch_to(APODSG.apod_menu)
+
+
+async def on_next_search_page(_call: CallbackQuery, _widget: Button, dialog_manager: DialogManager) -> None:
+    """
+    Handle the 'next' button press by moving the search results past the last shown hit.
+
+    Args:
+        _call (unused): Callback query from the button press.
+        _widget (unused): Button widget instance.
+        dialog_manager (DialogManager): Dialog manager to update dialog state.
+    """
+    dialog_manager.dialog_data.update(search_after=dialog_manager.dialog_data.pop("search_next", None))
+
+
+async def on_search_back(_call: CallbackQuery, _widget: Button, dialog_manager: DialogManager) -> None:
+    """
+    Handle the 'back' button press by returning to the APOD shown before the search was opened.
+
+    Args:
+        _call (unused): Callback query from the button press.
+        _widget (unused): Button widget instance.
+        dialog_manager (DialogManager): Dialog manager for state and context.
+    """
+    dialog_manager.dialog_data.update(apod_date=dialog_manager.dialog_data.get("shown_apod_date"))
+    await dialog_manager.switch_to(APODSG.apod_menu)
@@ -0,0 +1,323 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, cast
+
+from aiohttp import ClientError, ClientResponse
+from tortoise.fields import CharField
+
+from config import app_settings
+from config.api_settings import APOD_FIRST_DATE, APOD_TIMEZONE
+from config.log_config import logger
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.protocols import ApodProtocol
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.service.apod_other_media_resolver import ApodOtherMediaResolver
+from dialogs.apod.service.explanation_pages import explanation_pages
+from utils.enums.read_model import ReadModel
+from utils.http_client import HttpClient
+from utils.http_client.request_executor import request_executor
+
+
+class ApodArchiveIngestor:
+    """
+    Fills the APOD table from the NASA archive using start_date/end_date range requests.
+
+    The archive is walked in chunks of days. Dates already stored are skipped, texts are
+    translated in batches and new rows are inserted with a single bulk INSERT per chunk.
+    The last completed chunk is written to a checkpoint file, so an interrupted run resumes
+    where it stopped. NASA rate limit headers are respected by pausing before the quota runs out.
+    """
+
+    __apod_url_parts: tuple[str, str] = "planetary", "apod"
+    __apod_fields: tuple[str, ...] = ("title", "date", "explanation", "url", "hdurl", "media_type")
+    __translation_batch_chars: int = 9000
+    __max_attempts: int = 5
+    __apod_crud: ApodCrud = ApodCrud()
+
+    def __init__(
+        self,
+        *,
+        chunk_days: int = 30,
+        request_delay: float = 1.0,
+        min_rate_limit_remaining: int = 5,
+        rate_limit_pause: float = 3600,
+        checkpoint_path: Path | None = None,
+    ) -> None:
+        self.__chunk_days = chunk_days
+        self.__request_delay = request_delay
+        self.__min_rate_limit_remaining = min_rate_limit_remaining
+        self.__rate_limit_pause = rate_limit_pause
+        self.__checkpoint_path = checkpoint_path or Path(app_settings.get_full_temp_path(), "apod_ingest.checkpoint")
+
+    @staticmethod
+    @request_executor()
+    async def __fetch(response: ClientResponse, *_: Any, **__: Any) -> tuple[int, int | None, Any]:
+        """
+        Perform a GET request and return the status, remaining rate limit and parsed JSON.
+
+        Args:
+            response (ClientResponse): Response object from aiohttp session.
+            *_ (unused): Ignored positional arguments.
+            **__ (unused): Ignored keyword arguments.
+
+        Returns:
+            tuple[int, int | None, Any]: Status code, remaining requests (if reported) and JSON body on success.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+
+        return (
+            response.status,
+            int(remaining) if remaining is not None else None,
+            await response.json() if response.status == 200 else None,
+        )
+
+    async def __get_range(self, start_date: date, end_date: date) -> list[dict[str, Any]]:
+        """
+        Fetch APOD entries for the date range, waiting out rate limits and retrying server and network errors.
+
+        Args:
+            start_date (date): First date of the range, inclusive.
+            end_date (date): Last date of the range, inclusive.
+
+        Returns:
+            list[dict[str, Any]]: Raw APOD entries.
+
+        Raises:
+            ValueError: If NASA API rejects the request or keeps failing.
+        """
+        url = app_settings.api.build_nasa_url(
+            *self.__apod_url_parts,
+            api_key=app_settings.api.nasa_api_key,
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+        )
+
+        for attempt in range(self.__max_attempts):
+            try:
+                status, remaining, data = await self.__fetch(url=url)
+            except (ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"NASA API request failed with {e!r}, retrying (attempt {attempt + 1})")
+                await asyncio.sleep(self.__request_delay * 2**attempt)
+                continue
+
+            if status == 200:
+                if remaining is not None and remaining <= self.__min_rate_limit_remaining:
+                    logger.warning(f"NASA API rate limit almost exhausted, pausing for {self.__rate_limit_pause}s")
+                    await asyncio.sleep(self.__rate_limit_pause)
+
+                return data if isinstance(data, list) else [data]
+
+            if status == 429:
+                logger.warning(f"NASA API rate limit exceeded, pausing for {self.__rate_limit_pause}s")
+                await asyncio.sleep(self.__rate_limit_pause)
+            elif status >= 500:
+                logger.warning(f"NASA API responded with {status}, retrying (attempt {attempt + 1})")
+                await asyncio.sleep(self.__request_delay * 2**attempt)
+            else:
+                raise ValueError(f"NASA API responded with {status} for {start_date}..{end_date}")
+
+        raise ValueError(f"Failed to fetch APOD range {start_date}..{end_date}")
+
+    @staticmethod
+    def __clip(field_name: str, value: Any) -> Any:
+        """
+        Clip a string to the length of its ApodModel column.
+
+        Args:
+            field_name (str): Name of the model field.
+            value (Any): Field value.
+
+        Returns:
+            Any: Clipped string, or the value unchanged if the field has no length limit.
+        """
+        field = ApodModel._meta.fields_map[field_name]
+
+        if isinstance(field, CharField) and isinstance(value, str):
+            return value[: field.max_length]
+
+        return value
+
+    @staticmethod
+    def __prepare_row(item: dict[str, Any]) -> dict[str, Any]:
+        """
+        Keep only model fields of a NASA entry, clipping strings to their column length.
+
+        Args:
+            item (dict[str, Any]): Raw APOD entry.
+
+        Returns:
+            dict[str, Any]: Field values for ApodModel.
+        """
+        row: dict[str, Any] = {
+            field_name: ApodArchiveIngestor.__clip(field_name, item.get(field_name))
+            for field_name in ApodArchiveIngestor.__apod_fields
+        }
+        row["url"] = row["url"] or ""
+
+        return row
+
+    @staticmethod
+    async def __resolve_other_media(row: dict[str, Any]) -> None:
+        """
+        Replace the URL and media type of an "other" entry with the media found on its APOD page.
+
+        Args:
+            row (dict[str, Any]): Field values for ApodModel, updated in place.
+        """
+        try:
+            media = await ApodOtherMediaResolver()(row["date"])
+        except Exception:
+            logger.exception(f"Failed to resolve media for {row['date']}")
+            return
+
+        if media:
+            row["url"] = media.url
+            row["media_type"] = media.media_type
+
+    def __split_translation_batches(self, texts: list[str]) -> list[list[str]]:
+        """
+        Split texts into batches that fit the translation API request size.
+
+        Args:
+            texts (list[str]): Texts to translate.
+
+        Returns:
+            list[list[str]]: Batches of texts.
+        """
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_chars = 0
+
+        for text in texts:
+            if batch and batch_chars + len(text) > self.__translation_batch_chars:
+                batches.append(batch)
+                batch, batch_chars = [], 0
+
+            batch.append(text)
+            batch_chars += len(text)
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    async def __translate(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Translate titles and explanations of the rows in batches.
+
+        Args:
+            rows (list[dict[str, Any]]): Field values for ApodModel, updated in place.
+        """
+        texts = [text for row in rows for text in (row["title"], row["explanation"])]
+        translations: list[str] = []
+
+        for batch in self.__split_translation_batches(texts):
+            translations += [item["text"] for item in (await HttpClient.translate(texts=batch))["translations"]]
+
+        for row, title_ru, explanation_ru in zip(rows, translations[::2], translations[1::2], strict=True):
+            row["title_ru"] = self.__clip("title_ru", title_ru)
+            row["explanation_ru"] = explanation_ru
+
+    def __read_checkpoint(self) -> date | None:
+        """
+        Read the last completed date from the checkpoint file.
+
+        Returns:
+            date | None: Last ingested date, or None if there is no checkpoint.
+        """
+        if not self.__checkpoint_path.exists():
+            return None
+
+        return date.fromisoformat(self.__checkpoint_path.read_text().strip())
+
+    def __write_checkpoint(self, completed_date: date) -> None:
+        """
+        Remember the last completed date.
+
+        Args:
+            completed_date (date): Last date of the ingested chunk.
+        """
+        self.__checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__checkpoint_path.write_text(completed_date.isoformat())
+
+    async def __ingest_chunk(self, start_date: date, end_date: date) -> int:
+        """
+        Fetch, translate and store APOD entries missing in the date range and write their static explanation pages.
+
+        Args:
+            start_date (date): First date of the chunk, inclusive.
+            end_date (date): Last date of the chunk, inclusive.
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        stored_dates = await self.__apod_crud.get_dates(start_date, end_date)
+
+        if len(stored_dates) == (end_date - start_date).days + 1:
+            return 0
+
+        items = await self.__get_range(start_date, end_date)
+        await asyncio.sleep(self.__request_delay)
+
+        rows = [self.__prepare_row(item) for item in items if date.fromisoformat(item["date"]) not in stored_dates]
+
+        if not rows:
+            return 0
+
+        for row in rows:
+            if row["media_type"] == "other":
+                await self.__resolve_other_media(row)
+
+        if app_settings.enable_translation:
+            await self.__translate(rows)
+
+        await self.__apod_crud.bulk_create(rows, ignore_conflicts=True)
+
+        if app_settings.enable_explanation_pages:
+            apods = await self.__apod_crud.get_many(
+                date=[row["date"] for row in rows], read_model=ReadModel.RECORD, use_primary=True
+            )
+
+            try:
+                await explanation_pages.write_many(cast(list[ApodProtocol], apods))
+            except OSError:
+                logger.exception(f"Failed to write explanation pages from {start_date} to {end_date}")
+
+        return len(rows)
+
+    async def run(self, start_date: date = APOD_FIRST_DATE, end_date: date | None = None) -> int:
+        """
+        Ingest the archive between the dates, resuming after the checkpoint if there is one.
+
+        Args:
+            start_date (date): First date to ingest, inclusive.
+            end_date (date | None): Last date to ingest, inclusive; today in NASA's timezone if None.
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        today = datetime.now(APOD_TIMEZONE).date()
+        end_date = min(end_date or today, today)
+        checkpoint = self.__read_checkpoint()
+
+        if checkpoint and checkpoint >= start_date:
+            start_date = checkpoint + timedelta(days=1)
+
+        inserted = 0
+        chunk_start = start_date
+
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=self.__chunk_days - 1), end_date)
+
+            chunk_inserted = await self.__ingest_chunk(chunk_start, chunk_end)
+            inserted += chunk_inserted
+
+            # Today's entry may not be published yet, so the current day is never marked as completed
+            self.__write_checkpoint(min(chunk_end, today - timedelta(days=1)))
+
+            logger.info(f"Ingested APOD {chunk_start}..{chunk_end}: {chunk_inserted} new entries")
+
+            chunk_start = chunk_end + timedelta(days=1)
+
+        return inserted
@@ -0,0 +1,209 @@
+import heapq
+import random
+import time
+from datetime import date
+
+from config import app_settings
+from config.api_settings import APOD_FIRST_DATE
+from config.log_config import logger
+from database.postgres.core.CRUD.apod import ApodCrud
+
+
+class DatePool:
+    """
+    Set of dates supporting O(1) insertion, removal and uniform random choice.
+    """
+
+    def __init__(self) -> None:
+        self.__dates: list[date] = []
+        self.__positions: dict[date, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.__dates)
+
+    def __contains__(self, apod_date: object) -> bool:
+        return apod_date in self.__positions
+
+    def add(self, apod_date: date) -> None:
+        """
+        Add a date to the pool.
+
+        Args:
+            apod_date (date): Date to add.
+        """
+        if apod_date in self.__positions:
+            return
+
+        self.__positions[apod_date] = len(self.__dates)
+        self.__dates.append(apod_date)
+
+    def remove(self, apod_date: date) -> None:
+        """
+        Remove a date from the pool by moving the last date into its slot.
+
+        Args:
+            apod_date (date): Date to remove.
+        """
+        position = self.__positions.pop(apod_date, None)
+
+        if position is None:
+            return
+
+        last_date = self.__dates.pop()
+
+        if position < len(self.__dates):
+            self.__dates[position] = last_date
+            self.__positions[last_date] = position
+
+    def choice(self) -> date:
+        """
+        Pick a random date.
+
+        Returns:
+            date: Uniformly chosen date.
+        """
+        return random.choice(self.__dates)
+
+
+class ApodDateIndex:
+    """
+    In-memory index of stored APOD dates used to serve "random picture" without a NASA request.
+
+    Dates whose media is already uploaded to Telegram are kept apart from the rest, and a random
+    pick prefers them, so most random clicks are answered with a stored file_id.
+    Random picks are served from the index only once it covers most of the archive calendar,
+    until then NASA picks the date, so a partly filled index does not repeat the same few dates.
+    Dates whose media fetch is postponed after failures are not picked.
+    The index is loaded from the database on startup and kept up to date as APODs are stored and uploaded.
+    """
+
+    __apod_crud: ApodCrud = ApodCrud()
+
+    def __init__(self, uploaded_ratio: float, min_coverage: float = 0.0) -> None:
+        """
+        Args:
+            uploaded_ratio (float): Share of random picks made among dates with uploaded media.
+            min_coverage (float): Share of the archive calendar the index must cover to serve random picks.
+        """
+        self.__uploaded_ratio = uploaded_ratio
+        self.__min_coverage = min_coverage
+        self.__uploaded = DatePool()
+        self.__pending = DatePool()
+        self.__retry_at: dict[date, int] = {}
+        self.__retry_queue: list[tuple[int, date]] = []
+
+    def __len__(self) -> int:
+        return len(self.__uploaded) + len(self.__pending) + len(self.__retry_at)
+
+    async def load(self) -> None:
+        """
+        Fill the index with all stored APOD dates.
+        """
+        for apod_date, file_id, media_retry_at in await self.__apod_crud.get_date_index():
+            self.add(apod_date, is_uploaded=bool(file_id))
+
+            if media_retry_at and not file_id:
+                self.postpone(apod_date, media_retry_at)
+
+        logger.info(f"APOD date index loaded: {len(self.__uploaded)} uploaded of {len(self)} dates")
+
+    def add(self, apod_date: date, *, is_uploaded: bool) -> None:
+        """
+        Add a stored APOD date.
+
+        Args:
+            apod_date (date): APOD date.
+            is_uploaded (bool): Whether media of the date has a Telegram file_id.
+        """
+        if is_uploaded:
+            self.mark_uploaded(apod_date)
+        elif apod_date not in self.__uploaded and apod_date not in self.__retry_at:
+            self.__pending.add(apod_date)
+
+    def mark_uploaded(self, apod_date: date) -> None:
+        """
+        Record that media of the date has been uploaded to Telegram.
+
+        Args:
+            apod_date (date): APOD date.
+        """
+        self.__retry_at.pop(apod_date, None)
+        self.__pending.remove(apod_date)
+        self.__uploaded.add(apod_date)
+
+    def postpone(self, apod_date: date, retry_at: int) -> None:
+        """
+        Exclude a date without uploaded media from random picks until its media fetch may be retried.
+
+        Args:
+            apod_date (date): APOD date.
+            retry_at (int): Unix timestamp before which the media fetch is not retried.
+        """
+        if apod_date in self.__uploaded:
+            return
+
+        self.__pending.remove(apod_date)
+        self.__retry_at[apod_date] = retry_at
+        heapq.heappush(self.__retry_queue, (retry_at, apod_date))
+
+    def is_postponed(self, apod_date: date) -> bool:
+        """
+        Check whether the date is excluded from random picks.
+
+        Args:
+            apod_date (date): APOD date.
+
+        Returns:
+            bool: True while the retry time of its media fetch has not come.
+        """
+        self.__release_due()
+        return apod_date in self.__retry_at
+
+    def __release_due(self) -> None:
+        """
+        Return dates whose retry time has come to the random picks.
+        """
+        now = time.time()
+
+        while self.__retry_queue and self.__retry_queue[0][0] <= now:
+            retry_at, apod_date = heapq.heappop(self.__retry_queue)
+
+            # Skip queue entries replaced by a later postponement or cleared by an upload
+            if self.__retry_at.get(apod_date) == retry_at:
+                del self.__retry_at[apod_date]
+                self.__pending.add(apod_date)
+
+    def get_coverage(self) -> float:
+        """
+        Share of the archive calendar, from the first APOD to today, held by the index.
+
+        Returns:
+            float: Coverage between 0 and 1.
+        """
+        return len(self) / ((date.today() - APOD_FIRST_DATE).days + 1)
+
+    def random_date(self) -> date | None:
+        """
+        Pick a random stored date, preferring dates with uploaded media and skipping postponed ones.
+
+        Returns:
+            date | None: Random date, or None if the random APOD has to be requested from NASA:
+                the index covers too little of the archive or has only postponed dates.
+        """
+        if self.get_coverage() < self.__min_coverage:
+            return None
+
+        self.__release_due()
+
+        if self.__uploaded and (not self.__pending or random.random() < self.__uploaded_ratio):
+            return self.__uploaded.choice()
+
+        if self.__pending:
+            return self.__pending.choice()
+
+        return None
+
+
+apod_date_index = ApodDateIndex(
+    uploaded_ratio=app_settings.random_uploaded_ratio, min_coverage=app_settings.random_min_coverage
+)
@@ -0,0 +1,191 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+
+from aiogram.enums import ContentType
+from aiogram_dialog import BaseDialogManager
+from aiogram_dialog.api.entities import MediaAttachment
+from yt_dlp import DownloadError
+
+from config import app_settings
+from config.log_config import logger
+from dialogs.apod.service.media_failures import media_failures
+from dialogs.apod.service.video_cache import video_cache
+from dialogs.apod.service.video_downloader import VideoDownloader
+from utils.single_flight import SingleFlight
+
+PLACEHOLDER_PATH = Path(app_settings.resources_path, "Botpic.png")
+
+
+class ApodMediaJobs:
+    """
+    Background video downloads for progressive APOD rendering, at most one per user.
+
+    The APOD window is shown with a placeholder picture while the video is downloaded. When the job
+    finishes, its result is kept for the user and the dialog is re-rendered through its background manager,
+    so the window getter picks the video up and the message media is replaced.
+    A new job or any new interaction of the user cancels the previous job.
+
+    Jobs of several users for the same date share one download, which is cancelled only when all of them are;
+    only the result and the background manager that delivers it are kept per user.
+    """
+
+    def __init__(self) -> None:
+        self.__jobs: dict[int, tuple[str, asyncio.Task[None]]] = {}
+        self.__results: dict[int, tuple[str, MediaAttachment | None]] = {}
+        self.__downloads: SingleFlight[MediaAttachment | None] = SingleFlight(cancel_abandoned=True)
+
+    @staticmethod
+    def get_placeholder() -> MediaAttachment:
+        """
+        Build the picture shown until the video is ready.
+
+        Returns:
+            MediaAttachment: Placeholder picture.
+        """
+        return MediaAttachment(ContentType.PHOTO, path=PLACEHOLDER_PATH)
+
+    @staticmethod
+    def is_placeholder(media: MediaAttachment) -> bool:
+        """
+        Check whether the media is the placeholder picture, whose file_id must not be stored for an APOD.
+
+        Args:
+            media (MediaAttachment): Media to check.
+
+        Returns:
+            bool: True for the placeholder picture.
+        """
+        return media.path is not None and Path(media.path) == PLACEHOLDER_PATH
+
+    def is_running(self, user_id: int, apod_date: str) -> bool:
+        """
+        Check whether the user's video of the date is being downloaded.
+
+        Args:
+            user_id (int): Telegram user ID.
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+
+        Returns:
+            bool: True if the job is in progress.
+        """
+        job = self.__jobs.get(user_id)
+        return job is not None and job[0] == apod_date
+
+    def has_result(self, user_id: int, apod_date: str) -> bool:
+        """
+        Check whether the user's job for the date has finished.
+
+        Args:
+            user_id (int): Telegram user ID.
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+
+        Returns:
+            bool: True if a result is waiting to be shown.
+        """
+        result = self.__results.get(user_id)
+        return result is not None and result[0] == apod_date
+
+    def pop_result(self, user_id: int, apod_date: str) -> MediaAttachment | None:
+        """
+        Take the result of the user's finished job for the date.
+
+        Args:
+            user_id (int): Telegram user ID.
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+
+        Returns:
+            MediaAttachment | None: Downloaded video, or None if it could not be downloaded.
+        """
+        if not self.has_result(user_id, apod_date):
+            return None
+
+        return self.__results.pop(user_id)[1]
+
+    @staticmethod
+    async def __download(apod_date: str, media_url: str) -> MediaAttachment | None:
+        """
+        Download the video of the date, recording a failed download in the negative cache.
+
+        Args:
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+            media_url (str): URL of the video.
+
+        Returns:
+            MediaAttachment | None: Downloaded video, or None if it could not be downloaded.
+        """
+        try:
+            filename = await VideoDownloader.download(media_url)
+        except DownloadError as e:
+            logger.warning(f"Failed to download media from {media_url}")
+            await media_failures.record(date.fromisoformat(apod_date), str(e))
+            return None
+
+        return MediaAttachment(ContentType.VIDEO, path=filename, supports_streaming=True)
+
+    async def __run(self, user_id: int, apod_date: str, media_url: str, bg_manager: BaseDialogManager) -> None:
+        """
+        Wait for the shared download of the date and re-render the user's dialog with the video.
+        A video shared with a download already in flight is pinned for this user too.
+
+        Args:
+            user_id (int): Telegram user ID.
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+            media_url (str): URL of the video.
+            bg_manager (BaseDialogManager): Background manager of the user's APOD dialog.
+        """
+        is_joining = self.__downloads.in_flight(apod_date)
+        media = await self.__downloads.do(apod_date, lambda: self.__download(apod_date, media_url))
+
+        if is_joining and media and media.path:
+            video_cache.hold(str(media.path))
+
+        self.__results[user_id] = apod_date, media
+        await bg_manager.update({"apod_date": apod_date})
+
+    def __forget(self, user_id: int, task: asyncio.Task[None]) -> None:
+        """
+        Remove the finished job and log its failure.
+
+        Args:
+            user_id (int): Telegram user ID.
+            task (asyncio.Task[None]): Finished job task.
+        """
+        if self.__jobs.get(user_id, (None, None))[1] is task:
+            del self.__jobs[user_id]
+
+        if not task.cancelled() and task.exception():
+            logger.error("Progressive media job failed", exc_info=task.exception())
+
+    def start(self, user_id: int, apod_date: str, media_url: str, bg_manager: BaseDialogManager) -> None:
+        """
+        Start downloading a video for the user, cancelling the user's previous job.
+
+        Args:
+            user_id (int): Telegram user ID.
+            apod_date (str): APOD date in the format "YYYY-MM-DD".
+            media_url (str): URL of the video.
+            bg_manager (BaseDialogManager): Background manager of the user's APOD dialog.
+        """
+        self.cancel(user_id)
+
+        task = asyncio.create_task(self.__run(user_id, apod_date, media_url, bg_manager))
+        task.add_done_callback(lambda finished: self.__forget(user_id, finished))
+        self.__jobs[user_id] = apod_date, task
+
+    def cancel(self, user_id: int) -> None:
+        """
+        Cancel the user's job and drop its not shown result.
+
+        Args:
+            user_id (int): Telegram user ID.
+        """
+        self.__results.pop(user_id, None)
+        job = self.__jobs.pop(user_id, None)
+
+        if job:
+            job[1].cancel()
+            logger.debug(f"Progressive media job of {user_id} for {job[0]} cancelled")
+
+
+apod_media_jobs = ApodMediaJobs()
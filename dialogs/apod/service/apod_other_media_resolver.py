@@ -1,43 +1,45 @@
+from dataclasses import dataclass
 from typing import cast
 
 from bs4 import BeautifulSoup
-from bs4.element import AttributeValueList
 from yarl import URL
 
 from config import app_settings
 from utils.http_client import HttpClient
 
 
-class ApodOtherMediaResolver:
+@dataclass(frozen=True, slots=True)
+class ResolvedMedia:
     """
-    Resolves the direct media source and type for "other" type.
+    Media found on an APOD page.
 
-    After calling the instance with a date, properties `src` and `media_type`
-    will contain the extracted media URL and type (e.g., "video").
+    Attributes:
+        url (str): Full URL of the media.
+        media_type (str): Type of the media (e.g., "video").
     """
 
-    __src: str | AttributeValueList | None = None
-    __media_type: str | None = None
-    __date: str | None = None
+    url: str
+    media_type: str
 
-    @property
-    def src(self) -> str | None:
-        if self.__src:
-            return str(self.__src)
 
-        return None
+class ApodOtherMediaResolver:
+    """
+    Resolves the direct media source and type for "other" type.
 
-    @property
-    def media_type(self) -> str | None:
-        return self.__media_type
+    The resolver keeps no state between calls, so a single instance can be shared by concurrent requests.
+    """
 
-    async def __set_media_src(self, url: URL) -> None:
+    @staticmethod
+    async def __get_media(url: URL) -> ResolvedMedia | None:
         """
         Extract media source and type from the APOD HTML page.
 
         Args:
             url (URL): URL of the APOD HTML page to parse.
 
+        Returns:
+            ResolvedMedia | None: Found media, or None if the page has no media source.
+
         Raises:
             ValueError: If source or media type could not be extracted.
         """
@@ -45,31 +47,30 @@ class ApodOtherMediaResolver:
         bs: BeautifulSoup = BeautifulSoup(await HttpClient.get_text(url=str(url)), "html.parser")
         source = bs.source
 
-        if source:
-            src = source.get("src")
+        if not source:
+            return None
 
-            if not src:
-                raise ValueError("Failed to get source url")
+        src = source.get("src")
 
-            self.__src = src
-            media_type, _ = cast(str, source.get("type")).rsplit("/")
+        if not src:
+            raise ValueError("Failed to get source url")
 
-            if not media_type:
-                raise ValueError(f"Failed to get media type ({source.get('type')})")
+        media_type, _ = cast(str, source.get("type")).rsplit("/")
 
-            self.__media_type = media_type
+        if not media_type:
+            raise ValueError(f"Failed to get media type ({source.get('type')})")
 
-    async def __call__(self, apod_date: str):
+        return ResolvedMedia(url=str(app_settings.api.nasa_apod_base_url / str(src)), media_type=media_type)
+
+    async def __call__(self, apod_date: str) -> ResolvedMedia | None:
         """
         Entry point for resolving APOD media from a date string.
 
         Args:
             apod_date (str): Date string in the format "YYYY-MM-DD".
 
-        Side effects:
-            Sets the internal `__src` and `__media_type` properties.
+        Returns:
+            ResolvedMedia | None: Found media, or None if the page has no media source.
         """
-
-        self.__date = apod_date
         full_apod_url = app_settings.api.nasa_apod_base_url / f"ap{apod_date[2:].replace('-', '')}.html"
-        await self.__set_media_src(full_apod_url)
+        return await self.__get_media(full_apod_url)
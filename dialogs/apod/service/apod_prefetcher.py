@@ -0,0 +1,152 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+from aiogram import Bot
+from aiogram.types import FSInputFile, Message
+from aiogram_dialog.api.entities import MediaAttachment
+from aiogram_dialog.manager.message_manager import SEND_METHODS
+
+from config.api_settings import APOD_TIMEZONE
+from config.log_config import logger
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.protocols import ApodProtocol
+from dialogs.apod.getters.apod_menu import ApodProvider
+from dialogs.apod.service.apod_date_index import apod_date_index
+from dialogs.apod.service.video_cache import video_cache
+
+
+class ApodPrefetcher:
+    """
+    Background task that warms up the daily APOD before users request it.
+
+    Shortly after NASA's publication time (midnight US Eastern) it polls for the new APOD,
+    runs the full fetch/translate/store/media pipeline and uploads the media to the storage chat,
+    so the Telegram file_id is already saved when the first user opens the menu.
+    """
+
+    __apod_crud: ApodCrud = ApodCrud()
+
+    def __init__(self, bot: Bot, poll_interval: float, storage_chat_id: int | None) -> None:
+        self.__bot = bot
+        self.__poll_interval = poll_interval
+        self.__storage_chat_id = storage_chat_id
+        self.__provider = ApodProvider()
+        self.__task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def __get_seconds_until_next_publication() -> float:
+        """
+        Compute the delay until the next APOD publication.
+
+        Returns:
+            float: Seconds until the next midnight in NASA's timezone.
+        """
+        now = datetime.now(APOD_TIMEZONE)
+        next_publication = datetime.combine(now.date() + timedelta(days=1), time(), tzinfo=APOD_TIMEZONE)
+
+        return (next_publication - now).total_seconds()
+
+    @staticmethod
+    def __get_file_id(message: Message) -> str:
+        """
+        Extract the file_id of the media sent in the message.
+
+        Args:
+            message (Message): Telegram message containing media.
+
+        Returns:
+            str: Telegram file identifier.
+        """
+        if message.photo:
+            return message.photo[-1].file_id
+
+        return getattr(message, message.content_type).file_id
+
+    async def __upload_media(self, apod: ApodProtocol, media: MediaAttachment) -> None:
+        """
+        Upload media to the storage chat and save the resulting file_id.
+
+        Args:
+            apod (ApodProtocol): Stored APOD entry.
+            media (MediaAttachment): Media to upload.
+        """
+        if media.file_id or self.__storage_chat_id is None:
+            return
+
+        method = getattr(self.__bot, SEND_METHODS[media.type])
+
+        try:
+            message: Message = await method(
+                self.__storage_chat_id,
+                FSInputFile(media.path) if media.path else media.url,
+                caption=apod.date.strftime("%Y-%m-%d"),
+                **media.kwargs,
+            )
+        finally:
+            if media.path:
+                video_cache.release(str(media.path))
+
+        await self.__apod_crud.update_where(filters={"date": apod.date}, file_id=self.__get_file_id(message))
+        apod_date_index.mark_uploaded(apod.date)
+
+    async def prefetch(self, apod_date: date) -> bool:
+        """
+        Load the APOD for the date and pre-upload its media.
+
+        Args:
+            apod_date (date): APOD date.
+
+        Returns:
+            bool: True if the APOD is stored and nothing is left to warm up.
+        """
+        apod, media = await self.__provider.prefetch(apod_date.strftime("%Y-%m-%d"))
+
+        if apod.date != apod_date:
+            return False
+
+        if media:
+            await self.__upload_media(apod, media)
+
+        logger.info(f"APOD for {apod_date} prefetched")
+
+        return True
+
+    async def __run(self) -> None:
+        """
+        Poll for the current APOD until it is warmed up, then sleep until the next publication.
+        """
+        while True:
+            today = datetime.now(APOD_TIMEZONE).date()
+
+            try:
+                is_ready = await self.prefetch(today)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(f"APOD for {today} is not available yet", exc_info=True)
+                is_ready = False
+
+            await asyncio.sleep(self.__get_seconds_until_next_publication() if is_ready else self.__poll_interval)
+
+    def start(self) -> None:
+        """
+        Start the background prefetch task.
+        """
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the background prefetch task.
+        """
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
@@ -0,0 +1,130 @@
+import asyncio
+import os
+from itertools import product
+from pathlib import Path
+from typing import cast
+from uuid import uuid4
+
+from tortoise.utils import chunk
+
+from config import app_settings
+from config.log_config import logger
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.protocols import ApodProtocol
+from utils.enums.read_model import ReadModel
+from utils.explanation import encode_json, get_explanation
+
+LANGUAGE_CODES = ("en", "ru")
+CODING_SUFFIXES = {"identity": "", "gzip": ".gz", "br": ".br"}
+
+
+class ExplanationPages:
+    """
+    Static WebApp explanations written when APOD entries are stored.
+
+    Every APOD gets a `{apod_id}/{language_code}.json` file per language with the same JSON as
+    the /apodExplanation endpoint, next to its precompressed `.gz` and `.br` copies. aiohttp's static
+    route and nginx (gzip_static, brotli_static) serve them without Python or the database.
+
+    Files are written to uniquely named temporary files and renamed over the old ones, so readers
+    never see a partial file and concurrent writers, e.g. the bot and the ingestor, don't collide.
+    """
+
+    __apod_crud: ApodCrud = ApodCrud()
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Args:
+            directory (Path): Directory of the static files.
+        """
+        self.__directory = directory
+
+    def get_path(self, apod_id: int, language_code: str) -> Path:
+        """
+        Get the path of the uncompressed explanation file.
+
+        Args:
+            apod_id (int): ID of the APOD entry.
+            language_code (str): Language code of the texts.
+
+        Returns:
+            Path: Path of the JSON file.
+        """
+        return self.__directory / str(apod_id) / f"{language_code}.json"
+
+    def __write(self, apods: list[ApodProtocol]) -> None:
+        """
+        Write the explanation files of the APODs, skipping languages without a translation.
+
+        Args:
+            apods (list[ApodProtocol]): Stored APOD entries.
+        """
+        for apod, language_code in product(apods, LANGUAGE_CODES):
+            explanation = get_explanation(apod, language_code)
+
+            if None in explanation.values():
+                continue
+
+            path = self.get_path(apod.id, language_code)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            bodies = encode_json(explanation)
+
+            for coding, suffix in CODING_SUFFIXES.items():
+                coding_path = path.with_name(path.name + suffix)
+
+                if coding not in bodies:
+                    coding_path.unlink(missing_ok=True)
+                    continue
+
+                temp_path = coding_path.with_name(f".{coding_path.name}.{os.getpid()}.{uuid4().hex}.tmp")
+
+                try:
+                    temp_path.write_bytes(bodies[coding])
+                    os.replace(temp_path, coding_path)
+                except OSError:
+                    temp_path.unlink(missing_ok=True)
+                    raise
+
+    async def write(self, apod: ApodProtocol) -> None:
+        """
+        Write the explanation files of the APOD without blocking the event loop.
+
+        Args:
+            apod (ApodProtocol): Stored APOD entry.
+        """
+        await asyncio.to_thread(self.__write, [apod])
+
+    async def write_many(self, apods: list[ApodProtocol]) -> None:
+        """
+        Write the explanation files of several APODs in one worker thread.
+
+        Args:
+            apods (list[ApodProtocol]): Stored APOD entries.
+        """
+        await asyncio.to_thread(self.__write, apods)
+
+    async def rebuild(self, batch_size: int | None = None) -> int:
+        """
+        Write the explanation files of every stored APOD.
+
+        Args:
+            batch_size (int | None): Number of APODs loaded at once; the configured batch size if None.
+
+        Returns:
+            int: Number of APODs written.
+        """
+        ids = await self.__apod_crud.get_ids()
+        written = 0
+
+        for ids_batch in chunk(ids, batch_size or app_settings.db.postgres_batch_size):
+            apods = cast(
+                list[ApodProtocol], await self.__apod_crud.get_many(id=list(ids_batch), read_model=ReadModel.RECORD)
+            )
+            await self.write_many(apods)
+            written += len(apods)
+            logger.info(f"Explanation pages written for {written}/{len(ids)} APODs")
+
+        return written
+
+
+explanation_pages = ExplanationPages(app_settings.get_full_explanation_pages_path())
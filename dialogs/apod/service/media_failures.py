@@ -0,0 +1,85 @@
+import time
+from datetime import date
+from typing import cast
+
+from tortoise.expressions import F
+
+from config import app_settings
+from config.log_config import logger
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.protocols import ApodProtocol
+from dialogs.apod.service.apod_date_index import apod_date_index
+from utils.enums.read_model import ReadModel
+
+
+class MediaFailureCache:
+    """
+    Negative cache of APOD media that could not be fetched, kept in the APOD rows.
+
+    Every failure in a row postpones the next attempt twice as long as the previous one,
+    starting from the base TTL and up to the maximum TTL. While an APOD is postponed,
+    its media is reported as unavailable at once instead of running yt-dlp again.
+    Saving a file_id for the APOD resets its failures.
+    """
+
+    __apod_crud: ApodCrud = ApodCrud()
+
+    def __init__(self, ttl: float, max_ttl: float) -> None:
+        """
+        Args:
+            ttl (float): Seconds the first retry is postponed by.
+            max_ttl (float): Longest postponement in seconds.
+        """
+        self.__ttl = ttl
+        self.__max_ttl = max_ttl
+
+    @staticmethod
+    def is_postponed(apod: ApodProtocol) -> bool:
+        """
+        Check whether the APOD media recently failed and must not be fetched yet.
+
+        Args:
+            apod (ApodProtocol): Stored APOD entry.
+
+        Returns:
+            bool: True while the retry time has not come.
+        """
+        return apod.media_retry_at is not None and apod.media_retry_at > time.time()
+
+    async def record(self, apod_date: date, reason: str) -> None:
+        """
+        Record a failed media fetch and postpone the next one, also excluding the date from random picks.
+
+        The failure counter is incremented by the database, so concurrent failures are all counted,
+        and the postponement is computed from the counter read back from the primary.
+
+        Args:
+            apod_date (date): Date of the APOD whose media failed.
+            reason (str): Error message of the failure.
+        """
+        updated = await self.__apod_crud.update_where(
+            filters={"date": apod_date}, media_error=reason[:255], media_failures=F("media_failures") + 1
+        )
+
+        if not updated:
+            return
+
+        apod = cast(
+            ApodProtocol | None,
+            await self.__apod_crud.get(date=apod_date, read_model=ReadModel.RECORD, use_primary=True),
+        )
+
+        if not apod:
+            return
+
+        failures = apod.media_failures
+        ttl = min(self.__ttl * 2 ** (failures - 1), self.__max_ttl)
+
+        retry_at = int(time.time() + ttl)
+
+        await self.__apod_crud.update_where(filters={"date": apod_date}, media_retry_at=retry_at)
+        apod_date_index.postpone(apod_date, retry_at)
+        logger.warning(f"Media of APOD {apod_date} failed {failures} times in a row, next try in {ttl:.0f}s: {reason}")
+
+
+media_failures = MediaFailureCache(app_settings.media_failure_ttl, app_settings.media_failure_max_ttl)
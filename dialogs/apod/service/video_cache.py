@@ -0,0 +1,329 @@
+import asyncio
+import json
+import os
+import shutil
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from typing import Any
+from uuid import uuid4
+
+from config import app_settings
+from config.log_config import logger
+
+
+class VideoCache:
+    """
+    Content-addressed on-disk cache of downloaded videos with a byte-size quota and LRU eviction.
+
+    Files are named by the hash of the source URL and the transcode profile,
+    so a video is downloaded and converted only once per profile.
+    Files and the index are written under a temporary name and renamed, so a crash never leaves
+    a partial file under a cache key. The index keeps sizes and access times in LRU order and is reloaded
+    on restart; files missing from it, such as leftovers of interrupted writes, are removed on load.
+    Cache hits only reorder the index in memory, it is written when files are added or evicted and on shutdown.
+    The index is kept on the event loop, while loading, moving, removing files and writing the index
+    run in worker threads, so large files don't block the bot.
+
+    Every returned file is pinned until `release` is called after it is sent, or until its pin expires.
+    Pins are counted per holder: callers sharing a returned path, e.g. through a single flight, `hold` it
+    too, and the file is not evicted until all of them release it.
+    """
+
+    __index_name = "index.json"
+
+    def __init__(self, directory: Path, max_bytes: int, pin_ttl: float = 600) -> None:
+        """
+        Args:
+            directory (Path): Directory of the cached files and the index.
+            max_bytes (int): Total size of cached files above which the least recently used are evicted.
+            pin_ttl (float): Seconds a returned file is protected from eviction if it is never released.
+        """
+        self.__directory = directory
+        self.__max_bytes = max_bytes
+        self.__pin_ttl = pin_ttl
+        self.__entries: OrderedDict[str, dict[str, Any]] | None = None
+        self.__pins: dict[str, int] = {}
+        self.__pin_expiries: dict[str, float] = {}
+        self.__is_dirty = False
+        self.__lock = asyncio.Lock()
+
+    @staticmethod
+    def get_key(url: str, profile: str) -> str:
+        """
+        Build the cache key of a video.
+
+        Args:
+            url (str): Source URL of the video.
+            profile (str): Identifier of the download and transcode options.
+
+        Returns:
+            str: Hex digest identifying the video in the given profile.
+        """
+        return sha256(f"{profile}\n{url}".encode()).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the cached files in bytes, 0 until the index is loaded.
+        """
+        return sum(entry["size"] for entry in (self.__entries or {}).values())
+
+    async def __get_entries(self) -> OrderedDict[str, dict[str, Any]]:
+        """
+        Return the index, loading it from disk in a worker thread on first use.
+
+        Returns:
+            OrderedDict[str, dict[str, Any]]: Entries by key, from the least to the most recently used.
+        """
+        if self.__entries is None:
+            async with self.__lock:
+                if self.__entries is None:
+                    self.__entries = await asyncio.to_thread(self.__load)
+
+        return self.__entries
+
+    def __load(self) -> OrderedDict[str, dict[str, Any]]:
+        """
+        Read the index and reconcile it with the files in the cache directory.
+
+        Returns:
+            OrderedDict[str, dict[str, Any]]: Entries whose files exist, from the least to the most recently used.
+        """
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        index_path = self.__directory / self.__index_name
+        entries: list[dict[str, Any]] = []
+
+        if index_path.exists():
+            try:
+                entries = json.loads(index_path.read_text())
+            except ValueError:
+                logger.warning(f"Video cache index {index_path} is corrupted, starting empty")
+
+        loaded = OrderedDict(
+            (entry["key"], entry)
+            for entry in sorted(entries, key=lambda entry: entry["last_access"])
+            if (self.__directory / entry["file"]).exists()
+        )
+        known_files = {entry["file"] for entry in loaded.values()} | {self.__index_name}
+
+        for path in self.__directory.iterdir():
+            if path.is_file() and path.name not in known_files:
+                path.unlink(missing_ok=True)
+
+        logger.info(f"Video cache loaded: {len(loaded)} files in {self.__directory}")
+
+        return loaded
+
+    def __write_index(self, data: str) -> None:
+        """
+        Write the serialized index atomically.
+
+        Args:
+            data (str): JSON of the index entries.
+        """
+        temp_path = self.__directory / f".{self.__index_name}.{uuid4().hex}.tmp"
+        temp_path.write_text(data)
+        os.replace(temp_path, self.__directory / self.__index_name)
+
+    async def __save(self) -> None:
+        """
+        Write the index in a worker thread; writes are serialized, so an older index never replaces a newer one.
+        """
+        async with self.__lock:
+            data = json.dumps(list((self.__entries or {}).values()))
+            self.__is_dirty = False
+            await asyncio.to_thread(self.__write_index, data)
+
+    def flush(self) -> None:
+        """
+        Write the index if cache hits changed the order of its entries since it was last written.
+        """
+        if self.__is_dirty:
+            self.__write_index(json.dumps(list((self.__entries or {}).values())))
+            self.__is_dirty = False
+
+    def __pin(self, path: Path) -> str:
+        """
+        Protect a file from eviction until every holder releases it or the pin expires.
+
+        Args:
+            path (Path): Path to the cached file.
+
+        Returns:
+            str: The path as a string.
+        """
+        self.__pins[path.name] = self.__pins.get(path.name, 0) + 1
+        self.__pin_expiries[path.name] = time() + self.__pin_ttl
+        return str(path)
+
+    def hold(self, path: str) -> None:
+        """
+        Pin a file returned by the cache to another caller for one more holder.
+
+        Args:
+            path (str): Path returned by `get` or `put`; other paths are ignored.
+        """
+        if Path(path).parent == self.__directory:
+            self.__pin(Path(path))
+
+    def release(self, path: str) -> None:
+        """
+        Drop one pin of a file returned by the cache once it has been sent;
+        the file may be evicted when its last pin is dropped.
+
+        Args:
+            path (str): Path returned by `get` or `put`; other paths are ignored.
+        """
+        file_name = Path(path).name
+        holders = self.__pins.get(file_name)
+
+        if holders is None:
+            return
+
+        if holders > 1:
+            self.__pins[file_name] = holders - 1
+            return
+
+        del self.__pins[file_name]
+        del self.__pin_expiries[file_name]
+
+    def __is_pinned(self, file_name: str) -> bool:
+        """
+        Check whether a file is protected from eviction, forgetting expired pins.
+
+        Args:
+            file_name (str): Name of the cached file.
+
+        Returns:
+            bool: True if the file may still be read by a send.
+        """
+        if file_name not in self.__pins:
+            return False
+
+        if self.__pin_expiries[file_name] > time():
+            return True
+
+        del self.__pins[file_name]
+        del self.__pin_expiries[file_name]
+        return False
+
+    def __evict(self, entries: OrderedDict[str, dict[str, Any]], keep: str) -> list[str]:
+        """
+        Drop the least recently used entries that are not pinned until the cache fits into its quota.
+
+        Args:
+            entries (OrderedDict[str, dict[str, Any]]): Loaded index.
+            keep (str): Key of the file just added, which is never evicted.
+
+        Returns:
+            list[str]: Names of the files to remove.
+        """
+        total = self.size
+        evicted = []
+
+        for key in [key for key in entries if key != keep]:
+            if total <= self.__max_bytes:
+                break
+
+            if self.__is_pinned(entries[key]["file"]):
+                continue
+
+            entry = entries.pop(key)
+            evicted.append(entry["file"])
+            total -= entry["size"]
+            logger.info(f"Evicted {entry['url']} from the video cache")
+
+        return evicted
+
+    def __move_in(self, source_path: str, file_name: str) -> int:
+        """
+        Move a downloaded file into the cache directory under a temporary name and rename it.
+
+        Args:
+            source_path (str): Path to the downloaded file.
+            file_name (str): Name of the file in the cache.
+
+        Returns:
+            int: Size of the file in bytes.
+        """
+        temp_path = self.__directory / f".{file_name}.{uuid4().hex}.tmp"
+
+        shutil.move(source_path, temp_path)
+        os.replace(temp_path, self.__directory / file_name)
+
+        return (self.__directory / file_name).stat().st_size
+
+    def __remove(self, file_names: list[str]) -> None:
+        """
+        Remove files from the cache directory.
+
+        Args:
+            file_names (list[str]): Names of the files.
+        """
+        for file_name in file_names:
+            (self.__directory / file_name).unlink(missing_ok=True)
+
+    async def get(self, url: str, profile: str) -> str | None:
+        """
+        Find a cached video, mark it as recently used in memory and pin it.
+
+        Args:
+            url (str): Source URL of the video.
+            profile (str): Identifier of the download and transcode options.
+
+        Returns:
+            str | None: Path to the cached file, or None if the video is not cached.
+        """
+        entries = await self.__get_entries()
+        key = self.get_key(url, profile)
+        entry = entries.get(key)
+
+        if not entry:
+            return None
+
+        path = self.__directory / entry["file"]
+
+        if not path.exists():
+            del entries[key]
+            await self.__save()
+            return None
+
+        entry["last_access"] = time()
+        entries.move_to_end(key)
+        self.__is_dirty = True
+
+        return self.__pin(path)
+
+    async def put(self, url: str, profile: str, source_path: str) -> str:
+        """
+        Move a downloaded video into the cache, pin it and evict old files if the quota is exceeded.
+
+        Args:
+            url (str): Source URL of the video.
+            profile (str): Identifier of the download and transcode options.
+            source_path (str): Path to the downloaded file, which is moved.
+
+        Returns:
+            str: Path to the cached file.
+        """
+        entries = await self.__get_entries()
+        key = self.get_key(url, profile)
+        file_name = f"{key}{Path(source_path).suffix}"
+        size = await asyncio.to_thread(self.__move_in, source_path, file_name)
+        path = self.__pin(self.__directory / file_name)
+
+        previous = entries.pop(key, None)
+        removed = [previous["file"]] if previous and previous["file"] != file_name else []
+
+        entries[key] = {"key": key, "file": file_name, "url": url, "size": size, "last_access": time()}
+        removed += self.__evict(entries, keep=key)
+
+        await asyncio.to_thread(self.__remove, removed)
+        await self.__save()
+
+        return path
+
+
+video_cache = VideoCache(app_settings.get_full_video_cache_path(), app_settings.video_cache_max_bytes)
@@ -1,53 +1,231 @@
+import asyncio
+import json
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from hashlib import sha256
 from pathlib import Path
+from typing import Any
+from uuid import uuid4
 
-from yt_dlp import YoutubeDL
+from yt_dlp import DownloadError, YoutubeDL
+from yt_dlp.utils import YoutubeDLError
 
 from config import app_settings
 from config.log_config import logger
+from dialogs.apod.service.video_cache import VideoCache, video_cache
+from dialogs.apod.service.video_transcoder import FFmpegTranscodePP, MediaMetadata, TranscodePlan
+from utils.single_flight import SingleFlight
+
+
+def _download(url: str, ydl_opts: dict[str, Any], size_budget: int) -> str:
+    """
+    Download a video with yt_dlp and prepare it for Telegram. Runs inside a worker of the download pool.
+
+    The source is probed before downloading, so videos that are already H.264/AAC within the size budget
+    are only remuxed, and re-encoded videos target the size budget instead of a fixed quality.
+
+    Args:
+        url (str): The video URL to download.
+        ydl_opts (dict[str, Any]): yt_dlp options including the job output template.
+        size_budget (int): Target file size in bytes.
+
+    Returns:
+        str: Path to the prepared MP4 file.
+
+    Raises:
+        DownloadError: If the download failed. Any yt_dlp error is re-raised as a plain DownloadError,
+            since the original may reference yt_dlp internals that cannot cross process boundaries.
+    """
+    try:
+        with YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+            plan = TranscodePlan.choose(MediaMetadata.probe(ydl, info), size_budget)
+            ydl.add_post_processor(FFmpegTranscodePP(plan))
+            ydl.process_ie_result(info, download=True)
+
+            return str(Path(ydl.prepare_filename(info)).with_suffix(".mp4"))
+    except YoutubeDLError as e:
+        raise DownloadError(str(e)) from None
+
+
+class DownloadJob:
+    """
+    Awaitable handle of a single video download running in the download pool.
+
+    Each job writes into its own output path, so concurrent downloads never overwrite each other.
+    """
+
+    def __init__(self, url: str, output_template: str, future: Future[str]) -> None:
+        self.url = url
+        self.output_template = output_template
+        self.__future = future
+
+    @staticmethod
+    def __remove_orphaned_file(future: Future[str]) -> None:
+        """
+        Delete the file produced by a job whose result is no longer awaited.
+
+        Args:
+            future (Future[str]): Finished job future.
+        """
+        if future.cancelled() or future.exception():
+            return
+
+        Path(future.result()).unlink(missing_ok=True)
+
+    def cancel(self) -> None:
+        """
+        Cancel the job. A queued job is dropped; a running job finishes in the worker and its file is removed.
+        """
+        if self.__future.done():
+            return
+
+        if not self.__future.cancel():
+            self.__future.add_done_callback(self.__remove_orphaned_file)
+
+        logger.info(f"Download of {self.url} cancelled")
+
+    async def wait(self, timeout: float | None = None) -> str:
+        """
+        Wait for the job result.
+
+        Args:
+            timeout (float | None): Seconds to wait before the job is cancelled.
+
+        Returns:
+            str: Path to the downloaded file.
+
+        Raises:
+            DownloadError: If the download failed or timed out.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.__future)), timeout)
+        except TimeoutError as e:
+            self.cancel()
+            raise DownloadError(f"Download of {self.url} timed out after {timeout} seconds") from e
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
 
 
 class VideoDownloader:
     """
-    Downloads and converts videos using yt_dlp with predefined options.
+    Downloads videos using yt_dlp and prepares them for Telegram as cheaply as the source allows.
+
+    Downloads run in a bounded worker pool so that yt_dlp and ffmpeg never block the event loop.
+    Converted videos are kept in the video cache under the URL and the transcode profile,
+    so a video is downloaded again only after it was evicted. Concurrent downloads of the same URL
+    share one job, which is cancelled when none of its callers waits for it any more.
     """
 
     __ydl_opts = {
         "format": "bv*+ba/best[ext=mp4]/best",
-        "outtmpl": str(Path(app_settings.get_full_temp_path(), "%(title)s.%(ext)s")),
-        "recode_video": "mp4",
-        "postprocessor_args": [
-            "-vf",
-            "scale=-2:480",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "veryfast",
-            "-crf",
-            "27",
-            "-c:a",
-            "aac",
-            "-b:a",
-            "128k",
-            "-movflags",
-            "+faststart",
-        ],
         "concurrent_fragment_downloads": 4,
         "quiet": app_settings.suppress_download_logs,
     }
+    __profile = sha256(
+        json.dumps([__ydl_opts["format"], TranscodePlan.get_profile(app_settings.video_size_budget)]).encode()
+    ).hexdigest()
+
+    executor_factory: Callable[..., Executor] = ProcessPoolExecutor
+    cache: VideoCache | None = video_cache
+    __executor: Executor | None = None
+    __single_flight: SingleFlight[str] = SingleFlight(cancel_abandoned=True)
 
-    filename: str | None = None
+    @classmethod
+    def __get_executor(cls) -> Executor:
+        """
+        Return the download pool, creating it on first use.
+
+        Returns:
+            Executor: Pool limited to the configured number of concurrent downloads.
+        """
+        if cls.__executor is None:
+            cls.__executor = cls.executor_factory(max_workers=app_settings.video_download_workers)
+
+        return cls.__executor
+
+    @classmethod
+    def submit(cls, url: str) -> DownloadJob:
+        """
+        Schedule a video download in the worker pool.
+
+        Args:
+            url (str): The video URL to download.
+
+        Returns:
+            DownloadJob: Handle to await or cancel the download.
+        """
+        output_template = str(Path(app_settings.get_full_temp_path(), f"{uuid4().hex}.%(ext)s"))
+        future = cls.__get_executor().submit(
+            _download, url, cls.__ydl_opts | {"outtmpl": output_template}, app_settings.video_size_budget
+        )
+
+        return DownloadJob(url, output_template, future)
 
     @classmethod
-    def download(cls, url: str):
+    async def download(cls, url: str, timeout: float | None = None) -> str:
         """
-        Download and convert a video from the given URL using yt_dlp.
+        Download and convert a video from the given URL without blocking the event loop, or take it from the cache.
+        A cached file shared with a download already in flight is pinned for this caller too,
+        so every caller releases the file it gets once it is sent.
 
         Args:
             url (str): The video URL to download.
+            timeout (float | None): Seconds to wait; defaults to the configured download timeout.
+                A shared download keeps the timeout of the caller that started it.
+
+        Returns:
+            str: Path to the downloaded file.
+
+        Raises:
+            DownloadError: If the download failed or timed out.
+        """
+        is_joining = cls.__single_flight.in_flight(url)
+        filename = await cls.__single_flight.do(url, lambda: cls.__download(url, timeout))
+
+        if is_joining and cls.cache:
+            cls.cache.hold(filename)
+
+        return filename
+
+    @classmethod
+    async def __download(cls, url: str, timeout: float | None) -> str:
+        """
+        Take a video from the cache, or download, convert and cache it.
+
+        Args:
+            url (str): The video URL to download.
+            timeout (float | None): Seconds to wait; defaults to the configured download timeout.
+
+        Returns:
+            str: Path to the downloaded file.
+        """
+        if cls.cache:
+            cached_filename = await cls.cache.get(url, cls.__profile)
+
+            if cached_filename:
+                logger.info(f"Taken from the video cache: {cached_filename}")
+                return cached_filename
+
+        job = cls.submit(url)
+        filename = await job.wait(app_settings.video_download_timeout if timeout is None else timeout)
+
+        if cls.cache:
+            filename = await cls.cache.put(url, cls.__profile, filename)
+
+        logger.info(f"Saved to: {filename}")
+
+        return filename
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stop the worker pool, dropping queued downloads, and write the video cache index.
         """
+        if cls.cache:
+            cls.cache.flush()
 
-        with YoutubeDL(cls.__ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            filename = ydl.prepare_filename(info)
-            cls.filename = filename
-            logger.info(f"Saved to: {filename}")
+        if cls.__executor is not None:
+            cls.__executor.shutdown(wait=False, cancel_futures=True)
+            cls.__executor = None
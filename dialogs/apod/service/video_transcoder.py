@@ -0,0 +1,253 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from yt_dlp import YoutubeDL
+from yt_dlp.postprocessor import FFmpegPostProcessor
+from yt_dlp.utils import PostProcessingError
+
+from utils.enums.transcode_mode import TranscodeMode
+
+MAX_HEIGHT = 480
+CRF = 27
+AUDIO_BITRATE = 128
+MIN_VIDEO_BITRATE = 300
+MAX_VIDEO_BITRATE = 2500
+CONTAINER_OVERHEAD = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class MediaMetadata:
+    """
+    Properties of a source video relevant for choosing how to transcode it.
+
+    Attributes:
+        vcodec (str | None): Video codec, or None if unknown.
+        acodec (str | None): Audio codec, "none" if there is no audio, or None if unknown.
+        height (int | None): Frame height in pixels.
+        duration (float | None): Duration in seconds.
+        size (int | None): File size in bytes.
+    """
+
+    vcodec: str | None = None
+    acodec: str | None = None
+    height: int | None = None
+    duration: float | None = None
+    size: int | None = None
+
+    @classmethod
+    def from_info(cls, info: dict[str, Any]) -> "MediaMetadata":
+        """
+        Read metadata of the selected format from a yt_dlp info dict.
+
+        Args:
+            info (dict[str, Any]): Info dict returned by yt_dlp without downloading.
+
+        Returns:
+            MediaMetadata: Known properties of the source.
+        """
+        return cls(
+            vcodec=info.get("vcodec"),
+            acodec=info.get("acodec"),
+            height=info.get("height"),
+            duration=info.get("duration"),
+            size=info.get("filesize") or info.get("filesize_approx"),
+        )
+
+    @classmethod
+    def from_ffprobe(cls, data: dict[str, Any]) -> "MediaMetadata":
+        """
+        Read metadata from ffprobe JSON output.
+
+        Args:
+            data (dict[str, Any]): Output of ffprobe with -show_format and -show_streams.
+
+        Returns:
+            MediaMetadata: Known properties of the source.
+        """
+        streams = data.get("streams", [])
+        video: dict[str, Any] = next((stream for stream in streams if stream.get("codec_type") == "video"), {})
+        audio = next((stream for stream in streams if stream.get("codec_type") == "audio"), None)
+        media_format = data.get("format", {})
+
+        return cls(
+            vcodec=video.get("codec_name"),
+            acodec=audio.get("codec_name") if audio else "none",
+            height=video.get("height"),
+            duration=float(media_format["duration"]) if media_format.get("duration") else None,
+            size=int(media_format["size"]) if media_format.get("size") else None,
+        )
+
+    @classmethod
+    def probe(cls, ydl: YoutubeDL, info: dict[str, Any]) -> "MediaMetadata":
+        """
+        Get metadata from yt_dlp format data, probing the source with ffprobe if the codecs are unknown.
+        Direct video links, as on the NASA site, usually come without codec data.
+
+        Args:
+            ydl (YoutubeDL): Downloader the info was extracted with.
+            info (dict[str, Any]): Info dict returned by yt_dlp without downloading.
+
+        Returns:
+            MediaMetadata: Known properties of the source.
+        """
+        metadata = cls.from_info(info)
+        url = info.get("url")
+
+        if metadata.vcodec or not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            return metadata
+
+        try:
+            return cls.from_ffprobe(FFmpegPostProcessor(ydl).get_metadata_object(url))
+        except (PostProcessingError, OSError, ValueError):
+            return metadata
+
+
+@dataclass(frozen=True, slots=True)
+class TranscodePlan:
+    """
+    Chosen way of preparing a video for Telegram.
+
+    Attributes:
+        mode (TranscodeMode): Whether streams are copied or re-encoded.
+        video_bitrate (int | None): Target video bitrate in kbit/s, or None for constant quality.
+    """
+
+    mode: TranscodeMode
+    video_bitrate: int | None = None
+
+    @staticmethod
+    def get_profile(size_budget: int) -> str:
+        """
+        Describe the transcoding settings, so results of different settings are cached separately.
+
+        Args:
+            size_budget (int): Target file size in bytes.
+
+        Returns:
+            str: Profile identifier.
+        """
+        return f"h264-{MAX_HEIGHT}p-crf{CRF}-max{MAX_VIDEO_BITRATE}k-aac{AUDIO_BITRATE}k-{size_budget}b"
+
+    @staticmethod
+    def __get_video_bitrate(metadata: MediaMetadata, size_budget: int) -> int | None:
+        """
+        Calculate the video bitrate that fits the whole video into the size budget.
+
+        Args:
+            metadata (MediaMetadata): Source properties.
+            size_budget (int): Target file size in bytes.
+
+        Returns:
+            int | None: Bitrate in kbit/s, or None if constant quality already fits or the duration is unknown.
+        """
+        if not metadata.duration:
+            return None
+
+        total_bitrate = size_budget * 8 * (1 - CONTAINER_OVERHEAD) / metadata.duration / 1000
+        video_bitrate = int(total_bitrate) - AUDIO_BITRATE
+
+        if video_bitrate >= MAX_VIDEO_BITRATE:
+            return None
+
+        return max(video_bitrate, MIN_VIDEO_BITRATE)
+
+    @classmethod
+    def choose(cls, metadata: MediaMetadata, size_budget: int) -> "TranscodePlan":
+        """
+        Choose the cheapest preparation that gives a Telegram-playable MP4 within the size budget.
+
+        H.264 video with AAC or no audio that already fits the budget is only remuxed.
+        Other H.264 video keeps its audio and only the video is re-encoded; anything else is fully re-encoded.
+
+        Args:
+            metadata (MediaMetadata): Source properties.
+            size_budget (int): Target file size in bytes.
+
+        Returns:
+            TranscodePlan: Chosen plan.
+        """
+        is_h264 = (metadata.vcodec or "").startswith(("avc1", "h264"))
+        is_aac = metadata.acodec == "none" or (metadata.acodec or "").startswith(("mp4a", "aac"))
+
+        if is_h264 and is_aac and metadata.size is not None and metadata.size <= size_budget:
+            return cls(TranscodeMode.REMUX)
+
+        mode = TranscodeMode.SCALE if is_h264 and is_aac else TranscodeMode.ENCODE
+
+        return cls(mode, cls.__get_video_bitrate(metadata, size_budget))
+
+    def get_ffmpeg_args(self) -> list[str]:
+        """
+        Build ffmpeg output options for the plan.
+
+        Returns:
+            list[str]: Output options.
+        """
+        if self.mode == TranscodeMode.REMUX:
+            return ["-c", "copy", "-movflags", "+faststart"]
+
+        if self.video_bitrate:
+            rate_args = [
+                "-b:v",
+                f"{self.video_bitrate}k",
+                "-maxrate",
+                f"{self.video_bitrate}k",
+                "-bufsize",
+                f"{self.video_bitrate * 2}k",
+            ]
+        else:
+            rate_args = ["-crf", str(CRF)]
+
+        if self.mode == TranscodeMode.SCALE:
+            audio_args = ["-c:a", "copy"]
+        else:
+            audio_args = ["-c:a", "aac", "-b:a", f"{AUDIO_BITRATE}k"]
+
+        return [
+            "-vf",
+            f"scale=-2:'min({MAX_HEIGHT},ih)'",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            *rate_args,
+            *audio_args,
+            "-movflags",
+            "+faststart",
+        ]
+
+
+class FFmpegTranscodePP(FFmpegPostProcessor):
+    """
+    yt_dlp post-processor preparing the downloaded video according to a transcode plan.
+
+    Unlike the built-in converter, it also runs when the source is already an MP4.
+    """
+
+    def __init__(self, plan: TranscodePlan, downloader: YoutubeDL | None = None) -> None:
+        super().__init__(downloader)
+        self.__plan = plan
+
+    def run(self, info: dict[str, Any]) -> tuple[list[str], dict[str, Any]]:
+        """
+        Transcode the downloaded file into an MP4 next to it.
+
+        Args:
+            info (dict[str, Any]): Info dict of the downloaded video.
+
+        Returns:
+            tuple[list[str], dict[str, Any]]: Files to delete and the updated info dict.
+        """
+        source = info["filepath"]
+        target = str(Path(source).with_suffix(".mp4"))
+        temp = str(Path(source).with_suffix(".transcoding.mp4"))
+
+        self.to_screen(f"Preparing video ({self.__plan.mode}); Destination: {target}")
+        self.run_ffmpeg(source, temp, self.__plan.get_ffmpeg_args())
+        os.replace(temp, target)
+
+        info["filepath"], info["ext"] = target, "mp4"
+
+        return ([source] if source != target else []), info
@@ -15,6 +15,7 @@ Dialog window displaying the Astronomy Picture of the Day (APOD).
 
 Includes media preview, caption, and buttons for:
 - Selecting a specific date
+- Searching pictures by title and explanation
 - Requesting a random picture
 - Opening a WebApp with explanation
 - Returning to the main menu
@@ -26,10 +27,17 @@ apod_menu = Window(
     DynamicMedia("resources", when=~F["media_not_exist_message"]),
     Format("{apod_caption}", when=~F["media_not_exist_message"]),
     Format("{media_not_exist_message}", when=F["media_not_exist_message"]),
-    SwitchTo(
-        Format("{select_date_button_text}"),
-        state=APODSG.apod_date_selection,
-        id="apod_date_selection",
+    Row(
+        SwitchTo(
+            Format("{select_date_button_text}"),
+            state=APODSG.apod_date_selection,
+            id="apod_date_selection",
+        ),
+        SwitchTo(
+            Format("{search_button_text}"),
+            state=APODSG.apod_search,
+            id="apod_search",
+        ),
     ),
     Button(Format("{random_picture_button_text}"), on_click=on_random_apod, id="random_apod"),
     Row(
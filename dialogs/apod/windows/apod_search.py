@@ -0,0 +1,56 @@
+from operator import itemgetter
+
+from aiogram import F
+from aiogram.enums import ContentType
+from aiogram_dialog import Window
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Column, Select
+from aiogram_dialog.widgets.text import Format
+
+from dialogs.apod.getters.apod_search import getter
+from dialogs.apod.handlers.apod_search import (
+    handle_invalid_search_input,
+    handle_search_query,
+    on_next_search_page,
+    on_search_back,
+    on_search_hit,
+)
+from states.states import APODSG
+
+"""
+Dialog window for full-text search of APODs by title and explanation.
+
+Displays localized request prompt, results as buttons opening the selected APOD
+and a button for the next page of results. Any text message starts a new search.
+The back button returns to the APOD the search was opened from.
+
+State:
+    APODSG.apod_search
+"""
+apod_search = Window(
+    Format("{incorrect_format_message}" + "\n\n", when=F["incorrect_format_message"]),
+    Format("{nothing_found_message}" + "\n\n", when=F["nothing_found_message"]),
+    Format("{search_results}", when=F["search_results"]),
+    Format("{search_request}", when=~F["search_results"]),
+    Column(
+        Select(
+            Format("{item[1]}"),
+            id="apod_search_hits",
+            item_id_getter=itemgetter(0),
+            items="hits",
+            on_click=on_search_hit,
+        ),
+    ),
+    Button(Format("{next_page_button_text}"), id="apod_search_next", on_click=on_next_search_page, when=F["has_next"]),
+    MessageInput(
+        content_types=ContentType.TEXT,
+        func=handle_search_query,
+    ),
+    MessageInput(
+        content_types=ContentType.ANY,
+        func=handle_invalid_search_input,
+    ),
+    Button(Format("{back_button_text}"), id="apod_search_back", on_click=on_search_back),
+    getter=getter,
+    state=APODSG.apod_search,
+)
@@ -20,6 +20,16 @@ date_request =
     Minimum date `06/16/1995`
     Maximum date `{ $max_date }`
 
+search = Search 🔎
+
+search_request = Send words to find pictures by their title and explanation, for example: saturn rings
+
+search_results = Pictures found for «{ $query }»:
+
+nothing_found = 🔭 Nothing found for «{ $query }»
+
+next_page = Next ▶️
+
 incorrect_date = ⚠️ Incorrect date
 
 incorrect_format = ⚠️ Incorrect format
@@ -20,6 +20,16 @@ date_request =
     Минимальная дата `16.06.1995`
     Максимальная дата `{ $max_date }`
 
+search = Поиск 🔎
+
+search_request = Отправьте слова для поиска картинок по названию и описанию, например: кольца сатурна
+
+search_results = Картинки по запросу «{ $query }»:
+
+nothing_found = 🔭 По запросу «{ $query }» ничего не найдено
+
+next_page = Далее ▶️
+
 incorrect_date = ⚠️ Некорректная дата
 
 incorrect_format = ⚠️ Некорректный формат
@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 from aiogram import Bot, Dispatcher, F
 from aiogram.filters import CommandStart
@@ -9,23 +10,31 @@ from aiogram_dialog import DialogManager, StartMode, setup_dialogs
 from aiogram_dialog.context.media_storage import MediaIdStorage
 from aiohttp import web
 from fluentogram import TranslatorHub
-from tortoise import Tortoise
 
 from config import app_settings
 from config.log_config import logger
 from database.postgres.core import init_db
+from database.postgres.core.pool import warm_up_pools
+from database.postgres.core.schema_version import check_schema_version
 from database.redis import storage
 from dialogs import apod_dialog, error_dialog, info_dialog, main_menu_dialog
+from dialogs.apod.service.apod_date_index import apod_date_index
+from dialogs.apod.service.apod_prefetcher import ApodPrefetcher
+from dialogs.apod.service.video_downloader import VideoDownloader
 from states.states import InfoSG, MainMenuSG
 from utils.create_translator_hub import create_translator_hub
 from utils.custom_dialog_manager import CustomDialogManager
 from utils.custom_message_manager import CustomMessageManager
+from utils.http_client import SessionRegistry
 from utils.middlewares.i18n import TranslatorRunnerMiddleware
+from utils.middlewares.media_job_cancellation import MediaJobCancellationMiddleware
 from utils.middlewares.user_activity_registration import UserActivityRegistrationMiddleware
-from web_app_api.app import apod_explanation
+from utils.user_activity_buffer import user_activity_buffer
+from web_app_api.app import apod_explanation, database_pool_stats, search
 
 bot = Bot(app_settings.token)
 dp = Dispatcher(bot=bot, storage=storage)
+apod_prefetcher = ApodPrefetcher(bot, app_settings.prefetch_poll_interval, app_settings.storage_chat_id)
 
 
 @dp.message(CommandStart())
@@ -54,9 +63,17 @@ async def info_handler(_message: Message, dialog_manager: DialogManager) -> None
 
 async def on_startup() -> None:
     """
-    Executed when the bot starts. Logs the startup event. Initializes database. Sets webhook if it enabled.
+    Executed when the bot starts. Logs the startup event. Initializes database and warms up its pools,
+    HTTP session and APOD date index. Starts user activity flushing, APOD prefetch and sets webhook if they are enabled.
     """
     await setup_database()
+    await warm_up_pools()
+    await apod_date_index.load()
+    await SessionRegistry.start()
+    user_activity_buffer.start()
+
+    if app_settings.enable_prefetch:
+        apod_prefetcher.start()
 
     if app_settings.api.is_webhook_enabled:
         await bot.set_webhook(
@@ -68,8 +85,13 @@ async def on_startup() -> None:
 
 async def on_shutdown() -> None:
     """
-    Executed when the bot stops. Logs the shutdown event.
+    Executed when the bot stops. Stops APOD prefetch, flushes buffered user activity,
+    closes HTTP session and video download pool. Logs the shutdown event.
     """
+    await apod_prefetcher.stop()
+    await user_activity_buffer.stop()
+    await SessionRegistry.close()
+    VideoDownloader.shutdown()
     logger.warning("Bot stopped")
 
 
@@ -81,10 +103,24 @@ def get_webhook_app(i18n_hub: TranslatorHub) -> web.Application:
         i18n_hub (TranslatorHub): Instance managing translation logic and middleware.
 
     Returns:
-        web.Application: Configured aiohttp app with routes and webhook support.
+        web.Application: Configured aiohttp app with routes, the monitoring route and static explanation pages
+            if enabled and webhook support.
     """
     app = web.Application()
-    app.add_routes([web.get("/apodExplanation", apod_explanation)])
+    app.add_routes(
+        [
+            web.get("/apodExplanation", apod_explanation),
+            web.get("/search", search),
+        ]
+    )
+
+    if app_settings.monitoring_token:
+        app.router.add_get("/databasePoolStats", database_pool_stats)
+
+    if app_settings.enable_explanation_pages:
+        explanation_pages_path = app_settings.get_full_explanation_pages_path()
+        explanation_pages_path.mkdir(parents=True, exist_ok=True)
+        app.router.add_static("/explanations", explanation_pages_path)
 
     webhook_requests_handler = SimpleRequestHandler(
         dispatcher=dp,
@@ -101,10 +137,13 @@ def get_webhook_app(i18n_hub: TranslatorHub) -> web.Application:
 
 async def setup_database() -> None:
     """
-    Initialize and apply database schema using Tortoise ORM.
+    Initialize Tortoise ORM and check that the database schema is migrated.
+    Migrations are applied separately with `python cli.py migrate`.
     """
+    started = time.perf_counter()
     await init_db()
-    await Tortoise.generate_schemas()
+    await check_schema_version()
+    logger.info(f"Database initialized in {time.perf_counter() - started:.3f}s")
 
 
 def get_translator_hub() -> TranslatorHub:
@@ -117,6 +156,7 @@ def get_translator_hub() -> TranslatorHub:
     i18n_hub: TranslatorHub = create_translator_hub()
     dp.update.middleware(TranslatorRunnerMiddleware())
     dp.update.middleware(UserActivityRegistrationMiddleware())
+    dp.update.middleware(MediaJobCancellationMiddleware())
 
     return i18n_hub
 
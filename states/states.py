@@ -16,3 +16,4 @@ class MainMenuSG(StatesGroup):
 class APODSG(StatesGroup):
     apod_menu = State()
     apod_date_selection = State()
+    apod_search = State()
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import ClientConnectionError
+from yarl import URL
+
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.service.apod_archive_ingestor import ApodArchiveIngestor
+
+FETCH_TARGET = "dialogs.apod.service.apod_archive_ingestor.ApodArchiveIngestor._ApodArchiveIngestor__fetch"
+
+
+class TestArchiveIngestor:
+    @staticmethod
+    async def _fetch(url: URL) -> tuple[int, int, list[dict[str, str]]]:
+        start_date = date.fromisoformat(url.query["start_date"])
+        end_date = date.fromisoformat(url.query["end_date"])
+        days = (end_date - start_date).days + 1
+
+        return (
+            200,
+            100,
+            [
+                {
+                    "date": (start_date + timedelta(days=offset)).isoformat(),
+                    "title": f"Title {start_date + timedelta(days=offset)}",
+                    "explanation": "Explanation",
+                    "media_type": "image",
+                    "url": "https://apod.nasa.gov/fake.jpg",
+                    "copyright": "Author",
+                    "service_version": "v1",
+                }
+                for offset in range(days)
+            ],
+        )
+
+    @staticmethod
+    async def _translate(*, texts: list[str]) -> dict[str, list[dict[str, str]]]:
+        return {"translations": [{"text": f"ru: {text}"} for text in texts]}
+
+    @patch("utils.http_client.HttpClient.translate")
+    @patch(FETCH_TARGET)
+    @pytest.mark.asyncio
+    async def test_ingests_range_in_chunks(
+        self, mock_fetch: AsyncMock, mock_translate: AsyncMock, tmp_path: Path
+    ) -> None:
+        mock_fetch.side_effect = self._fetch
+        mock_translate.side_effect = self._translate
+        await ApodModel.create(
+            date="2020-01-02",
+            title="Stored",
+            explanation="Stored",
+            url="https://apod.nasa.gov/s.jpg",
+            media_type="image",
+        )
+
+        ingestor = ApodArchiveIngestor(chunk_days=3, request_delay=0, checkpoint_path=tmp_path / "checkpoint")
+        inserted = await ingestor.run(date(2020, 1, 1), date(2020, 1, 7))
+
+        assert inserted == 6
+        assert mock_fetch.await_count == 3
+        assert await ApodModel.filter(date__range=(date(2020, 1, 1), date(2020, 1, 7))).count() == 7
+
+        apod = await ApodModel.get(date="2020-01-05")
+
+        assert apod.title_ru == "ru: Title 2020-01-05"
+        assert apod.explanation_ru == "ru: Explanation"
+        assert (await ApodModel.get(date="2020-01-02")).title == "Stored"
+
+    @patch("utils.http_client.HttpClient.translate")
+    @patch(FETCH_TARGET)
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(
+        self, mock_fetch: AsyncMock, mock_translate: AsyncMock, tmp_path: Path
+    ) -> None:
+        mock_fetch.side_effect = self._fetch
+        mock_translate.side_effect = self._translate
+        checkpoint_path = tmp_path / "checkpoint"
+        checkpoint_path.write_text("2020-01-04")
+
+        ingestor = ApodArchiveIngestor(chunk_days=10, request_delay=0, checkpoint_path=checkpoint_path)
+        inserted = await ingestor.run(date(2020, 1, 1), date(2020, 1, 7))
+
+        assert inserted == 3
+        assert await ApodModel.filter(date__lte=date(2020, 1, 4)).count() == 0
+        assert checkpoint_path.read_text() == "2020-01-07"
+
+    @patch("dialogs.apod.service.apod_archive_ingestor.asyncio.sleep")
+    @patch(FETCH_TARGET)
+    @pytest.mark.asyncio
+    async def test_waits_out_rate_limit(self, mock_fetch: AsyncMock, mock_sleep: AsyncMock, tmp_path: Path) -> None:
+        responses: list[Any] = [(429, 0, None), await self._fetch(URL("?start_date=2020-01-01&end_date=2020-01-01"))]
+        mock_fetch.side_effect = responses
+
+        with patch("dialogs.apod.service.apod_archive_ingestor.app_settings.enable_translation", False):
+            ingestor = ApodArchiveIngestor(request_delay=0, rate_limit_pause=60, checkpoint_path=tmp_path / "c")
+            inserted = await ingestor.run(date(2020, 1, 1), date(2020, 1, 1))
+
+        assert inserted == 1
+        assert mock_fetch.await_count == 2
+        mock_sleep.assert_any_await(60)
+
+    @patch("dialogs.apod.service.apod_archive_ingestor.asyncio.sleep")
+    @patch(FETCH_TARGET)
+    @pytest.mark.asyncio
+    async def test_retries_network_errors(self, mock_fetch: AsyncMock, mock_sleep: AsyncMock, tmp_path: Path) -> None:
+        responses: list[Any] = [
+            ClientConnectionError("Connection reset by peer"),
+            asyncio.TimeoutError(),
+            await self._fetch(URL("?start_date=2020-01-01&end_date=2020-01-01")),
+        ]
+        mock_fetch.side_effect = responses
+
+        with patch("dialogs.apod.service.apod_archive_ingestor.app_settings.enable_translation", False):
+            ingestor = ApodArchiveIngestor(request_delay=1, checkpoint_path=tmp_path / "c")
+            inserted = await ingestor.run(date(2020, 1, 1), date(2020, 1, 1))
+
+        assert inserted == 1
+        assert mock_fetch.await_count == 3
+        mock_sleep.assert_any_await(1)
+        mock_sleep.assert_any_await(2)
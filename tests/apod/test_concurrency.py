@@ -0,0 +1,114 @@
+import asyncio
+import random
+from datetime import date, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.types import User
+from aiogram_dialog import DialogManager
+from fluentogram import TranslatorHub
+from yarl import URL
+
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.getters.apod_menu import ApodProvider
+from dialogs.apod.service.chat_action_sender import ChatActionSender
+from tests.moks import BotMock
+from tests.utils.factories.dialog_manager_factory import DialogManagerFactory
+
+RENDERS_COUNT = 40
+FIRST_DATE = date(2024, 1, 1)
+
+
+class TestConcurrency:
+    @staticmethod
+    async def _get_json(*, url: URL) -> dict[str, str]:
+        apod_date = url.query["date"]
+        is_video = date.fromisoformat(apod_date).day % 2 == 0
+        await asyncio.sleep(random.uniform(0, 0.02))
+
+        return {
+            "date": apod_date,
+            "title": f"Title {apod_date}",
+            "explanation": f"Explanation {apod_date}",
+            "media_type": "other" if is_video else "image",
+            "url": f"https://apod.nasa.gov/{apod_date}.jpg",
+        }
+
+    @staticmethod
+    async def _translate(*, texts: list[str]) -> dict[str, list[dict[str, str]]]:
+        await asyncio.sleep(random.uniform(0, 0.02))
+
+        return {"translations": [{"text": f"ru {text}"} for text in texts]}
+
+    @staticmethod
+    async def _get_text(*, url: str) -> str:
+        page_date = URL(url).name.removeprefix("ap").removesuffix(".html")
+        await asyncio.sleep(random.uniform(0, 0.02))
+
+        return f'<video><source src="video-{page_date}.mp4" type="video/mp4"></video>'
+
+    @patch("dialogs.apod.getters.apod_menu.ChatActionSender")
+    @patch("dialogs.apod.service.video_downloader.YoutubeDL")
+    @patch("dialogs.apod.service.apod_other_media_resolver.HttpClient.get_text")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    @pytest.mark.asyncio
+    async def test_concurrent_renders_of_different_dates(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_get_text: AsyncMock,
+        mock_yt_dlp: MagicMock,
+        mock_chat_action_sender: MagicMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        mock_get.side_effect = self._get_json
+        mock_translate.side_effect = self._translate
+        mock_get_text.side_effect = self._get_text
+        mock_ydl_instance = mock_yt_dlp.return_value.__enter__.return_value
+        mock_ydl_instance.extract_info.side_effect = lambda url, download: {"url": url}
+        mock_ydl_instance.prepare_filename.side_effect = lambda info: URL(info["url"]).name
+
+        chat_action_senders: dict[int, MagicMock] = {}
+
+        def create_chat_action_sender(chat_id: int, bot: BotMock) -> MagicMock:
+            assert bot is bot_mock
+            chat_action_senders[chat_id] = MagicMock(spec=ChatActionSender, send_chat_action=AsyncMock())
+            return chat_action_senders[chat_id]
+
+        mock_chat_action_sender.side_effect = create_chat_action_sender
+
+        apod_dates = [FIRST_DATE + timedelta(days=offset) for offset in range(RENDERS_COUNT)]
+        languages = ["ru" if offset % 3 else "en" for offset in range(RENDERS_COUNT)]
+        provider = ApodProvider()
+
+        results = await asyncio.gather(
+            *(
+                provider(
+                    cast(DialogManager, DialogManagerFactory({"apod_date": apod_date.isoformat()}).dialog_manager),
+                    i18n=translator_hub.get_translator_by_locale(language_code),
+                    language_code=language_code,
+                    bot=bot_mock,
+                    event_from_user=User(id=offset, first_name="Name", is_bot=False),
+                )
+                for offset, (apod_date, language_code) in enumerate(zip(apod_dates, languages, strict=True))
+            )
+        )
+
+        assert await ApodModel.all().count() == RENDERS_COUNT
+
+        for offset, (result, apod_date, language_code) in enumerate(zip(results, apod_dates, languages, strict=True)):
+            title = f"Title {apod_date}"
+            media = result["resources"]
+
+            assert result["language_code"] == language_code
+            assert (f"ru {title}" if language_code == "ru" else title) in result["apod_caption"]
+
+            if apod_date.day % 2 == 0:
+                assert media.path == f"video-{apod_date:%y%m%d}.mp4"
+                chat_action_senders[offset].send_chat_action.assert_awaited_once_with("video")
+            else:
+                assert media.url == f"https://apod.nasa.gov/{apod_date}.jpg"
+                chat_action_senders[offset].send_chat_action.assert_awaited_once_with("image")
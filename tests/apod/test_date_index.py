@@ -0,0 +1,131 @@
+import time
+from datetime import date, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiogram.types import User
+from aiogram_dialog import DialogManager
+from fluentogram import TranslatorHub
+
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.getters.apod_menu import ApodProvider
+from dialogs.apod.service.apod_date_index import ApodDateIndex, DatePool
+from tests.moks import BotMock
+from tests.utils.factories.dialog_manager_factory import DialogManagerFactory
+
+
+class TestDateIndex:
+    def test_date_pool_add_remove_choice(self) -> None:
+        pool = DatePool()
+
+        for day in range(1, 6):
+            pool.add(date(2020, 1, day))
+
+        pool.add(date(2020, 1, 1))
+        pool.remove(date(2020, 1, 2))
+        pool.remove(date(2020, 1, 5))
+        pool.remove(date(2021, 1, 1))
+
+        assert len(pool) == 3
+        assert date(2020, 1, 2) not in pool
+        assert {pool.choice() for _ in range(100)} == {date(2020, 1, 1), date(2020, 1, 3), date(2020, 1, 4)}
+
+    def test_random_date_prefers_uploaded_media(self) -> None:
+        index = ApodDateIndex(uploaded_ratio=1)
+
+        assert index.random_date() is None
+
+        index.add(date(2020, 1, 1), is_uploaded=False)
+        index.add(date(2020, 1, 2), is_uploaded=False)
+
+        assert index.random_date() in {date(2020, 1, 1), date(2020, 1, 2)}
+
+        index.mark_uploaded(date(2020, 1, 2))
+
+        assert len(index) == 2
+        assert {index.random_date() for _ in range(50)} == {date(2020, 1, 2)}
+
+    def test_random_date_needs_archive_coverage(self) -> None:
+        first_date = date.today() - timedelta(days=9)
+        index = ApodDateIndex(uploaded_ratio=1, min_coverage=0.5)
+
+        with patch("dialogs.apod.service.apod_date_index.APOD_FIRST_DATE", first_date):
+            for day in range(4):
+                index.add(first_date + timedelta(days=day), is_uploaded=True)
+
+            assert index.get_coverage() == 0.4
+            assert index.random_date() is None
+
+            index.add(first_date + timedelta(days=4), is_uploaded=False)
+
+            assert index.random_date() is not None
+
+    def test_random_date_skips_postponed_media(self) -> None:
+        index = ApodDateIndex(uploaded_ratio=0)
+        index.add(date(2020, 1, 1), is_uploaded=False)
+        index.add(date(2020, 1, 2), is_uploaded=False)
+        index.postpone(date(2020, 1, 1), int(time.time()) + 3600)
+
+        assert {index.random_date() for _ in range(50)} == {date(2020, 1, 2)}
+
+        index.postpone(date(2020, 1, 2), int(time.time()) + 3600)
+
+        assert index.random_date() is None
+
+        index.postpone(date(2020, 1, 1), int(time.time()) - 1)
+
+        assert len(index) == 2
+        assert {index.random_date() for _ in range(50)} == {date(2020, 1, 1)}
+
+        index.mark_uploaded(date(2020, 1, 2))
+
+        assert not index.is_postponed(date(2020, 1, 2))
+
+    @pytest.mark.asyncio
+    async def test_load_from_database(self) -> None:
+        for day, file_id, media_retry_at in ((1, None, None), (2, "file", None), (3, None, int(time.time()) + 3600)):
+            await ApodModel.create(
+                date=date(2020, 1, day),
+                title="Title",
+                explanation="Explanation",
+                url="https://apod.nasa.gov/fake.jpg",
+                media_type="image",
+                file_id=file_id,
+                media_retry_at=media_retry_at,
+            )
+
+        index = ApodDateIndex(uploaded_ratio=0)
+        await index.load()
+
+        assert len(index) == 3
+        assert index.is_postponed(date(2020, 1, 3))
+        assert {index.random_date() for _ in range(50)} == {date(2020, 1, 1)}
+
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    @pytest.mark.asyncio
+    async def test_random_apod_is_served_from_index(
+        self, mock_get: AsyncMock, bot_mock: BotMock, translator_hub: TranslatorHub
+    ) -> None:
+        await ApodModel.create(
+            date=date(2020, 1, 2),
+            title="Title",
+            explanation="Explanation",
+            url="https://apod.nasa.gov/fake.jpg",
+            media_type="image",
+            file_id="file",
+        )
+        index = ApodDateIndex(uploaded_ratio=1)
+        await index.load()
+
+        with patch("dialogs.apod.getters.apod_menu.apod_date_index", index):
+            result = await ApodProvider()(
+                cast(DialogManager, DialogManagerFactory({"is_random": True}).dialog_manager),
+                i18n=translator_hub.get_translator_by_locale("en"),
+                language_code="en",
+                bot=bot_mock,
+                event_from_user=User(id=123456789, first_name="Name", is_bot=False),
+            )
+
+        mock_get.assert_not_awaited()
+        assert result["resources"].file_id.file_id == "file"
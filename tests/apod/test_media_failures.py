@@ -0,0 +1,117 @@
+import asyncio
+import time
+from datetime import date
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiogram.types import User
+from aiogram_dialog import DialogManager
+from fluentogram import TranslatorHub
+from yt_dlp import DownloadError
+
+from config import app_settings
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.getters.apod_menu import ApodProvider
+from dialogs.apod.service.media_failures import media_failures
+from tests.moks import BotMock
+from tests.utils.factories.dialog_manager_factory import DialogManagerFactory
+
+APOD_JSON = {
+    "date": "2025-05-10",
+    "title": "Test title",
+    "explanation": "Test explanation",
+    "media_type": "video",
+    "url": "https://www.youtube.com/embed/unavailable",
+}
+
+
+class TestMediaFailures:
+    @staticmethod
+    async def _render(provider: ApodProvider, bot_mock: BotMock, translator_hub: TranslatorHub) -> dict[str, Any]:
+        return await provider(
+            cast(DialogManager, DialogManagerFactory({"apod_date": APOD_JSON["date"]}).dialog_manager),
+            i18n=translator_hub.get_translator_by_locale("en"),
+            language_code="en",
+            bot=bot_mock,
+            event_from_user=User(id=123456789, first_name="Name", is_bot=False),
+        )
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.VideoDownloader.download")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_failed_media_is_not_fetched_until_retry_time(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_download: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        mock_get.return_value = APOD_JSON
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+        mock_download.side_effect = DownloadError("ERROR: Video unavailable")
+        provider = ApodProvider()
+
+        result = await self._render(provider, bot_mock, translator_hub)
+        apod = await ApodModel.get(date=APOD_JSON["date"])
+
+        assert "media_not_exist_message" in result
+        assert apod.media_error == "ERROR: Video unavailable"
+        assert apod.media_failures == 1
+        assert apod.media_retry_at == pytest.approx(time.time() + app_settings.media_failure_ttl, abs=5)
+
+        started = time.perf_counter()
+        result = await self._render(provider, bot_mock, translator_hub)
+
+        assert time.perf_counter() - started < 0.1
+        assert "media_not_exist_message" in result
+        mock_download.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.VideoDownloader.download")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_retry_backs_off_exponentially(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_download: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        mock_get.return_value = APOD_JSON
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+        mock_download.side_effect = DownloadError("ERROR: Video unavailable")
+        provider = ApodProvider()
+
+        await self._render(provider, bot_mock, translator_hub)
+        await ApodModel.filter(date=APOD_JSON["date"]).update(media_retry_at=int(time.time()) - 1)
+        await self._render(provider, bot_mock, translator_hub)
+
+        apod = await ApodModel.get(date=APOD_JSON["date"])
+
+        assert mock_download.await_count == 2
+        assert apod.media_failures == 2
+        assert apod.media_retry_at == pytest.approx(time.time() + 2 * app_settings.media_failure_ttl, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_are_all_counted(self) -> None:
+        await ApodModel.create(
+            date=date.fromisoformat(APOD_JSON["date"]),
+            title=APOD_JSON["title"],
+            explanation=APOD_JSON["explanation"],
+            url=APOD_JSON["url"],
+            media_type=APOD_JSON["media_type"],
+        )
+
+        await asyncio.gather(
+            *(media_failures.record(date.fromisoformat(APOD_JSON["date"]), "Timeout") for _ in range(3))
+        )
+
+        apod = await ApodModel.get(date=APOD_JSON["date"])
+        ttl = min(4 * app_settings.media_failure_ttl, app_settings.media_failure_max_ttl)
+
+        assert apod.media_failures == 3
+        assert apod.media_retry_at == pytest.approx(time.time() + ttl, abs=5)
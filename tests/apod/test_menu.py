@@ -1,3 +1,5 @@
+import asyncio
+import time
 from collections import namedtuple
 from collections.abc import AsyncGenerator
 from datetime import date, datetime
@@ -45,10 +47,10 @@ class TestMenu:
         mock_get.return_value = response_data
         mock_translate.return_value = translate_return_value
 
-        dialog_manager_factory = DialogManagerFactory(dialog_data)
+        dialog_manager = DialogManagerFactory(dialog_data).dialog_manager
 
         result = await ApodProvider()(
-            cast(DialogManager, dialog_manager_factory.dialog_manager),
+            cast(DialogManager, dialog_manager),
             i18n=translator_hub.get_translator_by_locale(language_code),
             language_code=language_code,
             bot=bot_mock,
@@ -56,6 +58,7 @@ class TestMenu:
         )
         texts = self._texts_to_language_code[language_code]
 
+        assert dialog_manager.dialog_data["shown_apod_date"] == response_data["date"]
         assert result["apod_caption"] == apod_caption
         assert result["apod_id"] == 1
         assert result["explanation_button_text"] == texts.explanation_button_text
@@ -401,6 +404,87 @@ class TestMenu:
 
         assert result["resources"].file_id.file_id == "abc123"
 
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.explanation_pages.write", side_effect=OSError("No space left on device"))
+    @patch("dialogs.apod.getters.apod_menu.app_settings.enable_explanation_pages", True)
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_apod_provider_renders_when_explanation_pages_fail(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_write: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        mock_get.return_value = {
+            "date": "2025-05-05",
+            "title": "Test title",
+            "explanation": "Test explanation",
+            "media_type": "image",
+            "url": "https://api.nasa.gov/fake.jpg",
+        }
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+
+        result = await ApodProvider()(
+            cast(DialogManager, DialogManagerFactory({"apod_date": "2025-05-05", "is_random": False}).dialog_manager),
+            i18n=translator_hub.get_translator_by_locale("en"),
+            language_code="en",
+            bot=bot_mock,
+            event_from_user=User(id=123456789, first_name="Name", is_bot=False),
+        )
+
+        mock_write.assert_awaited_once()
+        assert isinstance(result["resources"], MediaAttachment)
+        assert await ApodModel.filter(date="2025-05-05").exists()
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_apod_provider_coalesces_concurrent_cache_misses(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        bot_mock: BotMock,
+        init_db: AsyncGenerator[None, Any],
+        translator_hub: TranslatorHub,
+    ) -> None:
+        async def slow_get_json(**_: Any) -> dict[str, str]:
+            await asyncio.sleep(0.05)
+
+            return {
+                "date": "2025-05-07",
+                "title": "Test title",
+                "explanation": "Test explanation",
+                "media_type": "image",
+                "url": "https://api.nasa.gov/fake.jpg",
+            }
+
+        mock_get.side_effect = slow_get_json
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+
+        middleware_data = {
+            "i18n": translator_hub.get_translator_by_locale("en"),
+            "language_code": "en",
+            "bot": bot_mock,
+            "event_from_user": User(id=123456789, first_name="Name", is_bot=False),
+        }
+
+        results = await asyncio.gather(
+            *(
+                ApodProvider()(
+                    cast(DialogManager, DialogManagerFactory({"apod_date": "2025-05-07"}).dialog_manager),
+                    **middleware_data,
+                )
+                for _ in range(10)
+            )
+        )
+
+        assert mock_get.await_count == 1
+        assert mock_translate.await_count == 1
+        assert await ApodModel.filter(date="2025-05-07").count() == 1
+        assert all(isinstance(result["resources"], MediaAttachment) for result in results)
+
     @pytest.mark.asyncio
     async def test_get_apod_url(self) -> None:
         url_parts = ApodProvider._ApodProvider__apod_url_parts  # type: ignore[attr-defined]
@@ -424,3 +508,51 @@ class TestMenu:
             f"https://api.nasa.gov/{url_parts[0]}/{url_parts[1]}?api_key={app_settings.api.nasa_api_key}&date=2024-06-26"
         )
         assert url == expected_url
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.VideoDownloader.download")
+    @patch("dialogs.apod.service.apod_other_media_resolver.HttpClient.get_text")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_apod_provider_downloads_media_while_translating(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_get_text: AsyncMock,
+        mock_download: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        async def slow_translate(**_: Any) -> dict[str, list[dict[str, str]]]:
+            await asyncio.sleep(0.2)
+            return {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+
+        async def slow_download(url: str) -> str:
+            await asyncio.sleep(0.2)
+            return "tests/static/test_video.mp4"
+
+        mock_get.return_value = {
+            "date": "2025-05-08",
+            "title": "Test title",
+            "explanation": "Test explanation",
+            "media_type": "other",
+            "url": "https://apod.nasa.gov/apod/ap250508.html",
+        }
+        mock_translate.side_effect = slow_translate
+        mock_get_text.return_value = '<video><source src="video.mp4" type="video/mp4"></video>'
+        mock_download.side_effect = slow_download
+
+        started = time.perf_counter()
+        result = await ApodProvider()(
+            cast(DialogManager, DialogManagerFactory({"apod_date": "2025-05-08"}).dialog_manager),
+            i18n=translator_hub.get_translator_by_locale("en"),
+            language_code="en",
+            bot=bot_mock,
+            event_from_user=User(id=123456789, first_name="Name", is_bot=False),
+        )
+        elapsed = time.perf_counter() - started
+
+        mock_download.assert_awaited_once_with(f"{app_settings.api.nasa_apod_base_url}/video.mp4")
+        assert result["resources"].path == "tests/static/test_video.mp4"
+        assert (await ApodModel.get(date="2025-05-08")).media_type == "video"
+        assert elapsed < 0.35
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiogram.methods import SendPhoto, TelegramMethod
+from aiogram.types import Chat, Message, PhotoSize
+
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.service.apod_date_index import ApodDateIndex
+from dialogs.apod.service.apod_prefetcher import ApodPrefetcher
+from tests.moks import BotMock
+
+RESPONSE_DATA = {
+    "date": "2025-05-05",
+    "title": "Title",
+    "explanation": "Explanation",
+    "media_type": "image",
+    "url": "https://apod.nasa.gov/fake.jpg",
+    "service_version": "v1",
+}
+TRANSLATE_RETURN_VALUE = {"translations": [{"text": "Заголовок"}, {"text": "Описание"}]}
+
+
+class TestPrefetcher:
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    @pytest.mark.asyncio
+    async def test_prefetch_uploads_media(
+        self, mock_get: AsyncMock, mock_translate: AsyncMock, bot_mock: BotMock
+    ) -> None:
+        mock_get.return_value = RESPONSE_DATA
+        mock_translate.return_value = TRANSLATE_RETURN_VALUE
+        bot_mock.add_result_for(
+            SendPhoto,
+            ok=True,
+            result=Message(
+                message_id=1,
+                date=datetime.now(),
+                chat=Chat(id=-100, type="channel"),
+                photo=[
+                    PhotoSize(file_id="small", file_unique_id="small", width=90, height=90),
+                    PhotoSize(file_id="large", file_unique_id="large", width=900, height=900),
+                ],
+            ),
+        )
+        index = ApodDateIndex(uploaded_ratio=1)
+
+        with patch("dialogs.apod.service.apod_prefetcher.apod_date_index", index):
+            is_ready = await ApodPrefetcher(bot_mock, poll_interval=1, storage_chat_id=-100).prefetch(date(2025, 5, 5))
+
+        request: TelegramMethod[Any] = bot_mock.get_request()
+
+        assert is_ready
+        assert isinstance(request, SendPhoto)
+        assert request.chat_id == -100
+        assert (await ApodModel.get(date="2025-05-05")).file_id == "large"
+        assert index.random_date() == date(2025, 5, 5)
+
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    @pytest.mark.asyncio
+    async def test_prefetch_waits_for_publication(
+        self, mock_get: AsyncMock, mock_translate: AsyncMock, bot_mock: BotMock
+    ) -> None:
+        mock_get.return_value = RESPONSE_DATA
+        mock_translate.return_value = TRANSLATE_RETURN_VALUE
+
+        is_ready = await ApodPrefetcher(bot_mock, poll_interval=1, storage_chat_id=-100).prefetch(date(2025, 5, 6))
+
+        assert not is_ready
+        assert (await ApodModel.get(date="2025-05-05")).file_id is None
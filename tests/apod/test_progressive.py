@@ -0,0 +1,174 @@
+import asyncio
+import time
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.types import Update, User
+from aiogram_dialog import DialogManager
+from fluentogram import TranslatorHub
+
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.getters.apod_menu import ApodProvider
+from dialogs.apod.service.apod_media_jobs import apod_media_jobs
+from tests.moks import BotMock
+from tests.utils.factories.dialog_manager_factory import DialogManagerFactory
+from utils.middlewares.media_job_cancellation import MediaJobCancellationMiddleware
+
+APOD_JSON = {
+    "date": "2025-05-09",
+    "title": "Test title",
+    "explanation": "Test explanation",
+    "media_type": "video",
+    "url": "https://www.youtube.com/embed/rQcKIN9vj3U?rel=0",
+}
+USER = User(id=123456789, first_name="Name", is_bot=False)
+
+
+class TestProgressiveRendering:
+    @staticmethod
+    async def _render(provider: ApodProvider, dialog_manager: MagicMock, translator_hub: TranslatorHub) -> Any:
+        dialog_manager.dialog_data = {"apod_date": APOD_JSON["date"]}
+
+        return await provider(
+            cast(DialogManager, dialog_manager),
+            i18n=translator_hub.get_translator_by_locale("en"),
+            language_code="en",
+            bot=MagicMock(),
+            event_from_user=USER,
+        )
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.app_settings.enable_progressive_rendering", True)
+    @patch("dialogs.apod.service.apod_media_jobs.VideoDownloader.download")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_caption_is_shown_before_video_is_ready(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_download: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        download_released = asyncio.Event()
+        rerendered = asyncio.Event()
+
+        async def slow_download(url: str) -> str:
+            await download_released.wait()
+            return "tests/static/test_video.mp4"
+
+        mock_get.return_value = APOD_JSON
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+        mock_download.side_effect = slow_download
+
+        provider = ApodProvider()
+        dialog_manager = DialogManagerFactory({}).dialog_manager
+        dialog_manager.bg.return_value.update = AsyncMock(side_effect=lambda *_: rerendered.set())
+
+        started = time.perf_counter()
+        result = await self._render(provider, dialog_manager, translator_hub)
+
+        assert time.perf_counter() - started < 0.5
+        assert result["apod_caption"] == "Date: *\u20682025-05-09\u2069*\n\n\u2068Test title\u2069"
+        assert apod_media_jobs.is_placeholder(result["resources"])
+        assert (await ApodModel.get(date=APOD_JSON["date"])).file_id is None
+
+        download_released.set()
+        await asyncio.wait_for(rerendered.wait(), 1)
+        dialog_manager.bg.return_value.update.assert_awaited_once_with({"apod_date": APOD_JSON["date"]})
+
+        result = await self._render(provider, dialog_manager, translator_hub)
+
+        assert result["resources"].path == "tests/static/test_video.mp4"
+        mock_get.assert_awaited_once()
+        mock_download.assert_awaited_once_with(APOD_JSON["url"])
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.getters.apod_menu.app_settings.enable_progressive_rendering", True)
+    @patch("dialogs.apod.service.apod_media_jobs.VideoDownloader.download")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.translate")
+    @patch("dialogs.apod.getters.apod_menu.HttpClient.get_json")
+    async def test_job_is_cancelled_when_user_navigates_away(
+        self,
+        mock_get: AsyncMock,
+        mock_translate: AsyncMock,
+        mock_download: AsyncMock,
+        bot_mock: BotMock,
+        translator_hub: TranslatorHub,
+    ) -> None:
+        download_started = asyncio.Event()
+        download_cancelled = asyncio.Event()
+
+        async def endless_download(url: str) -> str:
+            download_started.set()
+
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                download_cancelled.set()
+                raise
+
+            return "tests/static/test_video.mp4"
+
+        mock_get.return_value = APOD_JSON
+        mock_translate.return_value = {"translations": [{"text": "Тестовый заголовок"}, {"text": "Тестовое пояснение"}]}
+        mock_download.side_effect = endless_download
+
+        dialog_manager = DialogManagerFactory({}).dialog_manager
+        dialog_manager.bg.return_value.update = AsyncMock()
+
+        await self._render(ApodProvider(), dialog_manager, translator_hub)
+        await asyncio.wait_for(download_started.wait(), 1)
+
+        handler = AsyncMock()
+        await MediaJobCancellationMiddleware()(handler, Update(update_id=1), {"event_from_user": USER})
+
+        await asyncio.wait_for(download_cancelled.wait(), 1)
+        handler.assert_awaited_once()
+        assert not apod_media_jobs.is_running(USER.id, APOD_JSON["date"])
+        dialog_manager.bg.return_value.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("dialogs.apod.service.apod_media_jobs.VideoDownloader.download")
+    async def test_users_share_the_download_of_a_date(self, mock_download: AsyncMock) -> None:
+        download_released = asyncio.Event()
+        download_cancelled = asyncio.Event()
+
+        async def slow_download(url: str) -> str:
+            try:
+                await download_released.wait()
+            except asyncio.CancelledError:
+                download_cancelled.set()
+                raise
+
+            return "tests/static/test_video.mp4"
+
+        mock_download.side_effect = slow_download
+        rerendered = asyncio.Semaphore(0)
+        managers = {
+            user_id: MagicMock(update=AsyncMock(side_effect=lambda *_: rerendered.release())) for user_id in (1, 2, 3)
+        }
+
+        for user_id, bg_manager in managers.items():
+            apod_media_jobs.start(user_id, APOD_JSON["date"], APOD_JSON["url"], bg_manager)
+
+        await asyncio.sleep(0)
+        apod_media_jobs.cancel(3)
+        await asyncio.sleep(0)
+
+        assert not download_cancelled.is_set()
+
+        download_released.set()
+
+        for _ in (1, 2):
+            await asyncio.wait_for(rerendered.acquire(), 1)
+
+        mock_download.assert_awaited_once_with(APOD_JSON["url"])
+        managers[3].update.assert_not_awaited()
+
+        for user_id in (1, 2):
+            managers[user_id].update.assert_awaited_once_with({"apod_date": APOD_JSON["date"]})
+            media = apod_media_jobs.pop_result(user_id, APOD_JSON["date"])
+
+            assert media is not None and media.path == "tests/static/test_video.mp4"
@@ -0,0 +1,147 @@
+import asyncio
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from config import app_settings
+from dialogs.apod.service.video_cache import VideoCache
+from dialogs.apod.service.video_downloader import VideoDownloader
+
+
+class TestVideoCache:
+    @staticmethod
+    def _make_video(directory: Path, name: str, size: int) -> str:
+        path = directory / name
+        path.write_bytes(b"0" * size)
+        return str(path)
+
+    @pytest.mark.asyncio
+    async def test_index_survives_restart(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache"
+        cache = VideoCache(cache_path, max_bytes=1000)
+
+        cached = await cache.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+        (cache_path / ".leftover.tmp").write_bytes(b"partial")
+
+        assert not (tmp_path / "a.mp4").exists()
+        assert await cache.get("https://example.com/a", "other-profile") is None
+
+        restarted = VideoCache(cache_path, max_bytes=1000)
+
+        assert await restarted.get("https://example.com/a", "profile") == cached
+        assert restarted.size == 100
+        assert not (cache_path / ".leftover.tmp").exists()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_videos_are_evicted(self, tmp_path: Path) -> None:
+        cache = VideoCache(tmp_path / "cache", max_bytes=250)
+
+        first = await cache.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+        second = await cache.put("https://example.com/b", "profile", self._make_video(tmp_path, "b.mp4", 100))
+        cache.release(first)
+        cache.release(second)
+        cache.release(cast(str, await cache.get("https://example.com/a", "profile")))
+        await cache.put("https://example.com/c", "profile", self._make_video(tmp_path, "c.mp4", 100))
+
+        assert await cache.get("https://example.com/a", "profile") == first
+        assert await cache.get("https://example.com/b", "profile") is None
+        assert not Path(second).exists()
+        assert cache.size == 200
+
+    @pytest.mark.asyncio
+    async def test_videos_being_sent_are_not_evicted(self, tmp_path: Path) -> None:
+        cache = VideoCache(tmp_path / "cache", max_bytes=150)
+
+        first = await cache.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+        await cache.put("https://example.com/b", "profile", self._make_video(tmp_path, "b.mp4", 100))
+
+        assert Path(first).exists()
+        assert cache.size == 200
+
+        cache.release(first)
+        await cache.put("https://example.com/c", "profile", self._make_video(tmp_path, "c.mp4", 100))
+
+        assert not Path(first).exists()
+
+        expiring = VideoCache(tmp_path / "expiring", max_bytes=150, pin_ttl=0)
+        first = await expiring.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+        await expiring.put("https://example.com/b", "profile", self._make_video(tmp_path, "b.mp4", 100))
+
+        assert not Path(first).exists()
+
+    @pytest.mark.asyncio
+    async def test_shared_video_is_kept_until_every_sender_releases_it(self, tmp_path: Path) -> None:
+        cache = VideoCache(tmp_path / "cache", max_bytes=150)
+
+        first = await cache.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+
+        assert await cache.get("https://example.com/a", "profile") == first
+
+        cache.hold(first)
+        cache.release(first)
+        cache.release(first)
+        cache.release(await cache.put("https://example.com/b", "profile", self._make_video(tmp_path, "b.mp4", 100)))
+
+        assert Path(first).exists()
+
+        cache.release(first)
+        await cache.put("https://example.com/c", "profile", self._make_video(tmp_path, "c.mp4", 10))
+
+        assert not Path(first).exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_written_on_flush(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache"
+        cache = VideoCache(cache_path, max_bytes=1000)
+        await cache.put("https://example.com/a", "profile", self._make_video(tmp_path, "a.mp4", 100))
+        await cache.put("https://example.com/b", "profile", self._make_video(tmp_path, "b.mp4", 100))
+        index = (cache_path / "index.json").read_text()
+
+        await cache.get("https://example.com/a", "profile")
+
+        assert (cache_path / "index.json").read_text() == index
+
+        cache.flush()
+        restarted = VideoCache(cache_path, max_bytes=150)
+        await restarted.put("https://example.com/c", "profile", self._make_video(tmp_path, "c.mp4", 10))
+
+        assert await restarted.get("https://example.com/a", "profile") is not None
+        assert await restarted.get("https://example.com/b", "profile") is None
+
+    @patch("dialogs.apod.service.video_downloader.YoutubeDL")
+    @pytest.mark.asyncio
+    async def test_downloader_reuses_cached_video(
+        self, mock_yt_dlp: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def ydl_factory(opts: dict[str, Any]) -> MagicMock:
+            filename = opts["outtmpl"].replace("%(ext)s", "mp4")
+
+            def extract_info(*_: Any, **__: Any) -> dict[str, str]:
+                Path(filename).write_bytes(b"video")
+                return {"ext": "mp4"}
+
+            ydl = MagicMock()
+            ydl.extract_info.side_effect = extract_info
+            ydl.prepare_filename.return_value = filename
+
+            context_manager = MagicMock()
+            context_manager.__enter__.return_value = ydl
+
+            return context_manager
+
+        mock_yt_dlp.side_effect = ydl_factory
+        (tmp_path / "tmp").mkdir()
+        monkeypatch.setattr(app_settings, "temp_resources_path", str(tmp_path / "tmp"))
+        monkeypatch.setattr(VideoDownloader, "cache", VideoCache(tmp_path / "cache", max_bytes=1000))
+
+        first, concurrent = await asyncio.gather(
+            VideoDownloader.download("https://example.com/video"), VideoDownloader.download("https://example.com/video")
+        )
+        second = await VideoDownloader.download("https://example.com/video")
+
+        assert first == concurrent == second
+        assert Path(first).parent == tmp_path / "cache"
+        assert mock_yt_dlp.call_count == 1
+        assert not any((tmp_path / "tmp").iterdir())
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from yt_dlp import DownloadError
+
+from dialogs.apod.service.video_downloader import VideoDownloader
+
+
+class TestVideoDownloader:
+    @staticmethod
+    def _mock_ydl(mock_yt_dlp: MagicMock, extract_info_delay: float = 0) -> None:
+        def ydl_factory(opts: dict[str, Any]) -> MagicMock:
+            def extract_info(*_: Any, **__: Any) -> dict[str, str]:
+                time.sleep(extract_info_delay)
+                return {"ext": "mp4"}
+
+            ydl = MagicMock()
+            ydl.extract_info.side_effect = extract_info
+            ydl.prepare_filename.side_effect = lambda info: opts["outtmpl"].replace("%(ext)s", info["ext"])
+
+            context_manager = MagicMock()
+            context_manager.__enter__.return_value = ydl
+
+            return context_manager
+
+        mock_yt_dlp.side_effect = ydl_factory
+
+    @patch("dialogs.apod.service.video_downloader.YoutubeDL")
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_use_separate_paths(self, mock_yt_dlp: MagicMock) -> None:
+        self._mock_ydl(mock_yt_dlp, extract_info_delay=0.05)
+
+        filenames = await asyncio.gather(*(VideoDownloader.download(f"https://example.com/{i}") for i in range(4)))
+
+        assert len(set(filenames)) == 4
+        assert all(filename.endswith(".mp4") for filename in filenames)
+
+    @patch("dialogs.apod.service.video_downloader.YoutubeDL")
+    @pytest.mark.asyncio
+    async def test_download_does_not_block_event_loop(self, mock_yt_dlp: MagicMock) -> None:
+        self._mock_ydl(mock_yt_dlp, extract_info_delay=0.2)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await VideoDownloader.download("https://example.com/video")
+        ticker_task.cancel()
+
+        assert ticks > 5
+
+    @patch("dialogs.apod.service.video_downloader.YoutubeDL")
+    @pytest.mark.asyncio
+    async def test_download_timeout_raises_download_error(self, mock_yt_dlp: MagicMock) -> None:
+        self._mock_ydl(mock_yt_dlp, extract_info_delay=0.2)
+
+        with pytest.raises(DownloadError):
+            await VideoDownloader.download("https://example.com/video", timeout=0.01)
@@ -0,0 +1,47 @@
+from dialogs.apod.service.video_transcoder import MediaMetadata, TranscodePlan
+from utils.enums.transcode_mode import TranscodeMode
+
+SIZE_BUDGET = 45 * 1024**2
+
+
+class TestTranscodePlan:
+    def test_small_h264_aac_video_is_only_remuxed(self) -> None:
+        metadata = MediaMetadata(vcodec="avc1.64001F", acodec="mp4a.40.2", height=720, duration=60, size=20 * 1024**2)
+
+        plan = TranscodePlan.choose(metadata, SIZE_BUDGET)
+
+        assert plan.mode == TranscodeMode.REMUX
+        assert plan.get_ffmpeg_args() == ["-c", "copy", "-movflags", "+faststart"]
+
+    def test_large_h264_video_is_scaled_to_size_budget(self) -> None:
+        metadata = MediaMetadata(vcodec="h264", acodec="aac", height=1080, duration=600, size=400 * 1024**2)
+
+        plan = TranscodePlan.choose(metadata, SIZE_BUDGET)
+        args = plan.get_ffmpeg_args()
+
+        assert plan.mode == TranscodeMode.SCALE
+        assert plan.video_bitrate is not None
+        assert (plan.video_bitrate + 128) * 1000 / 8 * 600 <= SIZE_BUDGET
+        assert args[args.index("-c:a") + 1] == "copy"
+        assert "-crf" not in args
+
+    def test_other_codecs_are_fully_reencoded(self) -> None:
+        plan = TranscodePlan.choose(MediaMetadata(vcodec="vp9", acodec="opus", duration=30), SIZE_BUDGET)
+        args = plan.get_ffmpeg_args()
+
+        assert plan.mode == TranscodeMode.ENCODE
+        assert plan.video_bitrate is None
+        assert args[args.index("-crf") + 1] == "27"
+        assert args[args.index("-c:a") + 1] == "aac"
+        assert TranscodePlan.choose(MediaMetadata(), SIZE_BUDGET).mode == TranscodeMode.ENCODE
+
+    def test_ffprobe_output_is_parsed(self) -> None:
+        metadata = MediaMetadata.from_ffprobe(
+            {
+                "streams": [{"codec_type": "video", "codec_name": "h264", "height": 1080}],
+                "format": {"duration": "12.5", "size": "1048576"},
+            }
+        )
+
+        assert metadata == MediaMetadata(vcodec="h264", acodec="none", height=1080, duration=12.5, size=1048576)
+        assert TranscodePlan.choose(metadata, SIZE_BUDGET).mode == TranscodeMode.REMUX
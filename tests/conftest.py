@@ -1,5 +1,6 @@
 import sys
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
@@ -15,12 +16,14 @@ from fluent_compiler.bundle import FluentBundle
 from fluentogram import FluentTranslator, TranslatorHub
 from tortoise import Tortoise
 
+from dialogs.apod.service.video_downloader import VideoDownloader
 from main import root_handler
 from tests.moks import BotMock, SessionMock
 from tests.utils.factories.dialogs_factory import DialogsFactory
 from utils.custom_dialog_manager import CustomDialogManager
 from utils.custom_message_manager import CustomMessageManager
 from utils.middlewares.i18n import TranslatorRunnerMiddleware
+from utils.middlewares.media_job_cancellation import MediaJobCancellationMiddleware
 from utils.middlewares.user_activity_registration import UserActivityRegistrationMiddleware
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -34,6 +37,7 @@ async def init_db() -> AsyncGenerator[Any, None]:
             "models": [
                 "database.postgres.models.apod",
                 "database.postgres.models.user",
+                "database.postgres.models.translation",
             ]
         },
     )
@@ -71,6 +75,7 @@ def dispatcher() -> Dispatcher:
 
     dp.update.middleware(TranslatorRunnerMiddleware())
     dp.update.middleware(UserActivityRegistrationMiddleware())
+    dp.update.middleware(MediaJobCancellationMiddleware())
 
     dp.message.register(root_handler, CommandStart())
     dp.include_routers(
@@ -99,3 +104,13 @@ def bot_mock() -> BotMock:
 @pytest.fixture(autouse=True)
 def disable_send_chat_action(monkeypatch):
     monkeypatch.setattr("dialogs.apod.service.chat_action_sender.ChatActionSender.send_chat_action", AsyncMock())
+
+
+@pytest.fixture(autouse=True)
+def video_downloader_thread_pool(monkeypatch) -> Generator[None, None, None]:
+    monkeypatch.setattr(VideoDownloader, "executor_factory", ThreadPoolExecutor)
+    monkeypatch.setattr(VideoDownloader, "cache", None)
+
+    yield
+
+    VideoDownloader.shutdown()
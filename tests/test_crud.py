@@ -0,0 +1,127 @@
+from datetime import date
+from typing import cast
+
+import pytest
+from tortoise import Tortoise, connections
+from tortoise.contrib.pydantic import PydanticModel
+from tortoise.utils import get_schema_sql
+
+from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.read_models import ApodRecord
+from database.postgres.core.tortoise_config import READ_CONNECTION
+from database.postgres.models.apod import ApodModel
+from utils.enums.read_model import ReadModel
+
+APOD_ROW = {
+    "date": date(2025, 5, 10),
+    "title": "Test title",
+    "explanation": "Test explanation",
+    "url": "https://apod.nasa.gov/apod/image/2505/test.jpg",
+    "media_type": "image",
+}
+
+
+class TestReadModels:
+    @pytest.mark.asyncio
+    async def test_read_models_match_schema(self) -> None:
+        apod_crud = ApodCrud()
+        await apod_crud.bulk_create([APOD_ROW])
+
+        schema = await apod_crud.get(date=APOD_ROW["date"])
+        record = await apod_crud.get(date=APOD_ROW["date"], read_model=ReadModel.RECORD)
+        row = await apod_crud.get(date=APOD_ROW["date"], read_model=ReadModel.DICT)
+
+        assert isinstance(schema, PydanticModel)
+        assert isinstance(record, ApodRecord)
+        assert row == schema.model_dump()
+        assert record == ApodRecord(**schema.model_dump())
+
+        updated = await apod_crud.update(filters={"date": APOD_ROW["date"]}, read_model=ReadModel.RECORD, file_id="id")
+
+        assert isinstance(updated, ApodRecord)
+        assert updated.file_id == "id"
+
+    @pytest.mark.asyncio
+    async def test_missing_row(self) -> None:
+        apod_crud = ApodCrud()
+
+        assert await apod_crud.get(date=APOD_ROW["date"], read_model=ReadModel.RECORD) is None
+        assert await apod_crud.update(filters={"date": APOD_ROW["date"]}, read_model=ReadModel.DICT, title="") is False
+
+
+class TestUpdateWhere:
+    @pytest.mark.asyncio
+    async def test_file_id_update_is_idempotent(self) -> None:
+        apod_crud = ApodCrud()
+        await apod_crud.bulk_create([{**APOD_ROW, "media_failures": 2}])
+        filters = {"date": APOD_ROW["date"], "file_id__not": "id"}
+
+        assert await apod_crud.update_where(filters=filters, file_id="id", media_failures=0) == 1
+        assert await apod_crud.update_where(filters=filters, file_id="id", media_failures=0) == 0
+
+        apod = await ApodModel.get(date=APOD_ROW["date"])
+
+        assert apod.file_id == "id"
+        assert apod.media_failures == 0
+
+
+class TestReadConnection:
+    @pytest.mark.asyncio
+    async def test_reads_use_read_connection(self) -> None:
+        await Tortoise.close_connections()
+        await Tortoise.init(
+            config={
+                "connections": {"default": "sqlite://:memory:", READ_CONNECTION: "sqlite://:memory:"},
+                "apps": {"models": {"models": ["database.postgres.models.apod"], "default_connection": "default"}},
+            }
+        )
+        await Tortoise.generate_schemas()
+        await connections.get(READ_CONNECTION).execute_script(get_schema_sql(connections.get("default"), safe=False))
+        await ApodModel.create(**APOD_ROW, using_db=connections.get(READ_CONNECTION))
+        apod_crud = ApodCrud()
+
+        try:
+            assert await ApodModel.all().count() == 0
+            assert await apod_crud.exists(date=APOD_ROW["date"])
+            assert await apod_crud.get(date=APOD_ROW["date"], read_model=ReadModel.RECORD) is not None
+            assert await apod_crud.get_date_index() == [(APOD_ROW["date"], None, None)]
+            assert await apod_crud.update(filters={"date": APOD_ROW["date"]}, title="") is False
+            assert not await apod_crud.exists(date=APOD_ROW["date"], use_primary=True)
+            assert await apod_crud.get(date=APOD_ROW["date"], use_primary=True) is None
+            assert await apod_crud.get_many(date=[APOD_ROW["date"]], use_primary=True) == []
+        finally:
+            await connections.get(READ_CONNECTION).close()
+            connections.discard(READ_CONNECTION)
+            del connections.db_config[READ_CONNECTION]
+
+
+class TestBatchOperations:
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_get_many_and_bulk_update(self) -> None:
+        apod_crud = ApodCrud()
+        dates = [date(2025, 5, day) for day in range(1, 6)]
+        rows = [{**APOD_ROW, "date": apod_date} for apod_date in dates]
+
+        await apod_crud.bulk_upsert(rows[:3], conflict_fields=["date"], update_fields=["title"], batch_size=2)
+        await apod_crud.bulk_upsert(
+            [{**row, "title": "Updated"} for row in rows],
+            conflict_fields=["date"],
+            update_fields=["title"],
+            batch_size=2,
+        )
+
+        records = cast(
+            list[ApodRecord], await apod_crud.get_many(date=dates, read_model=ReadModel.RECORD, batch_size=2)
+        )
+
+        assert await ApodModel.all().count() == 5
+        assert sorted(record.date for record in records) == dates
+        assert {record.title for record in records} == {"Updated"}
+        assert await apod_crud.get_many(date=dates, media_type=["video"]) == []
+
+        updated = await apod_crud.bulk_update(
+            [{"id": record.id, "file_id": f"file {record.date}"} for record in records], ["file_id"], batch_size=2
+        )
+
+        assert updated == 5
+        assert await ApodModel.filter(file_id__startswith="file").count() == 5
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+import pytest
+from aiohttp.test_utils import make_mocked_request
+from tortoise import connections
+
+from config import app_settings
+from database.postgres.core.pool import CountedAsyncpgClient, CountedPool, get_pool_stats, warm_up_pools
+from database.postgres.core.tortoise_config import TORTOISE_ORM
+from web_app_api.app import database_pool_stats
+
+
+class TestDatabasePool:
+    def test_pool_settings_are_passed_to_asyncpg(self) -> None:
+        credentials = TORTOISE_ORM["connections"]["default"]["credentials"]
+
+        assert credentials["minsize"] == app_settings.db.postgres_pool_min_size
+        assert credentials["maxsize"] == app_settings.db.postgres_pool_max_size
+        assert credentials["statement_cache_size"] == app_settings.db.postgres_statement_cache_size
+        assert credentials["command_timeout"] == app_settings.db.postgres_command_timeout
+
+    @pytest.mark.asyncio
+    async def test_stats_of_open_pools(self) -> None:
+        await warm_up_pools()
+
+        assert get_pool_stats() == {}
+
+        pool = await asyncpg.create_pool("postgres://user@localhost:1/db", min_size=0, max_size=3)
+        client = connections.get("default")
+        client._pool = CountedPool(pool)  # type: ignore[attr-defined]
+
+        try:
+            assert get_pool_stats() == {
+                "default": {"size": 0, "min_size": 0, "max_size": 3, "in_use": 0, "idle": 0, "waiting": 0}
+            }
+        finally:
+            del client._pool  # type: ignore[attr-defined]
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_waiting_acquisitions_are_counted(self) -> None:
+        released = asyncio.Event()
+        connection = object()
+
+        async def acquire(*, timeout: float | None = None) -> object:
+            await released.wait()
+            return connection
+
+        pool = CountedPool(MagicMock(acquire=acquire))
+        waiters = [asyncio.create_task(pool.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        assert pool.waiting == 2
+
+        released.set()
+
+        assert await asyncio.gather(*waiters) == [connection, connection]
+        assert pool.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_postgres_connections_use_the_counted_pool(self) -> None:
+        config = TORTOISE_ORM["connections"]["default"]
+
+        assert config["engine"] == "database.postgres.core.pool"
+
+        client = CountedAsyncpgClient(connection_name="default", **config["credentials"])
+
+        with patch("tortoise.backends.asyncpg.client.asyncpg.create_pool", AsyncMock()) as mock_create_pool:
+            pool = await client.create_pool(min_size=1)
+
+        assert isinstance(pool, CountedPool)
+        assert pool.get_size is mock_create_pool.return_value.get_size
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint_requires_the_monitoring_token(self) -> None:
+        with patch("web_app_api.app.app_settings.monitoring_token", "secret"):
+            for headers in ({}, {"Authorization": "Bearer wrong"}, {"Authorization": "secret"}):
+                response = await database_pool_stats(make_mocked_request("GET", "/databasePoolStats", headers=headers))
+
+                assert response.status == 401
+
+            response = await database_pool_stats(
+                make_mocked_request("GET", "/databasePoolStats", headers={"Authorization": "Bearer secret"})
+            )
+
+        assert response.status == 200
+
+        with patch("web_app_api.app.app_settings.monitoring_token", None):
+            response = await database_pool_stats(
+                make_mocked_request("GET", "/databasePoolStats", headers={"Authorization": "Bearer None"})
+            )
+
+        assert response.status == 401
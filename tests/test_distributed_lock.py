@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import LockError, LockNotOwnedError
+
+from database.postgres.models.apod import ApodModel
+from database.redis.lock import distributed_lock
+from dialogs.apod.getters.apod_menu import ApodProvider
+
+
+class RedisMock:
+    """
+    Redis whose locks expire like real ones: a holder that is not renewed loses its lock after the timeout.
+    """
+
+    def __init__(self) -> None:
+        self.holders: dict[str, tuple[object, float]] = {}
+
+    def lock(self, name: str, timeout: float, blocking_timeout: float) -> "LockMock":
+        return LockMock(self, name, timeout, blocking_timeout)
+
+
+class LockMock:
+    def __init__(self, redis: RedisMock, name: str, timeout: float, blocking_timeout: float) -> None:
+        self.redis = redis
+        self.name = name
+        self.timeout = timeout
+        self.blocking_timeout = blocking_timeout
+
+    @staticmethod
+    def now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def owned(self) -> bool:
+        holder, expires_at = self.redis.holders.get(self.name, (None, 0.0))
+        return holder is self and expires_at > self.now()
+
+    async def acquire(self) -> bool:
+        deadline = self.now() + self.blocking_timeout
+
+        while True:
+            _, expires_at = self.redis.holders.get(self.name, (None, 0.0))
+
+            if expires_at <= self.now():
+                self.redis.holders[self.name] = (self, self.now() + self.timeout)
+                return True
+
+            if self.now() >= deadline:
+                return False
+
+            await asyncio.sleep(0.01)
+
+    async def reacquire(self) -> None:
+        if not self.owned():
+            raise LockNotOwnedError("Cannot reacquire a lock that's no longer owned")
+
+        self.redis.holders[self.name] = (self, self.now() + self.timeout)
+
+    async def release(self) -> None:
+        if not self.owned():
+            raise LockNotOwnedError("Cannot release a lock that's no longer owned")
+
+        del self.redis.holders[self.name]
+
+
+@pytest.fixture
+def redis_mock() -> Any:
+    redis = RedisMock()
+
+    with (
+        patch("database.redis.lock.redis", redis),
+        patch("database.redis.lock.app_settings.enable_distributed_locks", True),
+    ):
+        yield redis
+
+
+class TestDistributedLock:
+    @pytest.mark.asyncio
+    async def test_work_longer_than_ttl_keeps_the_lock(self, redis_mock: RedisMock) -> None:
+        async def contend() -> None:
+            await asyncio.sleep(0.2)
+
+            with pytest.raises(LockError):
+                async with distributed_lock("apod:2025-05-10", timeout=0.1, blocking_timeout=0.2):
+                    pass
+
+        async def work() -> None:
+            async with distributed_lock("apod:2025-05-10", timeout=0.1):
+                await asyncio.sleep(0.5)
+
+        await asyncio.gather(work(), contend())
+
+        assert not redis_mock.holders
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_does_not_fail_finished_work(self, redis_mock: RedisMock) -> None:
+        async with distributed_lock("apod:2025-05-10", timeout=0.3):
+            redis_mock.holders.clear()
+            await asyncio.sleep(0.15)
+
+        assert not redis_mock.holders
+
+
+class TestLockFallback:
+    @pytest.mark.asyncio
+    async def test_lock_timeout_rereads_stored_apod(self) -> None:
+        await ApodModel.create(
+            date=date(2025, 5, 10),
+            title="Test title",
+            explanation="Test explanation",
+            url="https://apod.nasa.gov/apod/image/2505/test.jpg",
+            media_type="image",
+            file_id="file-id",
+        )
+
+        @asynccontextmanager
+        async def unavailable_lock(*_args: Any, **_kwargs: Any) -> AsyncIterator[None]:
+            raise LockError("Unable to acquire lock")
+            yield
+
+        with (
+            patch("dialogs.apod.getters.apod_menu.distributed_lock", unavailable_lock),
+            patch("dialogs.apod.getters.apod_menu.HttpClient.get_json", new_callable=AsyncMock) as mock_get,
+        ):
+            apod, media = await ApodProvider().prefetch("2025-05-10")
+
+        assert apod.title == "Test title"
+        assert media is not None and media.file_id is not None
+        mock_get.assert_not_awaited()
@@ -0,0 +1,76 @@
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import BaseTestServer, TestServer
+from aiohttp.web_request import Request
+from aiohttp.web_response import Response
+
+from utils.http_client import HttpClient, SessionRegistry
+from utils.http_client.translation_cache import TranslationCache
+
+
+class TestHttpClient:
+    @staticmethod
+    async def _echo(_request: Request) -> Response:
+        return web.json_response({"ok": True})
+
+    @pytest_asyncio.fixture
+    async def server(self) -> AsyncGenerator[BaseTestServer, None]:
+        app = web.Application()
+        app.add_routes([web.get("/echo", self._echo)])
+
+        async with TestServer(app) as server:
+            yield server
+
+        await SessionRegistry.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_shared_session(self, server: BaseTestServer) -> None:
+        await SessionRegistry.start()
+        session = await SessionRegistry.get_session()
+
+        assert await HttpClient.get_json(url=str(server.make_url("/echo"))) == {"ok": True}
+        assert await HttpClient.get_text(url=str(server.make_url("/echo"))) == '{"ok": true}'
+
+        assert await SessionRegistry.get_session() is session
+        assert not session.closed
+
+    @pytest.mark.asyncio
+    async def test_session_reopens_after_close(self, server: BaseTestServer) -> None:
+        session = await SessionRegistry.get_session()
+        await SessionRegistry.close()
+
+        assert session.closed
+
+        await HttpClient.get_json(url=str(server.make_url("/echo")))
+
+        assert await SessionRegistry.get_session() is not session
+
+
+class TestTranslationCache:
+    @patch("utils.http_client.aiohttp_client.HttpClient._HttpClient__execute_translation")
+    @pytest.mark.asyncio
+    async def test_translate_sends_only_uncached_texts(self, mock_execute: AsyncMock) -> None:
+        mock_execute.return_value = {"translations": [{"text": "Первый"}]}
+        assert await HttpClient.translate(texts="First") == {"translations": [{"text": "Первый"}]}
+
+        mock_execute.return_value = {"translations": [{"text": "Второй"}]}
+        result = await HttpClient.translate(texts=["First", "Second", "First"])
+
+        assert result == {"translations": [{"text": "Первый"}, {"text": "Второй"}, {"text": "Первый"}]}
+        assert mock_execute.await_count == 2
+        assert mock_execute.await_args is not None
+        assert mock_execute.await_args.kwargs["json"]["texts"] == ["Second"]
+
+    @pytest.mark.asyncio
+    async def test_translations_survive_in_database(self) -> None:
+        await TranslationCache(maxsize=10).set_many(["Saturn"], ["Сатурн"], "en", "ru")
+        cache = TranslationCache(maxsize=10)
+
+        assert await cache.get_many(["Saturn", "Jupiter"], "en", "ru") == ["Сатурн", None]
+        assert await cache.get_many(["Saturn"], "en", "ru") == ["Сатурн"]
+        assert await cache.get_many(["Saturn"], "en", "de") == [None]
+        assert cache.stats == {"memory_hits": 1, "database_hits": 1, "misses": 2}
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import date, datetime
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+from aiogram import Router
+from aiogram.enums import ContentType
+from aiogram.methods import SendPhoto
+from aiogram.types import Message, PhotoSize
+from aiogram_dialog.api.entities import MediaAttachment, NewMessage
+from aiogram_dialog.api.protocols import DialogRegistryProtocol
+from aiogram_dialog.context.media_storage import MediaIdStorage
+from babel.dates import format_date
+
+from tests.moks import BotMock
+from tests.utils.factories.aiogram_factory import AiogramFactory
+from utils.custom_dialog_manager import CustomDialogManager
+from utils.custom_message_manager import CustomMessageManager
+
+
+class TestMessageManager:
+    def test_language_views_are_reused(self) -> None:
+        message_manager = CustomMessageManager()
+
+        assert message_manager.with_language("en") is message_manager
+        assert message_manager.with_language("ru") is message_manager.with_language("ru")
+        assert message_manager.with_language("ru").language_code == "ru"
+        assert message_manager.language_code == "en"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_keep_their_language(self, bot_mock: BotMock) -> None:
+        factory = CustomDialogManager(CustomMessageManager(), MediaIdStorage())  # type: ignore[no-untyped-call]
+        languages = ["ru" if index % 2 else "en" for index in range(20)]
+        chats = [AiogramFactory.get_chat_instance() for _ in languages]
+
+        for chat in chats:
+            bot_mock.add_result_for(
+                SendPhoto,
+                ok=True,
+                result=Message(
+                    message_id=1,
+                    date=datetime.now(),
+                    chat=chat,
+                    photo=[PhotoSize(file_id="file", file_unique_id="file", width=1, height=1)],
+                ),
+            )
+
+        managers = [
+            factory(
+                MagicMock(),
+                {"language_code": language_code},
+                cast(DialogRegistryProtocol, MagicMock()),
+                Router(),
+            )
+            for language_code in languages
+        ]
+
+        await asyncio.gather(
+            *(
+                manager.message_manager.send_media(  # type: ignore[attr-defined]
+                    bot_mock,
+                    NewMessage(
+                        chat=chat,
+                        text="2025-05-05",
+                        media=MediaAttachment(ContentType.PHOTO, url="https://apod.nasa.gov/fake.jpg"),
+                    ),
+                )
+                for manager, chat in zip(managers, chats, strict=True)
+            )
+        )
+
+        requests: list[Any] = list(bot_mock.session.requests)  # type: ignore[attr-defined]
+        captions = {request.chat_id: request.caption for request in requests}
+
+        for chat, language_code in zip(chats, languages, strict=True):
+            assert captions[chat.id] == format_date(date(2025, 5, 5), format="long", locale=language_code)
@@ -0,0 +1,37 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aerich.models import Aerich
+from tortoise import Tortoise
+
+from database.postgres.core.schema_version import MIGRATIONS_APP, check_schema_version, get_latest_migration
+
+
+class TestSchemaVersion:
+    @pytest.mark.asyncio
+    async def test_startup_requires_latest_migration(self) -> None:
+        await Tortoise.close_connections()
+        await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["aerich.models"]})
+        await Tortoise.generate_schemas()
+
+        with pytest.raises(RuntimeError):
+            await check_schema_version()
+
+        await Aerich.create(version="0_20261018120000_init.py", app=MIGRATIONS_APP, content={})
+
+        with pytest.raises(RuntimeError):
+            await check_schema_version()
+
+        await Aerich.create(version=get_latest_migration(), app=MIGRATIONS_APP, content={})
+        await check_schema_version()
+
+    def test_missing_migrations_are_reported(self, tmp_path: Path) -> None:
+        for location in (tmp_path / "absent", tmp_path):
+            (tmp_path / MIGRATIONS_APP).mkdir(exist_ok=True)
+
+            with (
+                patch("database.postgres.core.schema_version.MIGRATIONS_LOCATION", location),
+                pytest.raises(RuntimeError, match="No migrations found"),
+            ):
+                get_latest_migration()
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.stage_graph import Stage, StageGraph
+
+
+class TestStageGraph:
+    @staticmethod
+    async def _sleep(value: str, delay: float = 0.1) -> str:
+        await asyncio.sleep(delay)
+        return value
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self) -> None:
+        async def root(prefix: str) -> str:
+            return await self._sleep(f"{prefix}root")
+
+        async def left(prefix: str, root: str) -> str:
+            return await self._sleep(f"{root}-left")
+
+        async def right(prefix: str, root: str) -> str:
+            return await self._sleep(f"{root}-right")
+
+        async def join(prefix: str, left: str, right: str) -> str:
+            return f"{left}+{right}"
+
+        graph = StageGraph(
+            Stage("root", root),
+            Stage("left", left, depends_on=("root",)),
+            Stage("right", right, depends_on=("root",)),
+            Stage("join", join, depends_on=("left", "right")),
+        )
+
+        started = time.perf_counter()
+        results = await graph.run("x-")
+        elapsed = time.perf_counter() - started
+
+        assert results["join"] == "x-root-left+x-root-right"
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_cancels_other_stages(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def slow() -> None:
+            await asyncio.sleep(1)
+
+        async def other() -> None:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        graph = StageGraph(Stage("slow", slow, timeout=0.05), Stage("other", other))
+
+        with pytest.raises(TimeoutError):
+            await graph.run()
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_stage_error_is_raised(self) -> None:
+        async def failing() -> None:
+            raise ValueError("stage failed")
+
+        async def dependent(failing: None) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="stage failed"):
+            await StageGraph(Stage("failing", failing), Stage("dependent", dependent, depends_on=("failing",))).run()
+
+    def test_dependencies_must_be_listed_first(self) -> None:
+        async def stage(**_: str) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="unknown stages"):
+            StageGraph(Stage("first", stage, depends_on=("second",)), Stage("second", stage))
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph(Stage("first", stage), Stage("first", stage))
@@ -0,0 +1,64 @@
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiogram.types import User
+
+from database.postgres.models.user import UserModel
+from utils.middlewares.user_activity_registration import UserActivityRegistrationMiddleware
+from utils.user_activity_buffer import UserActivityBuffer
+
+
+class TestUserActivityBuffer:
+    @pytest.mark.asyncio
+    async def test_middleware_does_not_touch_database(self) -> None:
+        buffer = UserActivityBuffer(flush_interval=60)
+        handler = AsyncMock(return_value="handled")
+        data: dict[str, Any] = {"event_from_user": User(id=1, first_name="Name", is_bot=False, language_code="en")}
+
+        with (
+            patch("utils.middlewares.user_activity_registration.user_activity_buffer", buffer),
+            patch("database.postgres.core.CRUD.user.UserCrud.upsert_many") as mock_upsert,
+        ):
+            for _ in range(3):
+                assert await UserActivityRegistrationMiddleware()(handler, AsyncMock(), data) == "handled"
+
+        mock_upsert.assert_not_awaited()
+        assert len(buffer) == 1
+        assert await UserModel.all().count() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_creates_and_updates_users(self) -> None:
+        buffer = UserActivityBuffer(flush_interval=60)
+        buffer.register(User(id=1, first_name="First", is_bot=False, language_code="en"))
+        buffer.register(User(id=2, first_name="Second", is_bot=False, language_code="ru"))
+
+        assert await buffer.flush() == 2
+
+        buffer.register(User(id=1, first_name="Renamed", username="renamed", is_bot=False, language_code="ru"))
+        buffer.register(User(id=3, first_name="Third", is_bot=False))
+
+        assert await buffer.flush() == 2
+        assert await buffer.flush() == 0
+        assert await UserModel.all().count() == 3
+
+        user = await UserModel.get(telegram_id=1)
+
+        assert (user.first_name, user.username, user.language_code) == ("Renamed", "renamed", "ru")
+        assert (await UserModel.get(telegram_id=3)).language_code == "en"
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_records(self) -> None:
+        buffer = UserActivityBuffer(flush_interval=60)
+        buffer.register(User(id=1, first_name="First", is_bot=False, language_code="en"))
+
+        with patch("database.postgres.core.CRUD.user.UserCrud.upsert_many", side_effect=ConnectionError):
+            with pytest.raises(ConnectionError):
+                await buffer.flush()
+
+        assert len(buffer) == 1
+
+        await buffer.stop()
+
+        assert len(buffer) == 0
+        assert await UserModel.filter(telegram_id=1).exists()
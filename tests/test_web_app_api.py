@@ -0,0 +1,146 @@
+import asyncio
+import gzip
+import json
+from datetime import date
+from pathlib import Path
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from database.postgres.core.protocols import ApodProtocol
+from database.postgres.models.apod import ApodModel
+from dialogs.apod.service.explanation_pages import ExplanationPages
+from utils.explanation import compress_body
+from web_app_api.app import apod_explanation, crud
+from web_app_api.explanation_cache import ExplanationCache
+
+
+class TestApodExplanation:
+    @pytest.mark.asyncio
+    async def test_repeat_views_are_served_from_caches(self) -> None:
+        apod = await ApodModel.create(
+            date=date(2025, 5, 10),
+            title="Test title",
+            explanation="Test explanation " * 100,
+            url="https://apod.nasa.gov/apod/image/2505/test.jpg",
+            media_type="image",
+        )
+        path = f"/apodExplanation?apod_id={apod.id}&language_code=en"
+
+        with (
+            patch("web_app_api.app.explanation_cache", ExplanationCache(maxsize=8)),
+            patch.object(crud, "get", wraps=crud.get) as mock_get,
+        ):
+            response = await apod_explanation(make_mocked_request("GET", path, headers={"Accept-Encoding": "gzip"}))
+
+            assert response.status == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert "immutable" in response.headers["Cache-Control"]
+            assert json.loads(gzip.decompress(response.body))["title"] == "Test title"  # type: ignore[arg-type]
+
+            gzip_etag = response.headers["ETag"]
+            response = await apod_explanation(
+                make_mocked_request("GET", path, headers={"If-None-Match": gzip_etag, "Accept-Encoding": "gzip"})
+            )
+
+            assert gzip_etag.endswith('-gz"')
+            assert response.status == 304
+            assert response.headers["ETag"] == gzip_etag
+            assert not response.body
+
+            response = await apod_explanation(make_mocked_request("GET", path, headers={"If-None-Match": gzip_etag}))
+
+            assert response.status == 200
+            assert response.headers["ETag"] != gzip_etag
+            assert response.headers["Vary"] == "Accept-Encoding"
+            assert "Content-Encoding" not in response.headers
+            assert json.loads(response.body)["explanation"] == apod.explanation  # type: ignore[arg-type]
+            mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_translation_is_revalidated(self) -> None:
+        apod = await ApodModel.create(
+            date=date(2025, 5, 10),
+            title="Test title",
+            explanation="Test explanation",
+            url="https://apod.nasa.gov/apod/image/2505/test.jpg",
+            media_type="image",
+        )
+        path = f"/apodExplanation?apod_id={apod.id}&language_code=ru"
+        cache = ExplanationCache(maxsize=8)
+
+        with (
+            patch("web_app_api.app.explanation_cache", cache),
+            patch("web_app_api.explanation_cache.compress_body", wraps=compress_body) as mock_compress,
+        ):
+            response = await apod_explanation(make_mocked_request("GET", path))
+            etag = response.headers["ETag"]
+
+            assert response.headers["Cache-Control"] == "no-cache"
+
+            response = await apod_explanation(make_mocked_request("GET", path, headers={"If-None-Match": etag}))
+
+            assert response.status == 304
+            mock_compress.assert_called_once()
+
+            await ApodModel.filter(id=apod.id).update(title_ru="Заголовок", explanation_ru="Описание")
+            response = await apod_explanation(make_mocked_request("GET", path, headers={"If-None-Match": etag}))
+
+        assert response.status == 200
+        assert "immutable" in response.headers["Cache-Control"]
+        assert json.loads(response.body)["title"] == "Заголовок"  # type: ignore[arg-type]
+
+
+class TestExplanationPages:
+    @pytest.mark.asyncio
+    async def test_rebuild_writes_precompressed_pages(self, tmp_path: Path) -> None:
+        apods = [
+            await ApodModel.create(
+                date=date(2025, 5, day),
+                title=f"Title {day}",
+                title_ru=f"Заголовок {day}" if day == 1 else None,
+                explanation="Test explanation",
+                explanation_ru="Тестовое пояснение" if day == 1 else None,
+                url="https://apod.nasa.gov/apod/image/2505/test.jpg",
+                media_type="image",
+            )
+            for day in (1, 2, 3)
+        ]
+        pages = ExplanationPages(tmp_path)
+
+        assert await pages.rebuild(batch_size=2) == 3
+
+        for apod in apods:
+            path = pages.get_path(apod.id, "en")
+
+            with patch("web_app_api.app.explanation_cache", ExplanationCache(maxsize=8)):
+                response = await apod_explanation(
+                    make_mocked_request("GET", f"/apodExplanation?apod_id={apod.id}&language_code=en")
+                )
+
+            assert path.read_bytes() == response.body
+            assert gzip.decompress(path.with_name("en.json.gz").read_bytes()) == path.read_bytes()
+
+        assert json.loads(pages.get_path(apods[0].id, "ru").read_text())["title"] == "Заголовок 1"
+        assert not pages.get_path(apods[1].id, "ru").exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_do_not_collide(self, tmp_path: Path) -> None:
+        apod = await ApodModel.create(
+            date=date(2025, 5, 1),
+            title="Test title",
+            explanation="Test explanation " * 1000,
+            url="https://apod.nasa.gov/apod/image/2505/test.jpg",
+            media_type="image",
+        )
+        pages = ExplanationPages(tmp_path)
+
+        await asyncio.gather(*(pages.write(cast(ApodProtocol, apod)) for _ in range(8)))
+
+        path = pages.get_path(apod.id, "en")
+
+        assert json.loads(path.read_text())["explanation"] == apod.explanation
+        assert gzip.decompress(path.with_name("en.json.gz").read_bytes()) == path.read_bytes()
+        assert not list(path.parent.glob("*.tmp"))
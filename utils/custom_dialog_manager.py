@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, cast
 
 from aiogram import Router
 from aiogram_dialog import DialogManager
@@ -14,7 +14,8 @@ class CustomDialogManager(DefaultManagerFactory):
     """
     Custom dialog manager factory that injects language code into the message manager.
 
-    Extends DefaultManagerFactory to customize dialog behavior per language.
+    Extends DefaultManagerFactory to customize dialog behavior per language. Each dialog manager gets
+    the message manager view of its update's language, so updates can be processed concurrently.
     """
 
     def __init__(
@@ -32,7 +33,7 @@ class CustomDialogManager(DefaultManagerFactory):
         router: Router,
     ) -> DialogManager:
         """
-        Create a DialogManager instance with injected language-aware message manager.
+        Create a DialogManager instance with the message manager of the update's language.
 
         Args:
             event (ChatEvent): Incoming chat event.
@@ -43,12 +44,12 @@ class CustomDialogManager(DefaultManagerFactory):
         Returns:
             DialogManager: Initialized dialog manager with localization support.
         """
-        self.message_manager.language_code = data["language_code"]  # type: ignore[attr-defined]
+        message_manager = cast(CustomMessageManager, self.message_manager)
 
         return ManagerImpl(
             event=event,
             data=data,
-            message_manager=self.message_manager,
+            message_manager=message_manager.with_language(data["language_code"]),
             media_id_storage=self.media_id_storage,
             registry=registry,
             router=router,
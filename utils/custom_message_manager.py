@@ -11,6 +11,9 @@ from babel.dates import format_date
 
 from config.log_config import logger
 from database.postgres.core.CRUD.apod import ApodCrud
+from dialogs.apod.service.apod_date_index import apod_date_index
+from dialogs.apod.service.apod_media_jobs import apod_media_jobs
+from dialogs.apod.service.video_cache import video_cache
 
 _DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
 
@@ -18,26 +21,45 @@ _DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
 class CustomMessageManager(MessageManager):
     """
     Extended message manager with language support and APOD file_id tracking.
+
+    The language is fixed per instance, so concurrent updates never share it:
+    each update works with the view of its own language returned by `with_language`.
     """
 
     __language_code: str
     __apod_crud: ApodCrud = ApodCrud()
 
-    def __init__(self) -> None:
+    def __init__(self, language_code: str = "en") -> None:
         super().__init__()
-        self.__language_code = "en"
+        self.__language_code = language_code
+        self.__views: dict[str, CustomMessageManager] = {language_code: self}
 
     @property
     def language_code(self) -> str:
         return self.__language_code
 
-    @language_code.setter
-    def language_code(self, value: str) -> None:
-        self.__language_code = value
+    def with_language(self, language_code: str) -> "CustomMessageManager":
+        """
+        Get a message manager formatting messages for the given language.
+        Views are created once per language and reused by all later updates.
+
+        Args:
+            language_code (str): Language code of the update, e.g., "ru" or "en".
+
+        Returns:
+            CustomMessageManager: Message manager bound to the language.
+        """
+        view = self.__views.get(language_code)
+
+        if view is None:
+            view = self.__views[language_code] = CustomMessageManager(language_code)
+
+        return view
 
     async def __save_file_id(self, message: Message, date: datetime) -> None:
         """
-        Save file_id for the given date if it's not already stored.
+        Save file_id for the given date with a single UPDATE that skips rows already storing it,
+        resetting earlier media failures.
 
         Args:
             message (Message): Telegram message containing media.
@@ -53,8 +75,14 @@ class CustomMessageManager(MessageManager):
         else:
             file_id = getattr(message, media_content_type).file_id
 
-        if not await self.__apod_crud.exists(file_id=file_id):
-            await self.__apod_crud.update(filters={"date": date}, file_id=file_id)
+        if await self.__apod_crud.update_where(
+            filters={"date": date, "file_id__not": file_id},
+            file_id=file_id,
+            media_error=None,
+            media_failures=0,
+            media_retry_at=None,
+        ):
+            apod_date_index.mark_uploaded(date.date())
             logger.debug(f"Saved file_id for date {date.strftime('%Y-%m-%d')}")
 
     def __get_date_with_formatting_date_caption(self, text: str) -> tuple[datetime, str]:
@@ -81,7 +109,8 @@ class CustomMessageManager(MessageManager):
 
     async def send_media(self, bot: Bot, new_message: NewMessage) -> Message:
         """
-        Send a media message and store its file_id if date is detected in caption.
+        Send a media message and store its file_id if date is detected in caption and the media is not a placeholder.
+        A cached video is released for eviction once it is sent.
 
         Args:
             bot (Bot): Aiogram bot instance.
@@ -110,18 +139,22 @@ class CustomMessageManager(MessageManager):
         if new_message.text:
             date, caption = self.__get_date_with_formatting_date_caption(new_message.text)
 
-        media_message: Message = await method(
-            new_message.chat.id,
-            await self.get_media_source(new_message.media, bot),
-            message_thread_id=new_message.thread_id,
-            business_connection_id=new_message.business_connection_id,
-            caption=caption,
-            reply_markup=new_message.reply_markup,
-            parse_mode=new_message.parse_mode,
-            **new_message.media.kwargs,
-        )
+        try:
+            media_message: Message = await method(
+                new_message.chat.id,
+                await self.get_media_source(new_message.media, bot),
+                message_thread_id=new_message.thread_id,
+                business_connection_id=new_message.business_connection_id,
+                caption=caption,
+                reply_markup=new_message.reply_markup,
+                parse_mode=new_message.parse_mode,
+                **new_message.media.kwargs,
+            )
+        finally:
+            if new_message.media.path:
+                video_cache.release(str(new_message.media.path))
 
-        if date:
+        if date and not apod_media_jobs.is_placeholder(new_message.media):
             await self.__save_file_id(media_message, date)
 
         return media_message
@@ -133,7 +166,8 @@ class CustomMessageManager(MessageManager):
         old_message: OldMessage,
     ) -> Message:
         """
-        Edit a media message and update its file_id if date is present in caption.
+        Edit a media message and update its file_id if date is present in caption and the media is not a placeholder.
+        A cached video is released for eviction once it is sent.
 
         Args:
             bot (Bot): Aiogram bot instance.
@@ -166,16 +200,20 @@ class CustomMessageManager(MessageManager):
             **new_message.media.kwargs,
         )
 
-        media_message = await bot.edit_message_media(
-            message_id=old_message.message_id,
-            chat_id=old_message.chat.id,
-            media=media,
-            reply_markup=cast(InlineKeyboardMarkup, new_message.reply_markup),
-        )
+        try:
+            media_message = await bot.edit_message_media(
+                message_id=old_message.message_id,
+                chat_id=old_message.chat.id,
+                media=media,
+                reply_markup=cast(InlineKeyboardMarkup, new_message.reply_markup),
+            )
+        finally:
+            if new_message.media.path:
+                video_cache.release(str(new_message.media.path))
 
         assert isinstance(media_message, Message)
 
-        if date:
+        if date and not apod_media_jobs.is_placeholder(new_message.media):
             await self.__save_file_id(media_message, date)
 
         return media_message
@@ -3,6 +3,7 @@ from enum import Enum
 from tortoise.contrib.pydantic import pydantic_model_creator
 
 from database.postgres.models.apod import ApodModel
+from database.postgres.models.translation import TranslationModel
 from database.postgres.models.user import UserModel
 
 
@@ -13,3 +14,4 @@ class ModelSchemas(Enum):
 
     APODSchema = pydantic_model_creator(ApodModel)
     UserSchema = pydantic_model_creator(UserModel)
+    TranslationSchema = pydantic_model_creator(TranslationModel)
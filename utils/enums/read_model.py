@@ -0,0 +1,16 @@
+from enum import StrEnum
+
+
+class ReadModel(StrEnum):
+    """
+    Enumeration of shapes in which CRUD methods return rows.
+
+    Values:
+        SCHEMA: Pydantic schema built by from_tortoise_orm, for callers that need validation or serialization.
+        RECORD: Frozen slotted dataclass with the row fields, for reading attributes.
+        DICT: Plain dict of the row fields.
+    """
+
+    SCHEMA = "schema"
+    RECORD = "record"
+    DICT = "dict"
@@ -0,0 +1,16 @@
+from enum import StrEnum
+
+
+class TranscodeMode(StrEnum):
+    """
+    Enumeration of ways a downloaded video is prepared for Telegram.
+
+    Values:
+        REMUX: Streams are copied into an MP4 container, only moving the index to the front.
+        SCALE: Video is re-encoded to H.264 at most 480p high, audio is copied.
+        ENCODE: Video and audio are re-encoded to H.264 and AAC.
+    """
+
+    REMUX = "remux"
+    SCALE = "scale"
+    ENCODE = "encode"
@@ -0,0 +1,71 @@
+import gzip
+import json
+from typing import Any
+
+from database.postgres.core.protocols import ApodProtocol
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def get_explanation(apod: ApodProtocol, language_code: str) -> dict[str, str | None]:
+    """
+    Pick the APOD title and explanation in the language.
+
+    Args:
+        apod (ApodProtocol): Stored APOD entry.
+        language_code (str): "ru" for Russian, any other value for English.
+
+    Returns:
+        dict[str, str | None]: Title and explanation, None where the translation is missing.
+    """
+    if language_code == "ru":
+        return {"title": apod.title_ru, "explanation": apod.explanation_ru}
+
+    return {"title": apod.title, "explanation": apod.explanation}
+
+
+def serialize_json(payload: dict[str, Any]) -> bytes:
+    """
+    Serialize a JSON payload compactly, keeping non-ASCII characters as is.
+
+    Args:
+        payload (dict[str, Any]): Response data.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compress_body(body: bytes) -> dict[str, bytes]:
+    """
+    Compress a response body in every supported content coding.
+
+    Args:
+        body (bytes): Uncompressed response body.
+
+    Returns:
+        dict[str, bytes]: Bodies by content coding, "identity" being uncompressed; "br" only if Brotli is installed.
+    """
+    bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+
+    return bodies
+
+
+def encode_json(payload: dict[str, Any]) -> dict[str, bytes]:
+    """
+    Serialize a JSON payload and compress it in every supported content coding.
+
+    Args:
+        payload (dict[str, Any]): Response data.
+
+    Returns:
+        dict[str, bytes]: Bodies by content coding, "identity" being uncompressed; "br" only if Brotli is installed.
+    """
+    return compress_body(serialize_json(payload))
@@ -1,3 +1,4 @@
 from .aiohttp_client import HttpClient
+from .session_registry import SessionRegistry
 
-__all__ = ["HttpClient"]
+__all__ = ["HttpClient", "SessionRegistry"]
@@ -3,7 +3,9 @@ from typing import Any
 from aiohttp import ClientResponse
 
 from config import app_settings
+from config.log_config import logger
 from utils.http_client.request_executor import request_executor
+from utils.http_client.translation_cache import translation_cache
 
 
 class HttpClient:
@@ -76,12 +78,16 @@ class HttpClient:
         return await response.json()
 
     @staticmethod
-    async def __prepare_translate_request(texts: str | list[str]) -> dict[str, Any]:
+    async def __prepare_translate_request(
+        texts: list[str], source_language: str, target_language: str
+    ) -> dict[str, Any]:
         """
         Prepare request parameters for the translation API.
 
         Args:
-            texts (str | list[str]): One or more texts to translate.
+            texts (list[str]): Texts to translate.
+            source_language (str): Language code of the texts.
+            target_language (str): Language code to translate into.
 
         Returns:
             dict[str, Any]: Dictionary with URL, headers, and JSON payload.
@@ -94,21 +100,46 @@ class HttpClient:
             },
             "json": {
                 "folderId": app_settings.api.folder_id,
-                "texts": texts if isinstance(texts, list) else [texts],
-                "targetLanguageCode": "ru",
-                "sourceLanguageCode": "en",
+                "texts": texts,
+                "targetLanguageCode": target_language,
+                "sourceLanguageCode": source_language,
             },
         }
 
     @classmethod
-    async def translate(cls, *, texts: str | list[str]) -> Any:
+    async def translate(
+        cls, *, texts: str | list[str], source_language: str = "en", target_language: str = "ru"
+    ) -> Any:
         """
-        Translate text(s) from English to Russian using external API.
+        Translate text(s) using external API, English to Russian by default.
+
+        Cached translations are served from the translation cache; only the remaining
+        texts are sent to the API, and their translations are cached.
 
         Args:
             texts (str | list[str]): One or more texts to translate.
+            source_language (str): Language code of the texts.
+            target_language (str): Language code to translate into.
 
         Returns:
-            Any: API response with translated texts.
+            Any: API-shaped response with translated texts in the order of the input.
         """
-        return await cls.__execute_translation(**(await cls.__prepare_translate_request(texts)))
+        texts = texts if isinstance(texts, list) else [texts]
+        translations = await translation_cache.get_many(texts, source_language, target_language)
+        missing_texts = list(
+            dict.fromkeys(text for text, translation in zip(texts, translations) if translation is None)
+        )
+
+        if missing_texts:
+            response = await cls.__execute_translation(
+                **(await cls.__prepare_translate_request(missing_texts, source_language, target_language))
+            )
+            translated = [item["text"] for item in response["translations"]]
+            await translation_cache.set_many(missing_texts, translated, source_language, target_language)
+
+            translated_by_text = dict(zip(missing_texts, translated, strict=True))
+            translations = [translated_by_text.get(text, translation) for text, translation in zip(texts, translations)]
+
+        logger.debug(f"Translation cache stats: {translation_cache.stats}")
+
+        return {"translations": [{"text": translation} for translation in translations]}
@@ -2,10 +2,10 @@ from collections.abc import Awaitable
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
-import aiohttp
 from aiohttp import ClientResponse
 
 from config.log_config import logger
+from utils.http_client.session_registry import SessionRegistry
 
 R = TypeVar("R")
 
@@ -14,7 +14,7 @@ def request_executor(
     method: str = "GET",
 ) -> Callable[[Callable[[ClientResponse, dict[str, Any]], Awaitable[R]]], Callable[..., Awaitable[R]]]:
     """
-    Wrap an HTTP request function with aiohttp session and error handling.
+    Wrap an HTTP request function with the shared aiohttp session and error handling.
 
     Args:
         method (str): HTTP method to use (default: "GET").
@@ -31,13 +31,14 @@ def request_executor(
             if not url:
                 raise ValueError("Missing required 'url' parameter")
 
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.request(method=method.upper(), url=url, **kwargs) as response:
-                        return await func(response, *args, **kwargs)
-                except Exception as e:
-                    logger.error(e)
-                    raise
+            session = await SessionRegistry.get_session()
+
+            try:
+                async with session.request(method=method.upper(), url=url, **kwargs) as response:
+                    return await func(response, *args, **kwargs)
+            except Exception as e:
+                logger.error(e)
+                raise
 
         return wrapper
 
@@ -0,0 +1,68 @@
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from config import app_settings
+from config.log_config import logger
+
+
+class SessionRegistry:
+    """
+    Application-scoped holder of the shared aiohttp ClientSession.
+
+    A single session with a pooled TCPConnector is reused by every HttpClient call,
+    so keep-alive connections and resolved host names survive between requests.
+    The session is opened on bot startup and closed on shutdown; it is also
+    created lazily on first use for scripts and tests that skip the startup hook.
+    """
+
+    __session: ClientSession | None = None
+
+    @staticmethod
+    def __create_session() -> ClientSession:
+        """
+        Build a client session with a connector tuned from the application settings.
+
+        Returns:
+            ClientSession: New client session.
+        """
+        connector = TCPConnector(
+            limit=app_settings.http.connections_limit,
+            limit_per_host=app_settings.http.connections_limit_per_host,
+            keepalive_timeout=app_settings.http.keepalive_timeout,
+            ttl_dns_cache=app_settings.http.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+
+        return ClientSession(connector=connector, timeout=ClientTimeout(total=app_settings.http.request_timeout))
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Open the shared session if it is not opened yet.
+        """
+        if cls.__session is None or cls.__session.closed:
+            cls.__session = cls.__create_session()
+            logger.info("HTTP client session opened")
+
+    @classmethod
+    async def get_session(cls) -> ClientSession:
+        """
+        Return the shared session, opening it on first use.
+
+        Returns:
+            ClientSession: Shared client session.
+        """
+        if cls.__session is None or cls.__session.closed:
+            await cls.start()
+
+        return cls.__session  # type: ignore[return-value]
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the shared session and release pooled connections.
+        """
+        if cls.__session is not None and not cls.__session.closed:
+            await cls.__session.close()
+            logger.info("HTTP client session closed")
+
+        cls.__session = None
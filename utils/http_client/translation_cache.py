@@ -0,0 +1,102 @@
+from hashlib import sha256
+
+from cachetools import LRUCache  # type: ignore[import-untyped]
+
+from config import app_settings
+from database.postgres.core.CRUD.translation import TranslationCrud
+
+
+class TranslationCache:
+    """
+    Two-level cache of translated texts keyed by (source hash, source language, target language).
+
+    An in-process LRU answers repeated lookups without I/O; misses fall through to the
+    translations table, which survives restarts and is shared by all bot processes.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.__memory: LRUCache[tuple[str, str, str], str] = LRUCache(maxsize=maxsize)
+        self.__crud = TranslationCrud()
+
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_hash(text: str) -> str:
+        """
+        Hash the source text.
+
+        Args:
+            text (str): Source text.
+
+        Returns:
+            str: SHA-256 hex digest of the text.
+        """
+        return sha256(text.encode()).hexdigest()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Hit and miss counters since process start.
+        """
+        return {"memory_hits": self.memory_hits, "database_hits": self.database_hits, "misses": self.misses}
+
+    async def get_many(self, texts: list[str], source_language: str, target_language: str) -> list[str | None]:
+        """
+        Look up translations for the given texts.
+
+        Args:
+            texts (list[str]): Source texts.
+            source_language (str): Language code of the source texts.
+            target_language (str): Language code of the translations.
+
+        Returns:
+            list[str | None]: Translations in the order of the texts, None where nothing is cached.
+        """
+        hashes = [self.get_hash(text) for text in texts]
+        result: list[str | None] = [
+            self.__memory.get((text_hash, source_language, target_language)) for text_hash in hashes
+        ]
+        missing_hashes = [text_hash for text_hash, text in zip(hashes, result, strict=True) if text is None]
+
+        self.memory_hits += len(texts) - len(missing_hashes)
+
+        if not missing_hashes:
+            return result
+
+        stored = await self.__crud.get_texts(missing_hashes, source_language, target_language)
+
+        for index, text_hash in enumerate(hashes):
+            if result[index] is None and text_hash in stored:
+                result[index] = stored[text_hash]
+                self.__memory[(text_hash, source_language, target_language)] = stored[text_hash]
+                self.database_hits += 1
+
+        self.misses += result.count(None)
+
+        return result
+
+    async def set_many(
+        self, texts: list[str], translations: list[str], source_language: str, target_language: str
+    ) -> None:
+        """
+        Store translations for the given texts.
+
+        Args:
+            texts (list[str]): Source texts.
+            translations (list[str]): Translations in the order of the texts.
+            source_language (str): Language code of the source texts.
+            target_language (str): Language code of the translations.
+        """
+        stored: dict[str, str] = {}
+
+        for text, translation in zip(texts, translations, strict=True):
+            text_hash = self.get_hash(text)
+            stored[text_hash] = translation
+            self.__memory[(text_hash, source_language, target_language)] = translation
+
+        await self.__crud.save_texts(stored, source_language, target_language)
+
+
+translation_cache = TranslationCache(maxsize=app_settings.translation_cache_size)
@@ -0,0 +1,41 @@
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User
+from aiogram_dialog.api.entities import DialogUpdate
+
+from dialogs.apod.service.apod_media_jobs import apod_media_jobs
+
+
+class MediaJobCancellationMiddleware(BaseMiddleware):
+    """
+    Middleware that cancels the user's progressive media job when the user interacts with the bot again.
+
+    Any new message or button press means the user navigated away from the APOD being prepared.
+    Dialog updates sent by background managers, including the one the job itself sends, are skipped.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        """
+        Cancel the pending media job before handling the event.
+
+        Args:
+            handler (Callable): Next handler in the middleware chain.
+            event (TelegramObject): Incoming Telegram event.
+            data (dict[str, Any]): Contextual data for the event.
+
+        Returns:
+            Any: Result from the next handler.
+        """
+        event_from_user: User | None = data.get("event_from_user")
+
+        if event_from_user and not isinstance(event, DialogUpdate):
+            apod_media_jobs.cancel(event_from_user.id)
+
+        return await handler(event, data)
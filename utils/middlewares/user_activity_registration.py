@@ -1,21 +1,18 @@
-import time
 from collections.abc import Awaitable
 from typing import Any, Callable
 
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject, User
-from tortoise.contrib.pydantic import PydanticModel
 
-from database.postgres.core.CRUD.user import UserCrud
-
-user_crud = UserCrud()
+from utils.user_activity_buffer import user_activity_buffer
 
 
 class UserActivityRegistrationMiddleware(BaseMiddleware):
     """
     Middleware that registers or updates user activity on each incoming event.
 
-    Creates the user if not present, and updates last_activity_time.
+    The user profile and last_activity_time are put into the write-behind buffer,
+    which creates or updates the user in the database on its next flush.
     """
 
     async def __call__(
@@ -25,7 +22,7 @@ class UserActivityRegistrationMiddleware(BaseMiddleware):
         data: dict[str, Any],
     ) -> Any:
         """
-        Track and update user activity before handling the event.
+        Track user activity before handling the event.
 
         Args:
             handler (Callable): Next handler in the middleware chain.
@@ -35,19 +32,9 @@ class UserActivityRegistrationMiddleware(BaseMiddleware):
         Returns:
             Any: Result from the next handler.
         """
-        event_from_user: User = data["event_from_user"]
+        event_from_user: User | None = data.get("event_from_user")
 
         if event_from_user:
-            crud_kwargs = {
-                "telegram_id": event_from_user.id,
-                "username": event_from_user.username,
-                "first_name": event_from_user.first_name,
-                "last_name": event_from_user.last_name,
-                "language_code": event_from_user.language_code,
-                "last_activity_time": int(time.time()),
-            }
-
-            user: PydanticModel | None = await user_crud.get_or_create(**crud_kwargs)
-            await user_crud.update(filters={"id": user.id}, last_activity_time=int(time.time()))  # type: ignore[union-attr]
+            user_activity_buffer.register(event_from_user)
 
         return await handler(event, data)
@@ -0,0 +1,85 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls sharing the same key into a single execution.
+
+    The first caller for a key starts the work as a task; callers arriving while it is
+    still running await the same task instead of repeating the work. The key is released
+    as soon as the task finishes, so later calls start a fresh execution.
+    """
+
+    def __init__(self, cancel_abandoned: bool = False) -> None:
+        """
+        Args:
+            cancel_abandoned (bool): Cancel the shared execution when its last waiter is cancelled,
+                for work that is useless once nobody waits for it.
+        """
+        self.__calls: dict[str, asyncio.Task[T]] = {}
+        self.__waiters: dict[asyncio.Task[T], int] = {}
+        self.__cancel_abandoned = cancel_abandoned
+
+    @staticmethod
+    def __retrieve_exception(task: asyncio.Task[T]) -> None:
+        """
+        Mark the task exception as retrieved when every waiter has been cancelled.
+
+        Args:
+            task (asyncio.Task[T]): Finished task.
+        """
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self, key: str) -> bool:
+        """
+        Check whether an execution for the key is currently running.
+
+        Args:
+            key (str): Coalescing key.
+
+        Returns:
+            bool: True if a call with this key is in progress.
+        """
+        return key in self.__calls
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the function once per key among concurrent callers and share its result.
+
+        Cancelling one waiter does not cancel the shared execution for the others; cancelling the last one
+        cancels it only if abandoned executions are cancelled.
+
+        Args:
+            key (str): Coalescing key.
+            func (Callable[[], Awaitable[T]]): Coroutine factory performing the work.
+
+        Returns:
+            T: Result of the shared execution.
+        """
+        task = self.__calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.__calls[key] = task
+            task.add_done_callback(lambda _: self.__calls.pop(key, None))
+            task.add_done_callback(self.__retrieve_exception)
+
+        self.__waiters[task] = self.__waiters.get(task, 0) + 1
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self.__cancel_abandoned and self.__waiters[task] == 1:
+                task.cancel()
+
+            raise
+        finally:
+            self.__waiters[task] -= 1
+
+            if not self.__waiters[task]:
+                del self.__waiters[task]
@@ -0,0 +1,103 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """
+    Single step of a stage graph.
+
+    Attributes:
+        name (str): Unique stage name; dependent stages receive the result under this keyword.
+        func (Callable[..., Awaitable[Any]]): Coroutine function called with the graph arguments
+            and the results of the dependencies as keyword arguments.
+        depends_on (tuple[str, ...]): Names of the stages whose results the stage needs.
+        timeout (float | None): Seconds the stage may run, not counting the wait for its dependencies.
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    timeout: float | None = None
+
+
+class StageGraph:
+    """
+    Runs dependency-aware stages concurrently.
+
+    Every stage starts as soon as all of its dependencies are done, so independent stages overlap and
+    the total time is the longest dependency chain rather than the sum of all stages.
+    If a stage fails or times out, the remaining stages are cancelled and its exception is raised.
+    """
+
+    def __init__(self, *stages: Stage) -> None:
+        """
+        Args:
+            *stages (Stage): Stages in dependency order: a stage may depend only on stages listed before it.
+
+        Raises:
+            ValueError: If stage names repeat or a dependency is not listed before its dependent.
+        """
+        names: set[str] = set()
+
+        for stage in stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage {stage.name!r}")
+
+            unknown = set(stage.depends_on) - names
+
+            if unknown:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown stages {sorted(unknown)}")
+
+            names.add(stage.name)
+
+        self.__stages = stages
+
+    @staticmethod
+    async def __run_stage(stage: Stage, tasks: dict[str, asyncio.Task[Any]], args: tuple[Any, ...]) -> Any:
+        """
+        Wait for the stage dependencies and run the stage within its timeout.
+
+        Args:
+            stage (Stage): Stage to run.
+            tasks (dict[str, asyncio.Task[Any]]): Tasks of all stages by name.
+            args (tuple[Any, ...]): Graph arguments.
+
+        Returns:
+            Any: Result of the stage.
+        """
+        dependencies = {name: await tasks[name] for name in stage.depends_on}
+
+        async with asyncio.timeout(stage.timeout):
+            return await stage.func(*args, **dependencies)
+
+    async def run(self, *args: Any) -> dict[str, Any]:
+        """
+        Run all stages.
+
+        Args:
+            *args (Any): Arguments passed to every stage.
+
+        Returns:
+            dict[str, Any]: Results of the stages by name.
+
+        Raises:
+            Exception: The first exception raised by a stage; TimeoutError if a stage exceeded its timeout.
+        """
+        tasks: dict[str, asyncio.Task[Any]] = {}
+
+        for stage in self.__stages:
+            tasks[stage.name] = asyncio.create_task(self.__run_stage(stage, tasks, args))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
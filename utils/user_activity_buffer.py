@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import Any
+
+from aiogram.types import User
+
+from config import app_settings
+from config.log_config import logger
+from database.postgres.core.CRUD.user import UserCrud
+
+
+class UserActivityBuffer:
+    """
+    Write-behind buffer of user profiles and last activity times.
+
+    Events only overwrite the in-memory row of their user, so handling an update does no database I/O.
+    A background task periodically flushes the collected rows as one bulk upsert; the rest is flushed on stop.
+    """
+
+    __user_crud: UserCrud = UserCrud()
+
+    def __init__(self, flush_interval: float) -> None:
+        self.__flush_interval = flush_interval
+        self.__pending: dict[int, dict[str, Any]] = {}
+        self.__task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self.__pending)
+
+    def register(self, user: User) -> None:
+        """
+        Record user activity, replacing the previous not flushed record of the user.
+
+        Args:
+            user (User): Telegram user the event came from.
+        """
+        self.__pending[user.id] = {
+            "telegram_id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "language_code": user.language_code or "en",
+            "last_activity_time": int(time.time()),
+        }
+
+    async def flush(self) -> int:
+        """
+        Write all buffered records to the database.
+        If writing fails, the records are returned to the buffer unless newer ones arrived meanwhile.
+
+        Returns:
+            int: Number of flushed records.
+        """
+        if not self.__pending:
+            return 0
+
+        rows, self.__pending = self.__pending, {}
+
+        try:
+            await self.__user_crud.upsert_many(list(rows.values()))
+        except Exception:
+            self.__pending = rows | self.__pending
+            raise
+
+        return len(rows)
+
+    async def __run(self) -> None:
+        """
+        Flush the buffer every flush interval.
+        """
+        while True:
+            await asyncio.sleep(self.__flush_interval)
+
+            try:
+                flushed = await self.flush()
+            except Exception:
+                logger.exception("User activity flush failed")
+            else:
+                if flushed:
+                    logger.debug(f"User activity flushed: {flushed} users")
+
+    def start(self) -> None:
+        """
+        Start the background flush task.
+        """
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the background flush task and flush the remaining records.
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+
+            self.__task = None
+
+        await self.flush()
+
+
+user_activity_buffer = UserActivityBuffer(flush_interval=app_settings.user_activity_flush_interval)
@@ -1,19 +1,33 @@
+import hmac
 from typing import cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_request import Request
 from aiohttp.web_response import Response
 from multidict import MultiMapping
 
+from config import app_settings
 from database.postgres.core.CRUD.apod import ApodCrud
+from database.postgres.core.pool import get_pool_stats
 from database.postgres.core.protocols import ApodProtocol
+from utils.enums.read_model import ReadModel
+from utils.explanation import get_explanation, serialize_json
+from web_app_api.explanation_cache import CachedResponse, explanation_cache
 
 crud = ApodCrud()
 
+SEARCH_MAX_LIMIT = 50
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
 
 async def apod_explanation(request: Request) -> Response:
     """
     Retrieve APOD title and explanation in the specified language.
+    Responses are cached in process and by clients: they carry a strong ETag per content coding, are answered
+    with 304 when the client already has them and are compressed with the best coding the client accepts.
+    Responses missing a translation are revalidated against the database, but reuse their compressed bodies
+    until the texts change.
 
     Args:
         request (Request): Aiohttp request object containing query parameters:
@@ -22,19 +36,102 @@ async def apod_explanation(request: Request) -> Response:
              English).
 
     Returns:
-        Response: JSON with title and explanation, or 404 if not found.
+        Response: JSON with title and explanation, 304 if the client's copy is current, or 404 if not found.
     """
     query: MultiMapping[str] = request.query
 
     apod_id: str = query.get("apod_id", "")
-    language_code: str = query.get("language_code", "")
+    language_code: str = "ru" if query.get("language_code", "") == "ru" else "en"
+
+    cached = explanation_cache.get(apod_id, language_code)
+
+    if cached and cached.cache_control != REVALIDATE_CACHE_CONTROL:
+        return cached.get_web_response(request)
 
-    apod = cast(ApodProtocol | None, await crud.get(id=apod_id))
+    apod = cast(ApodProtocol | None, await crud.get(id=apod_id, read_model=ReadModel.RECORD))
 
     if not apod:
         return web.json_response({"detail": "APOD not found"}, status=404)
 
-    title = apod.title_ru if language_code == "ru" else apod.title
-    explanation = apod.explanation_ru if language_code == "ru" else apod.explanation
+    explanation = get_explanation(apod, language_code)
+
+    if None in explanation.values():
+        # The translation may still be added, so clients have to revalidate and the cached bodies are reused
+        # only while the texts they were compressed from are unchanged
+        body = serialize_json(explanation)
+
+        if cached is None or cached.etag != CachedResponse.get_body_etag(body):
+            cached = CachedResponse.from_body(body, REVALIDATE_CACHE_CONTROL)
+            explanation_cache.set(apod_id, language_code, cached)
+
+        return cached.get_web_response(request)
+
+    response = CachedResponse.from_json(explanation, f"public, max-age={app_settings.explanation_max_age}, immutable")
+    explanation_cache.set(apod_id, language_code, response)
+
+    return response.get_web_response(request)
+
+
+async def database_pool_stats(request: Request) -> Response:
+    """
+    Report usage of the database connection pools for monitoring.
+    The route is registered only if the monitoring token is configured.
+
+    Args:
+        request (Request): Aiohttp request object with the "Authorization: Bearer <monitoring token>" header.
+
+    Returns:
+        Response: JSON with size, minimum and maximum size, connections in use, idle connections and acquisitions
+            waiting for a connection of each pool, or 401 if the token is missing or wrong.
+    """
+    token = app_settings.monitoring_token
+    authorization = request.headers.get(hdrs.AUTHORIZATION, "")
+
+    if not token or not hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+        return web.json_response({"detail": "Unauthorized"}, status=401)
+
+    return web.json_response(get_pool_stats(), status=200)
+
+
+async def search(request: Request) -> Response:
+    """
+    Search APOD entries by title and explanation, most relevant first.
+    Results are paginated by keyset: the "next" object of a response holds the parameters of the next page.
+
+    Args:
+        request (Request): Aiohttp request object containing query parameters:
+            - query (str): Search query in web search syntax.
+            - language_code (str): Language code of the searched texts ("ru" for Russian, any other value defaults
+             to English).
+            - limit (str, optional): Number of results, at most 50; the configured page size by default.
+            - after_rank (str, optional), after_id (str, optional): Rank and ID of the last result of the previous
+             page.
+
+    Returns:
+        Response: JSON with the results and the next page parameters (null on the last page),
+            or 400 if the parameters are invalid.
+    """
+    query: MultiMapping[str] = request.query
+
+    try:
+        limit = min(int(query.get("limit", app_settings.search_page_size)), SEARCH_MAX_LIMIT)
+        after = (float(query["after_rank"]), int(query["after_id"])) if "after_id" in query else None
+    except (KeyError, ValueError):
+        return web.json_response({"detail": "Invalid pagination parameters"}, status=400)
+
+    if limit < 1:
+        return web.json_response({"detail": "Invalid pagination parameters"}, status=400)
+
+    hits = await crud.search(query.get("query", ""), query.get("language_code", ""), after=after, limit=limit + 1)
+    page = hits[:limit]
+    next_page = {"after_rank": page[-1].rank, "after_id": page[-1].id} if len(hits) > limit else None
 
-    return web.json_response({"title": title, "explanation": explanation}, status=200)
+    return web.json_response(
+        {
+            "results": [
+                {"id": hit.id, "date": hit.date.isoformat(), "title": hit.title, "rank": hit.rank} for hit in page
+            ],
+            "next": next_page,
+        },
+        status=200,
+    )
@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+
+from aiohttp import hdrs, web
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web_request import Request
+from cachetools import LRUCache  # type: ignore[import-untyped]
+
+from config import app_settings
+from utils.explanation import compress_body, serialize_json
+
+CODING_ETAG_SUFFIXES = {"identity": "", "gzip": "-gz", "br": "-br"}
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """
+    Serialized JSON response compressed ahead of time in every supported content coding.
+
+    Every coding is a different representation, so it is sent with its own strong entity tag:
+    the tag of the uncompressed body with a suffix of the coding.
+
+    Attributes:
+        etag (str): Strong entity tag of the uncompressed body.
+        bodies (dict[str, bytes]): Response bodies by content coding, "identity" being uncompressed.
+        cache_control (str): Value of the Cache-Control header.
+    """
+
+    etag: str
+    bodies: dict[str, bytes]
+    cache_control: str
+
+    @staticmethod
+    def get_body_etag(body: bytes) -> str:
+        """
+        Compute the entity tag of an uncompressed body.
+
+        Args:
+            body (bytes): Uncompressed response body.
+
+        Returns:
+            str: Strong entity tag, without quotes.
+        """
+        return sha256(body).hexdigest()[:32]
+
+    @classmethod
+    def from_body(cls, body: bytes, cache_control: str) -> "CachedResponse":
+        """
+        Compress a serialized JSON body.
+
+        Args:
+            body (bytes): Uncompressed response body.
+            cache_control (str): Value of the Cache-Control header.
+
+        Returns:
+            CachedResponse: Response ready to be served.
+        """
+        return cls(etag=cls.get_body_etag(body), bodies=compress_body(body), cache_control=cache_control)
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any], cache_control: str) -> "CachedResponse":
+        """
+        Serialize and compress a JSON payload.
+
+        Args:
+            payload (dict[str, Any]): Response data.
+            cache_control (str): Value of the Cache-Control header.
+
+        Returns:
+            CachedResponse: Response ready to be served.
+        """
+        return cls.from_body(serialize_json(payload), cache_control)
+
+    def get_etag(self, coding: str) -> str:
+        """
+        Get the entity tag of the body in a content coding.
+
+        Args:
+            coding (str): Content coding of the body.
+
+        Returns:
+            str: Strong entity tag, without quotes.
+        """
+        return self.etag + CODING_ETAG_SUFFIXES[coding]
+
+    @staticmethod
+    def get_accepted_codings(accept_encoding: str) -> set[str]:
+        """
+        Parse the content codings a client accepts, skipping the ones with zero quality.
+
+        Args:
+            accept_encoding (str): Value of the Accept-Encoding request header.
+
+        Returns:
+            set[str]: Accepted content codings.
+        """
+        accepted = set()
+
+        for item in accept_encoding.lower().split(","):
+            coding, *parameters = (part.strip() for part in item.split(";"))
+            quality = next((parameter[2:] for parameter in parameters if parameter.startswith("q=")), "1")
+
+            try:
+                if float(quality) > 0:
+                    accepted.add(coding)
+            except ValueError:
+                continue
+
+        return accepted
+
+    def get_content_coding(self, accept_encoding: str) -> str:
+        """
+        Choose the smallest body the client accepts.
+
+        Args:
+            accept_encoding (str): Value of the Accept-Encoding request header.
+
+        Returns:
+            str: Content coding of the body to send.
+        """
+        accepted = self.get_accepted_codings(accept_encoding)
+        candidates = [coding for coding in self.bodies if coding == "identity" or coding in accepted or "*" in accepted]
+
+        return min(candidates, key=lambda coding: len(self.bodies[coding]))
+
+    def get_web_response(self, request: Request) -> web.Response:
+        """
+        Build the HTTP response, answering 304 Not Modified if the client has the same version
+        of the body in the negotiated coding.
+
+        Args:
+            request (Request): Aiohttp request object.
+
+        Returns:
+            web.Response: Response with caching headers and the negotiated body.
+        """
+        headers = {hdrs.CACHE_CONTROL: self.cache_control, hdrs.VARY: hdrs.ACCEPT_ENCODING}
+        coding = self.get_content_coding(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        etag = self.get_etag(coding)
+
+        if any(client_etag.value in (etag, ETAG_ANY) for client_etag in request.if_none_match or ()):
+            response = web.Response(status=304, headers=headers)
+            response.etag = etag
+            return response
+
+        if coding != "identity":
+            headers[hdrs.CONTENT_ENCODING] = coding
+
+        response = web.Response(body=self.bodies[coding], content_type="application/json", headers=headers)
+        response.etag = etag
+
+        return response
+
+
+class ExplanationCache:
+    """
+    In-process LRU of WebApp explanation responses keyed by (apod_id, language code).
+
+    Stored APOD texts don't change, so a cached response is served without database work
+    or serialization until it is evicted. Responses still missing a translation are only cached
+    for their compressed bodies and are revalidated by the caller.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.__responses: LRUCache[tuple[str, str], CachedResponse] = LRUCache(maxsize=maxsize)
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Hit and miss counters since process start.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+    def get(self, apod_id: str, language_code: str) -> CachedResponse | None:
+        """
+        Look up the response for the APOD in the language.
+
+        Args:
+            apod_id (str): ID of the APOD entry.
+            language_code (str): Language code of the texts.
+
+        Returns:
+            CachedResponse | None: Cached response, or None if it is not cached.
+        """
+        response: CachedResponse | None = self.__responses.get((apod_id, language_code))
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return response
+
+    def set(self, apod_id: str, language_code: str, response: CachedResponse) -> None:
+        """
+        Store the response for the APOD in the language.
+
+        Args:
+            apod_id (str): ID of the APOD entry.
+            language_code (str): Language code of the texts.
+            response (CachedResponse): Response to cache.
+        """
+        self.__responses[(apod_id, language_code)] = response
+
+
+explanation_cache = ExplanationCache(app_settings.explanation_cache_size)